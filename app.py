@@ -1,25 +1,101 @@
-from fastapi import FastAPI, Request, Form, UploadFile, File
+from fastapi import FastAPI, Request, Form, UploadFile, File, BackgroundTasks
 from fastapi.staticfiles import StaticFiles
 from fastapi.templating import Jinja2Templates
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, StreamingResponse, PlainTextResponse
 from pydantic import BaseModel
+from typing import Optional, Callable, Dict, Any, Tuple
 import os
 import json
+import asyncio
 from datetime import datetime
 import shutil
-import smtplib
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+import uuid
+import zipfile
 
 # Import AI Agents
-from src.llm_provider import GeminiProvider
+from src.llm_provider import LLMProvider, GeminiProvider, MockProvider, CachingProvider
 from src.agents import IntakeAgent, ResumeScreenerAgent, EvaluatorAgent
+from src.cache import ScreeningCache, PromptCache
+from src.utils import prefilter_candidates
+from src.runs import ShortlistRunQueue
+from src.metrics import llm_metrics, llm_labels, track_llm_usage, start_trace, trace_span, TraceStore
+from src.storage import CandidateIndex, CandidateSnapshotStore, claim_folder, next_job_ids, encode_cursor, decode_cursor, build_candidate_filter, project_candidate
+from src.ingest import (
+    FORM_OVERHEAD_BYTES,
+    ResumeIngestor,
+    UploadRejected,
+    RequestSizeLimit,
+    ApplicationError,
+    save_upload,
+    save_pdf_upload,
+    remove_stale_uploads,
+    validate_application,
+    save_candidate_folder
+)
+from src.ingest.bulk_import import import_applications
+from src.mailer import SMTPConnectionPool, EmailDispatcher, EmailTemplate, EmailTemplateError, build_message
 
 # Email Configuration - Load from environment variables
-SMTP_SERVER = "smtp.gmail.com"
-SMTP_PORT = 587
+SMTP_SERVER = os.getenv("SMTP_SERVER", "smtp.gmail.com")
+SMTP_PORT = int(os.getenv("SMTP_PORT", "587"))
+# Upgrade connections with STARTTLS; turn off for local relays and test servers without TLS
+SMTP_USE_STARTTLS = os.getenv("SMTP_USE_STARTTLS", "true").lower() == "true"
 SMTP_EMAIL = os.getenv("SMTP_EMAIL")
 SMTP_PASSWORD = os.getenv("SMTP_PASSWORD")
+# Parallel authenticated SMTP connections reused across a bulk send
+SMTP_POOL_SIZE = int(os.getenv("SMTP_POOL_SIZE", "3"))
+# Background email delivery: attempts per recipient and base retry delay
+EMAIL_MAX_ATTEMPTS = int(os.getenv("EMAIL_MAX_ATTEMPTS", "3"))
+EMAIL_RETRY_BACKOFF_SECONDS = float(os.getenv("EMAIL_RETRY_BACKOFF_SECONDS", "2"))
+
+# Screening Configuration - Maximum concurrent Gemini calls during a shortlist run
+SCREENING_MAX_CONCURRENCY = int(os.getenv("SCREENING_MAX_CONCURRENCY", "5"))
+SCREENING_BATCH_SIZE = int(os.getenv("SCREENING_BATCH_SIZE", "1"))
+# Local pre-filter before LLM screening (0 disables the cap/threshold)
+PREFILTER_TOP_K = int(os.getenv("PREFILTER_TOP_K", "0"))
+PREFILTER_MIN_SCORE = int(os.getenv("PREFILTER_MIN_SCORE", "0"))
+# Let the evaluator ask the LLM for narrative recommendation reasons (ranking is always local)
+EVALUATOR_LLM_REASONS = os.getenv("EVALUATOR_LLM_REASONS", "false").lower() == "true"
+# Largest page /api/candidates/{job_id} will return
+MAX_CANDIDATE_PAGE_SIZE = 200
+
+# Background shortlist runs and the global cap on concurrent Gemini requests
+SHORTLIST_MAX_PARALLEL_RUNS = int(os.getenv("SHORTLIST_MAX_PARALLEL_RUNS", "2"))
+LLM_MAX_CONCURRENCY = int(os.getenv("LLM_MAX_CONCURRENCY", "8"))
+# LLM backend: "gemini", or "mock" for offline benchmarks (synthetic or recorded responses)
+LLM_PROVIDER = os.getenv("LLM_PROVIDER", "gemini").lower()
+MOCK_LLM_LATENCY_MS = float(os.getenv("MOCK_LLM_LATENCY_MS", "0"))
+MOCK_LLM_RESPONSES = os.getenv("MOCK_LLM_RESPONSES")
+# Record-and-replay of raw LLM responses: "off", "record" (read-through) or "replay" (cache only, no API calls)
+LLM_PROMPT_CACHE = os.getenv("LLM_PROMPT_CACHE", "off").lower()
+LLM_PROMPT_CACHE_DIR = os.path.join("data", ".cache", "prompts")
+LLM_PROMPT_CACHE_MAX_MB = int(os.getenv("LLM_PROMPT_CACHE_MAX_MB", "100"))
+LLM_PROMPT_CACHE_TTL_HOURS = float(os.getenv("LLM_PROMPT_CACHE_TTL_HOURS", "0"))
+# Shared Gemini rate budget across all agents (0 = unlimited)
+LLM_REQUESTS_PER_MINUTE = int(os.getenv("LLM_REQUESTS_PER_MINUTE", "0"))
+LLM_TOKENS_PER_MINUTE = int(os.getenv("LLM_TOKENS_PER_MINUTE", "0"))
+
+# Optional SQLite file persisting the candidate index across restarts
+CANDIDATE_INDEX_DB = os.getenv("CANDIDATE_INDEX_DB")
+# How often reads check job folders for jobs and candidates written by other workers or the import CLI
+CANDIDATE_INDEX_REVALIDATE_SECONDS = float(os.getenv("CANDIDATE_INDEX_REVALIDATE_SECONDS", "2"))
+# Columnar snapshot of all candidates for /api/analytics, checked against the candidate files at most this often
+CANDIDATE_SNAPSHOT_DIR = os.path.join("data", ".snapshot")
+SNAPSHOT_REBUILD_MINUTES = float(os.getenv("SNAPSHOT_REBUILD_MINUTES", "5"))
+SCREENING_CACHE_DIR = os.path.join("data", ".cache", "screening")
+SCREENING_CACHE_MAX_MB = int(os.getenv("SCREENING_CACHE_MAX_MB", "50"))
+# Largest resume upload accepted, and where uploads are assembled before being moved into place
+MAX_RESUME_UPLOAD_MB = int(os.getenv("MAX_RESUME_UPLOAD_MB", "10"))
+UPLOAD_STAGING_DIR = os.path.join("data", ".uploads")
+# Bulk application import: largest archive accepted and candidate folders written at once
+MAX_IMPORT_UPLOAD_MB = int(os.getenv("MAX_IMPORT_UPLOAD_MB", "500"))
+IMPORT_MAX_WORKERS = int(os.getenv("IMPORT_MAX_WORKERS", "8"))
+# Background threads extracting resume.pdf text into each candidate's resumeText.json
+RESUME_TEXT_WORKERS = int(os.getenv("RESUME_TEXT_WORKERS", "2"))
+# Stage timing traces of shortlist runs (Chrome trace JSON), keeping the most recent ones
+SHORTLIST_TRACING = os.getenv("SHORTLIST_TRACING", "true").lower() == "true"
+SHORTLIST_TRACES_DIR = os.path.join("data", ".traces")
+SHORTLIST_TRACES_KEEP = int(os.getenv("SHORTLIST_TRACES_KEEP", "50"))
 
 app = FastAPI()
 
@@ -40,16 +116,55 @@ def check_email_configuration():
     print("✅ Email configuration loaded successfully")
     return True
 
+def create_llm_provider() -> LLMProvider:
+    """Build the LLM backend selected by LLM_PROVIDER, wrapped in the prompt cache if enabled"""
+    if LLM_PROMPT_CACHE not in ("off", "record", "replay"):
+        raise ValueError(f"Unknown LLM_PROMPT_CACHE '{LLM_PROMPT_CACHE}' (expected 'off', 'record' or 'replay')")
+    if LLM_PROMPT_CACHE == "off":
+        return create_base_llm_provider()
+    
+    prompt_cache = PromptCache(
+        LLM_PROMPT_CACHE_DIR,
+        max_bytes=LLM_PROMPT_CACHE_MAX_MB * 1024 * 1024,
+        ttl_seconds=LLM_PROMPT_CACHE_TTL_HOURS * 3600 or None
+    )
+    if LLM_PROMPT_CACHE == "replay":
+        # Replay never calls the model, so no API key is needed
+        provider_class = MockProvider if LLM_PROVIDER == "mock" else GeminiProvider
+        return CachingProvider(None, prompt_cache, identity=provider_class.cache_identity(), replay_only=True)
+    return CachingProvider(create_base_llm_provider(), prompt_cache)
+
+def create_base_llm_provider() -> LLMProvider:
+    """Build the LLM backend selected by LLM_PROVIDER"""
+    if LLM_PROVIDER == "mock":
+        return MockProvider(responses_path=MOCK_LLM_RESPONSES, latency_ms=MOCK_LLM_LATENCY_MS)
+    if LLM_PROVIDER != "gemini":
+        raise ValueError(f"Unknown LLM_PROVIDER '{LLM_PROVIDER}' (expected 'gemini' or 'mock')")
+    
+    return GeminiProvider(
+        max_concurrent_requests=LLM_MAX_CONCURRENCY,
+        requests_per_minute=LLM_REQUESTS_PER_MINUTE or None,
+        tokens_per_minute=LLM_TOKENS_PER_MINUTE or None
+    )
+
 def initialize_agents():
-    """Initialize AI agents with Gemini API"""
+    """Initialize AI agents with the configured LLM provider"""
     global llm_provider, intake_agent, screener_agent, evaluator_agent
     
     try:
-        llm_provider = GeminiProvider()
+        llm_provider = create_llm_provider()
         intake_agent = IntakeAgent(llm_provider)
-        screener_agent = ResumeScreenerAgent(llm_provider)
-        evaluator_agent = EvaluatorAgent(llm_provider)
-        print("✅ AI Agents initialized successfully")
+        # Keep mock screenings out of the cache real runs read from
+        cache_dir = SCREENING_CACHE_DIR if LLM_PROVIDER == "gemini" else f"{SCREENING_CACHE_DIR}-{LLM_PROVIDER}"
+        screening_cache = ScreeningCache(cache_dir, max_bytes=SCREENING_CACHE_MAX_MB * 1024 * 1024)
+        screener_agent = ResumeScreenerAgent(
+            llm_provider,
+            max_concurrency=SCREENING_MAX_CONCURRENCY,
+            cache=screening_cache,
+            batch_size=SCREENING_BATCH_SIZE
+        )
+        evaluator_agent = EvaluatorAgent(llm_provider, generate_reasons=EVALUATOR_LLM_REASONS)
+        print(f"✅ AI Agents initialized successfully ({llm_provider.model_name})")
     except Exception as e:
         print(f"⚠️ Warning: Could not initialize AI agents: {str(e)}")
         print("💡 Set GEMINI_API_KEY environment variable to enable AI features")
@@ -58,53 +173,47 @@ def initialize_agents():
 initialize_agents()
 check_email_configuration()
 
-def send_email(subject: str, body: str, receiver: str) -> bool:
-    """
-    Send email using Gmail SMTP service
-    
-    Args:
-        subject: Email subject
-        body: Email body content
-        receiver: Recipient email address
-    
-    Returns:
-        bool: True if email sent successfully, False otherwise
-    """
-    # Check if email credentials are configured
-    if not SMTP_EMAIL or not SMTP_PASSWORD:
-        print("❌ Email credentials not configured. Cannot send email.")
-        return False
-    
-    try:
-        # Create message
-        msg = MIMEMultipart()
-        msg['From'] = SMTP_EMAIL
-        msg['To'] = receiver
-        msg['Subject'] = subject
-        
-        # Attach body
-        msg.attach(MIMEText(body, 'plain'))
-        
-        # Connect to server and send
-        server = smtplib.SMTP(SMTP_SERVER, SMTP_PORT)
-        server.starttls()
-        server.login(SMTP_EMAIL, SMTP_PASSWORD)
-        server.send_message(msg)
-        server.quit()
-        
-        return True
-    except Exception as e:
-        print(f"Error sending email to {receiver}: {str(e)}")
-        return False
+# Index jobs and candidates once so listing endpoints don't walk the data folder
+candidate_index = CandidateIndex(
+    "data", sqlite_path=CANDIDATE_INDEX_DB, revalidate_seconds=CANDIDATE_INDEX_REVALIDATE_SECONDS
+)
+candidate_index.load()
+candidate_snapshots = CandidateSnapshotStore(CANDIDATE_SNAPSHOT_DIR, rebuild_interval_seconds=SNAPSHOT_REBUILD_MINUTES * 60)
+
+shortlist_runs = ShortlistRunQueue("data", max_parallel_runs=SHORTLIST_MAX_PARALLEL_RUNS)
+trace_store = TraceStore(SHORTLIST_TRACES_DIR, keep=SHORTLIST_TRACES_KEEP)
+resume_ingestor = ResumeIngestor(max_workers=RESUME_TEXT_WORKERS)
+remove_stale_uploads(UPLOAD_STAGING_DIR)
+
+# Connections are opened on first send and kept for later batches
+smtp_pool = SMTPConnectionPool(
+    SMTP_SERVER, 
+    SMTP_PORT, 
+    SMTP_EMAIL, 
+    SMTP_PASSWORD, 
+    pool_size=SMTP_POOL_SIZE, 
+    use_starttls=SMTP_USE_STARTTLS
+)
+email_dispatcher = EmailDispatcher(
+    smtp_pool, 
+    "data", 
+    max_attempts=EMAIL_MAX_ATTEMPTS, 
+    backoff_seconds=EMAIL_RETRY_BACKOFF_SECONDS
+)
 
 # Request model for shortlisting
 class ShortlistRequest(BaseModel):
     job_id: str
     job_description: str
+    incremental: bool = True
+    prefilter_top_k: Optional[int] = None
+    prefilter_min_score: Optional[int] = None
+    run_in_background: bool = False
 
 # Request model for creating job
 class CreateJobRequest(BaseModel):
     job_description: str
+    precompute_requirements: bool = True
 
 # Request model for sending bulk email
 class BulkEmailRequest(BaseModel):
@@ -118,6 +227,12 @@ app = FastAPI()
 app.mount("/static", StaticFiles(directory="static"), name="static")
 app.mount("/public", StaticFiles(directory="public"), name="public")
 
+# Turn away oversized uploads before the multipart body is spooled to disk
+app.add_middleware(RequestSizeLimit, limits={
+    "/api/submit-application": MAX_RESUME_UPLOAD_MB * 1024 * 1024 + FORM_OVERHEAD_BYTES,
+    "/api/import-applications": MAX_IMPORT_UPLOAD_MB * 1024 * 1024 + FORM_OVERHEAD_BYTES
+})
+
 # Setup Jinja2 templates
 templates = Jinja2Templates(directory="templates")
 
@@ -155,34 +270,38 @@ async def health():
 async def get_jobs():
     """Get all job folders"""
     try:
-        jobs = []
-        data_dir = "data"
-        
-        if not os.path.exists(data_dir):
-            return JSONResponse(content={"jobs": [], "count": 0})
-        
-        for job_folder in os.listdir(data_dir):
-            job_path = os.path.join(data_dir, job_folder)
-            if os.path.isdir(job_path):
-                job_desc_path = os.path.join(job_path, "jobDescription.txt")
-                if os.path.exists(job_desc_path):
-                    with open(job_desc_path, 'r', encoding='utf-8') as f:
-                        description = f.read()
-                    jobs.append({
-                        "id": job_folder,
-                        "name": job_folder,
-                        "description": description
-                    })
-        
+        jobs = candidate_index.list_jobs()
         return JSONResponse(content={"jobs": jobs, "count": len(jobs)})
     except Exception as e:
         return JSONResponse(status_code=500, content={"error": str(e)})
 
+@app.post("/api/reindex")
+async def reindex():
+    """Rebuild the candidate index from the data folder (e.g. after manual file changes)"""
+    try:
+        candidate_index.rebuild()
+        return JSONResponse(content={"success": True, "jobs": len(candidate_index.list_jobs())})
+    except Exception as e:
+        return JSONResponse(status_code=500, content={"success": False, "error": str(e)})
+
+async def precompute_job_requirements(job_path: str, job_description: str):
+    """Background task: extract and store job requirements ahead of the first shortlist"""
+    if not intake_agent:
+        return
+    
+    with llm_labels(agent="intake", job_id=os.path.basename(job_path)):
+        result = await intake_agent.process_job_description_async(job_description, job_dir=job_path)
+    if result['success']:
+        print(f"✅ Precomputed job requirements for {job_path}")
+    else:
+        print(f"⚠️  Could not precompute job requirements for {job_path}: {result.get('error')}")
+
 @app.post("/api/create-job")
-async def create_job(request: CreateJobRequest):
+async def create_job(request: CreateJobRequest, background_tasks: BackgroundTasks):
     """
     Create a new job folder with job description.
-    Counts existing job folders and creates the next one (e.g., Job4, Job5, etc.)
+    Claims the next free JobN folder (e.g., Job4, Job5, etc.), safe under concurrent requests
+    Optionally extracts job requirements in the background so the first shortlist skips intake.
     """
     try:
         data_dir = "data"
@@ -191,34 +310,23 @@ async def create_job(request: CreateJobRequest):
         if not os.path.exists(data_dir):
             os.makedirs(data_dir)
         
-        # Count existing job folders
-        existing_jobs = []
-        for folder_name in os.listdir(data_dir):
-            folder_path = os.path.join(data_dir, folder_name)
-            if os.path.isdir(folder_path) and folder_name.startswith("Job"):
-                try:
-                    # Extract job number
-                    job_num = int(folder_name.replace("Job", ""))
-                    existing_jobs.append(job_num)
-                except ValueError:
-                    continue
+        # Write the job folder (jobDescription.txt, empty applications folder) in staging first
+        staging_dir = os.path.join(UPLOAD_STAGING_DIR, uuid.uuid4().hex)
+        os.makedirs(os.path.join(staging_dir, "applications"))
+        try:
+            with open(os.path.join(staging_dir, "jobDescription.txt"), 'w', encoding='utf-8') as f:
+                f.write(request.job_description)
+            
+            # Claim the next free JobN with an atomic rename (two requests can never get the same number)
+            new_job_id = claim_folder(staging_dir, data_dir, next_job_ids(data_dir))
+        finally:
+            shutil.rmtree(staging_dir, ignore_errors=True)
         
-        # Determine next job number
-        next_job_number = max(existing_jobs) + 1 if existing_jobs else 1
-        new_job_id = f"Job{next_job_number}"
         new_job_path = os.path.join(data_dir, new_job_id)
+        candidate_index.add_job(new_job_id, request.job_description)
         
-        # Create job folder
-        os.makedirs(new_job_path, exist_ok=True)
-        
-        # Create jobDescription.txt
-        job_desc_path = os.path.join(new_job_path, "jobDescription.txt")
-        with open(job_desc_path, 'w', encoding='utf-8') as f:
-            f.write(request.job_description)
-        
-        # Create empty applications folder
-        applications_path = os.path.join(new_job_path, "applications")
-        os.makedirs(applications_path, exist_ok=True)
+        if request.precompute_requirements and intake_agent:
+            background_tasks.add_task(precompute_job_requirements, new_job_path, request.job_description)
         
         return JSONResponse(content={
             "success": True,
@@ -241,6 +349,9 @@ async def submit_application(applicationData: str = Form(...), resume: UploadFil
     Submit a new candidate application with resume.
     Creates folder structure: data/JobX/applications/FirstName_LastName/
     Saves generalInformation.json and resume.pdf following candidateInterface.js
+    Requests over MAX_RESUME_UPLOAD_MB are turned away before the body is spooled (RequestSizeLimit);
+    the resume is then copied in chunks and checked to be a real PDF,
+    and the folder only appears once both files are complete.
     """
     try:
         # Parse application data
@@ -252,92 +363,45 @@ async def submit_application(applicationData: str = Form(...), resume: UploadFil
                 content={"success": False, "error": f"Invalid JSON data: {str(e)}"}
             )
         
-        # Extract jobId
-        job_id = application.get('jobId')
-        if not job_id:
-            return JSONResponse(
-                status_code=400,
-                content={"success": False, "error": "jobId is required"}
-            )
-        
-        # Validate job exists
-        job_path = os.path.join("data", job_id)
-        if not os.path.exists(job_path):
-            return JSONResponse(
-                status_code=404,
-                content={"success": False, "error": f"Job '{job_id}' not found"}
-            )
-        
         # Validate resume file
-        if not resume.filename.endswith('.pdf'):
+        if not resume.filename.lower().endswith('.pdf'):
             return JSONResponse(
                 status_code=400,
                 content={"success": False, "error": "Resume must be a PDF file"}
             )
         
-        # Extract candidate name
-        first_name = application.get('personalInfo', {}).get('firstName', '')
-        last_name = application.get('personalInfo', {}).get('lastName', '')
-        
-        if not first_name or not last_name:
-            return JSONResponse(
-                status_code=400,
-                content={"success": False, "error": "First name and last name are required"}
+        # Check jobId, job, names and required fields (candidateInterface.js) before anything is written
+        try:
+            job_id, application_to_save = validate_application(application, "data")
+        except ApplicationError as e:
+            return JSONResponse(status_code=e.status_code, content={"success": False, "error": str(e)})
+        
+        # Build the candidate folder in a private staging folder, then move it into place in one rename,
+        # so a crash or rejected upload never leaves a half-written candidate behind
+        staging_dir = os.path.join(UPLOAD_STAGING_DIR, uuid.uuid4().hex)
+        os.makedirs(staging_dir)
+        try:
+            resume_size, resume_hash = await save_pdf_upload(
+                resume, os.path.join(staging_dir, "resume.pdf"), MAX_RESUME_UPLOAD_MB * 1024 * 1024
             )
+        except UploadRejected as e:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+            return JSONResponse(status_code=e.status_code, content={"success": False, "error": str(e)})
+        except Exception:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+            raise
+        
+        candidate_folder_name, candidate_dir = save_candidate_folder(
+            staging_dir, os.path.join("data", job_id), application_to_save
+        )
+        candidate_index.add_candidate(job_id, candidate_folder_name, application_to_save)
         
-        # Create candidate folder name: FirstName_LastName
-        candidate_folder_name = f"{first_name}_{last_name}".replace(" ", "_")
-        
-        # Create applications directory if not exists
-        applications_dir = os.path.join(job_path, "applications")
-        os.makedirs(applications_dir, exist_ok=True)
-        
-        # Create candidate directory
-        candidate_dir = os.path.join(applications_dir, candidate_folder_name)
-        
-        # Handle duplicate names by adding timestamp
-        if os.path.exists(candidate_dir):
-            timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
-            candidate_folder_name = f"{first_name}_{last_name}_{timestamp}".replace(" ", "_")
-            candidate_dir = os.path.join(applications_dir, candidate_folder_name)
-        
-        os.makedirs(candidate_dir, exist_ok=True)
-        
-        # Save resume.pdf
-        resume_path = os.path.join(candidate_dir, "resume.pdf")
-        with open(resume_path, "wb") as buffer:
-            shutil.copyfileobj(resume.file, buffer)
-        
-        # Remove jobId from data before saving (not part of interface)
-        application_to_save = {k: v for k, v in application.items() if k != 'jobId'}
-        
-        # Validate and ensure data follows candidateInterface.js structure
-        required_fields = ['personalInfo', 'education', 'experience', 'skills', 'targetRole', 
-                          'applicationDate', 'status', 'yearsOfExperience']
-        
-        for field in required_fields:
-            if field not in application_to_save:
-                return JSONResponse(
-                    status_code=400,
-                    content={"success": False, "error": f"Missing required field: {field}"}
-                )
-        
-        # Ensure skills has correct structure
-        if 'skills' in application_to_save:
-            skills = application_to_save['skills']
-            required_skill_fields = ['programming', 'frameworks', 'tools', 'cloud', 'databases', 'testing']
-            for skill_field in required_skill_fields:
-                if skill_field not in skills:
-                    skills[skill_field] = []
-        
-        # Save generalInformation.json
-        json_file_path = os.path.join(candidate_dir, "generalInformation.json")
-        with open(json_file_path, 'w', encoding='utf-8') as f:
-            json.dump(application_to_save, f, indent=2, ensure_ascii=False)
+        # Extract the resume text in the background so the upload returns right away
+        resume_ingestor.submit(candidate_dir, pdf_hash=resume_hash)
         
         print(f"✅ Application saved: {candidate_folder_name} for {job_id}")
         print(f"   📁 Folder: {candidate_dir}")
-        print(f"   📄 Resume: resume.pdf")
+        print(f"   📄 Resume: resume.pdf ({resume_size // 1024} KB)")
         print(f"   📄 Data: generalInformation.json")
         
         return JSONResponse(content={
@@ -360,35 +424,104 @@ async def submit_application(applicationData: str = Form(...), resume: UploadFil
             }
         )
 
+@app.post("/api/import-applications")
+async def import_applications_archive(archive: UploadFile = File(...), jobId: Optional[str] = Form(None)):
+    """
+    Import many applications at once, e.g. from an ATS export
+    
+    archive is an NDJSON file (one submit-application JSON per line) or a zip
+    with an applications.ndjson manifest whose records name their PDF in
+    resumeFile. Records are validated like /api/submit-application; jobId is
+    the default for records without one. Returns a per-record report.
+    """
+    file_name = (archive.filename or '').lower()
+    if not file_name.endswith(('.zip', '.ndjson', '.jsonl')):
+        return JSONResponse(
+            status_code=400,
+            content={"success": False, "error": "Archive must be a .zip, .ndjson or .jsonl file"}
+        )
+    
+    os.makedirs(UPLOAD_STAGING_DIR, exist_ok=True)
+    archive_path = os.path.join(UPLOAD_STAGING_DIR, f"{uuid.uuid4().hex}{os.path.splitext(file_name)[1]}")
+    try:
+        await save_upload(archive, archive_path, MAX_IMPORT_UPLOAD_MB * 1024 * 1024, label="Archive")
+        report = await asyncio.to_thread(
+            import_applications,
+            archive_path,
+            data_dir="data",
+            staging_root=UPLOAD_STAGING_DIR,
+            default_job_id=jobId,
+            max_workers=IMPORT_MAX_WORKERS,
+            max_resume_bytes=MAX_RESUME_UPLOAD_MB * 1024 * 1024,
+            index=candidate_index
+        )
+    except UploadRejected as e:
+        return JSONResponse(status_code=e.status_code, content={"success": False, "error": str(e)})
+    except (ApplicationError, zipfile.BadZipFile, UnicodeDecodeError) as e:
+        return JSONResponse(status_code=400, content={"success": False, "error": str(e)})
+    except Exception as e:
+        print(f"❌ Error importing applications: {str(e)}")
+        return JSONResponse(
+            status_code=500,
+            content={"success": False, "error": "Failed to import applications", "details": str(e)}
+        )
+    finally:
+        if os.path.exists(archive_path):
+            os.remove(archive_path)
+    
+    for result in report['results']:
+        if result['status'] == 'imported':
+            resume_ingestor.submit(os.path.join("data", result['jobId'], "applications", result['candidateId']))
+    
+    print(f"✅ Imported {report['imported']} of {report['total']} applications ({report['failed']} failed)")
+    return JSONResponse(content={"success": True, **report})
+
 @app.get("/api/candidates/{job_id}")
-async def get_candidates(job_id: str):
-    """Get all candidates for a specific job"""
+async def get_candidates(
+    job_id: str,
+    limit: Optional[int] = None,
+    cursor: Optional[str] = None,
+    status: Optional[str] = None,
+    min_experience: Optional[float] = None,
+    skill: Optional[str] = None,
+    location: Optional[str] = None,
+    fields: Optional[str] = None
+):
+    """
+    Get candidates for a specific job.
+    Without limit/cursor every matching candidate is returned; with them results are paged
+    by folder name and next_cursor resumes the listing. fields= is a comma-separated list
+    of (dotted) fields to return, e.g. personalInfo,skills,experience.title
+    """
     try:
-        candidates = []
-        applications_dir = os.path.join("data", job_id, "applications")
+        if limit is not None and not 1 <= limit <= MAX_CANDIDATE_PAGE_SIZE:
+            return JSONResponse(
+                status_code=400,
+                content={"error": f"limit must be between 1 and {MAX_CANDIDATE_PAGE_SIZE}", "candidates": [], "count": 0}
+            )
         
-        if not os.path.exists(applications_dir):
-            return JSONResponse(content={"candidates": [], "count": 0})
+        try:
+            after = decode_cursor(cursor) if cursor else None
+        except ValueError as e:
+            return JSONResponse(status_code=400, content={"error": str(e), "candidates": [], "count": 0})
         
-        for student_folder in os.listdir(applications_dir):
-            student_path = os.path.join(applications_dir, student_folder)
-            
-            if os.path.isdir(student_path):
-                json_file = os.path.join(student_path, "generalInformation.json")
-                
-                if os.path.exists(json_file):
-                    try:
-                        with open(json_file, 'r', encoding='utf-8') as f:
-                            candidate_data = json.load(f)
-                            candidate_data['folderName'] = student_folder
-                            candidates.append(candidate_data)
-                    except Exception as e:
-                        print(f"Error reading {json_file}: {str(e)}")
-                        continue
+        if after is not None and limit is None:
+            limit = MAX_CANDIDATE_PAGE_SIZE
+        
+        predicate = build_candidate_filter(status, min_experience, skill, location)
+        candidates, total, next_after = candidate_index.query_candidates(
+            job_id, predicate=predicate, after=after, limit=limit
+        )
+        
+        if fields:
+            field_list = [field for field in fields.split(',') if field.strip()]
+            candidates = [project_candidate(candidate, field_list) for candidate in candidates]
         
         return JSONResponse(content={
             "candidates": candidates,
-            "count": len(candidates)
+            "count": len(candidates),
+            "total": total,
+            "next_cursor": encode_cursor(next_after) if next_after else None
         })
     
     except Exception as e:
@@ -397,93 +530,209 @@ async def get_candidates(job_id: str):
             content={"error": str(e), "candidates": [], "count": 0}
         )
 
+async def run_shortlist_pipeline(
+    request: ShortlistRequest,
+    emit: Optional[Callable[[str, Dict[str, Any]], None]] = None
+) -> Tuple[int, Dict[str, Any]]:
+    """
+    Run Intake -> Pre-filter -> Resume Screener -> Evaluator for one job
+    
+    LLM calls are tagged with the job id, and a usage summary of the run
+    (calls, retries, failures, tokens, latency per agent) is added as llm_usage.
+    With SHORTLIST_TRACING the stage timings are saved as a Chrome trace,
+    downloadable from trace_url.
+    
+    Args:
+        request: Shortlist request
+        emit: Called with (event name, payload) as stages and candidates complete (optional)
+    
+    Returns:
+        Tuple of (HTTP status code, response content)
+    """
+    with llm_labels(job_id=request.job_id), track_llm_usage() as llm_usage, start_trace(f"shortlist {request.job_id}") as tracer:
+        with trace_span("shortlist", job_id=request.job_id):
+            status_code, content = await run_shortlist_stages(request, emit)
+    
+    content["llm_usage"] = llm_usage.to_dict()
+    if SHORTLIST_TRACING:
+        trace_id = uuid.uuid4().hex
+        try:
+            await asyncio.to_thread(trace_store.save, trace_id, tracer)
+            content["trace_url"] = f"/api/traces/{trace_id}"
+        except OSError as e:
+            print(f"⚠️  Could not save shortlist trace: {str(e)}")
+    return status_code, content
+
+async def run_shortlist_stages(
+    request: ShortlistRequest,
+    emit: Optional[Callable[[str, Dict[str, Any]], None]] = None
+) -> Tuple[int, Dict[str, Any]]:
+    """Pipeline stages behind run_shortlist_pipeline"""
+    def notify(event: str, payload: Dict[str, Any]):
+        if emit:
+            emit(event, payload)
+    
+    # Check if agents are initialized
+    if not all([intake_agent, screener_agent, evaluator_agent]):
+        return 503, {
+            "success": False,
+            "error": "AI agents not initialized. Please set GEMINI_API_KEY environment variable."
+        }
+    
+    job_id = request.job_id
+    job_description = request.job_description
+    
+    if not job_description or len(job_description.strip()) < 10:
+        return 400, {"success": False, "error": "Job description is too short"}
+    
+    # The job id names the folder results are written to, so it must be a known job
+    if candidate_index.get_job(job_id) is None:
+        return 404, {"success": False, "error": f"Job '{job_id}' not found"}
+    
+    # Step 1: Get all candidates for this job
+    with trace_span("load_candidates"):
+        candidates = candidate_index.list_candidates(job_id)
+    
+    if not candidates:
+        return 200, {
+            "success": True,
+            "shortlisted_candidates": [],
+            "message": "No candidates found in the system"
+        }
+    
+    # Extracted resume text (finishing any extraction still running) goes into the screening prompts
+    job_path = os.path.join("data", job_id)
+    with trace_span("load_resume_text", candidates=len(candidates)):
+        candidates = await resume_ingestor.attach_resume_text(job_path, candidates)
+    
+    # Step 2: Intake Agent - Process job description
+    print(f"🔍 Processing job description with Intake Agent...")
+    notify("stage", {"stage": "intake", "status": "started"})
+    with llm_labels(agent="intake"), trace_span("intake"):
+        intake_result = await intake_agent.process_job_description_async(
+            job_description,
+            job_dir=job_path if os.path.isdir(job_path) else None
+        )
+    
+    if not intake_result['success']:
+        return 500, {
+            "success": False,
+            "error": f"Job analysis failed: {intake_result.get('error')}"
+        }
+    
+    job_requirements = intake_result['job_requirements']
+    if intake_result.get('cached'):
+        print(f"♻️  Reusing stored job requirements for {job_id}")
+    print(f"✅ Job requirements extracted: {intake_agent.get_requirement_summary(job_requirements)}")
+    notify("stage", {"stage": "intake", "status": "completed", "job_requirements": job_requirements})
+    
+    # Step 3: Local pre-filter - Only send promising candidates to the LLM
+    top_k = request.prefilter_top_k if request.prefilter_top_k is not None else PREFILTER_TOP_K
+    min_score = request.prefilter_min_score if request.prefilter_min_score is not None else PREFILTER_MIN_SCORE
+    with trace_span("prefilter", candidates=len(candidates)):
+        selected_candidates, prefiltered_out = prefilter_candidates(
+            candidates, job_requirements, top_k=top_k, min_score=min_score
+        )
+    if prefiltered_out:
+        print(f"🔎 Pre-filter kept {len(selected_candidates)} of {len(candidates)} candidates for LLM screening")
+    
+    # Step 4: Resume Screener Agent - Screen new or changed candidates
+    notify("stage", {"stage": "screening", "status": "started", "total": len(selected_candidates)})
+    completed = 0
+    
+    def on_result(index: int, result: Dict[str, Any]):
+        nonlocal completed
+        completed += 1
+        notify("candidate", {
+            "index": index,
+            "completed": completed,
+            "total": len(selected_candidates),
+            "candidate_name": result.get('candidate_name', 'Unknown'),
+            "match_score": result.get('match_score', 0),
+            "recommendation": result.get('recommendation'),
+            "email": result.get('candidate_email', ''),
+            "phone": result.get('candidate_phone', ''),
+            "error": result.get('error')
+        })
+    
+    with llm_labels(agent="screener"), trace_span("screening", candidates=len(selected_candidates)):
+        if request.incremental and os.path.isdir(job_path):
+            screening = await screener_agent.screen_candidates_incremental_async(
+                selected_candidates, job_requirements, job_path, on_result=on_result
+            )
+            screening_results = screening['screening_results']
+            screened_count = screening['screened_count']
+            print(f"📋 Screened {screened_count} new or changed candidates, reused {screening['reused_count']}")
+        else:
+            print(f"📋 Screening {len(selected_candidates)} candidates...")
+            screening_results = await screener_agent.screen_candidates_batch_async(
+                selected_candidates, job_requirements, on_result=on_result
+            )
+            screened_count = len(selected_candidates)
+    print(f"✅ Screening complete. {len(screening_results)} candidates evaluated.")
+    notify("stage", {"stage": "screening", "status": "completed"})
+    
+    # Step 5: Evaluator Agent - Rank and shortlist
+    print(f"🏆 Evaluating and ranking candidates...")
+    notify("stage", {"stage": "evaluation", "status": "started"})
+    with llm_labels(agent="evaluator"), trace_span("evaluation"):
+        evaluation_result = await evaluator_agent.evaluate_and_rank_async(
+            screening_results, 
+            job_description,
+            min_score=70
+        )
+    
+    if not evaluation_result['success']:
+        return 500, {
+            "success": False,
+            "error": "Evaluation failed"
+        }
+    
+    shortlisted = evaluation_result['shortlisted_candidates']
+    print(f"✅ Shortlisting complete. {len(shortlisted)} candidates shortlisted.")
+    
+    return 200, {
+        "success": True,
+        "shortlisted_candidates": shortlisted,
+        "summary": evaluation_result.get('summary', {}),
+        "job_requirements": job_requirements,
+        "total_candidates_reviewed": len(candidates),
+        "total_newly_screened": screened_count,
+        "total_prefiltered_out": len(prefiltered_out),
+        "total_shortlisted": len(shortlisted)
+    }
+
 @app.post("/api/shortlist")
 async def shortlist_candidates(request: ShortlistRequest):
     """
     AI-powered candidate shortlisting endpoint
     Uses three agents: Intake -> Resume Screener -> Evaluator
+    With run_in_background the run is queued and a run_id is returned immediately;
+    poll /api/shortlist/runs/{run_id} and fetch /api/shortlist/runs/{run_id}/result.
     """
     try:
-        # Check if agents are initialized
-        if not all([intake_agent, screener_agent, evaluator_agent]):
-            return JSONResponse(
-                status_code=503,
-                content={
-                    "success": False,
-                    "error": "AI agents not initialized. Please set GEMINI_API_KEY environment variable."
-                }
-            )
-        
-        job_id = request.job_id
-        job_description = request.job_description
-        
-        if not job_description or len(job_description.strip()) < 10:
-            return JSONResponse(
-                status_code=400,
-                content={"success": False, "error": "Job description is too short"}
+        if request.run_in_background:
+            # Only indexed jobs: the id becomes a path segment of the run record
+            if candidate_index.get_job(request.job_id) is None:
+                return JSONResponse(
+                    status_code=404,
+                    content={"success": False, "error": f"Job '{request.job_id}' not found"}
+                )
+            
+            run = shortlist_runs.submit(
+                request.job_id,
+                lambda emit: run_shortlist_pipeline(request, emit=emit)
             )
-        
-        # Step 1: Get all candidates for this job
-        candidates_response = await get_candidates(job_id)
-        candidates_data = json.loads(candidates_response.body)
-        candidates = candidates_data.get('candidates', [])
-        
-        if not candidates:
-            return JSONResponse(content={
+            return JSONResponse(status_code=202, content={
                 "success": True,
-                "shortlisted_candidates": [],
-                "message": "No candidates found in the system"
+                "run_id": run['run_id'],
+                "status": run['status'],
+                "status_url": f"/api/shortlist/runs/{run['run_id']}",
+                "result_url": f"/api/shortlist/runs/{run['run_id']}/result"
             })
         
-        # Step 2: Intake Agent - Process job description
-        print(f"🔍 Processing job description with Intake Agent...")
-        intake_result = intake_agent.process_job_description(job_description)
-        
-        if not intake_result['success']:
-            return JSONResponse(
-                status_code=500,
-                content={
-                    "success": False,
-                    "error": f"Job analysis failed: {intake_result.get('error')}"
-                }
-            )
-        
-        job_requirements = intake_result['job_requirements']
-        print(f"✅ Job requirements extracted: {intake_agent.get_requirement_summary(job_requirements)}")
-        
-        # Step 3: Resume Screener Agent - Screen all candidates
-        print(f"📋 Screening {len(candidates)} candidates...")
-        screening_results = screener_agent.screen_candidates_batch(candidates, job_requirements)
-        print(f"✅ Screening complete. {len(screening_results)} candidates evaluated.")
-        
-        # Step 4: Evaluator Agent - Rank and shortlist
-        print(f"🏆 Evaluating and ranking candidates...")
-        evaluation_result = evaluator_agent.evaluate_and_rank(
-            screening_results, 
-            job_description,
-            min_score=70
-        )
-        
-        if not evaluation_result['success']:
-            return JSONResponse(
-                status_code=500,
-                content={
-                    "success": False,
-                    "error": "Evaluation failed"
-                }
-            )
-        
-        shortlisted = evaluation_result['shortlisted_candidates']
-        print(f"✅ Shortlisting complete. {len(shortlisted)} candidates shortlisted.")
-        
-        return JSONResponse(content={
-            "success": True,
-            "shortlisted_candidates": shortlisted,
-            "summary": evaluation_result.get('summary', {}),
-            "job_requirements": job_requirements,
-            "total_candidates_reviewed": len(candidates),
-            "total_shortlisted": len(shortlisted)
-        })
+        status_code, content = await run_shortlist_pipeline(request)
+        return JSONResponse(status_code=status_code, content=content)
     
     except Exception as e:
         print(f"❌ Error in shortlisting: {str(e)}")
@@ -495,11 +744,133 @@ async def shortlist_candidates(request: ShortlistRequest):
             }
         )
 
+@app.get("/api/shortlist/runs/{run_id}")
+async def get_shortlist_run(run_id: str):
+    """Status and progress of a background shortlist run"""
+    run = shortlist_runs.get(run_id)
+    if run is None:
+        return JSONResponse(status_code=404, content={"success": False, "error": f"Run '{run_id}' not found"})
+    return JSONResponse(content={"success": True, "run": run})
+
+@app.get("/api/shortlist/runs/{run_id}/result")
+async def get_shortlist_run_result(run_id: str):
+    """Final shortlist of a background run (202 while it is still queued or running)"""
+    run = shortlist_runs.get_result(run_id)
+    if run is None:
+        return JSONResponse(status_code=404, content={"success": False, "error": f"Run '{run_id}' not found"})
+    
+    if 'result' not in run:
+        status = shortlist_runs.get(run_id)
+        return JSONResponse(status_code=202 if status['status'] in ('queued', 'running') else 500, content={
+            "success": False,
+            "run": status,
+            "error": status.get('error') or f"Run is {status['status']}"
+        })
+    
+    return JSONResponse(status_code=run.get('status_code', 200), content=run['result'])
+
+@app.get("/api/traces/{trace_id}")
+async def get_trace(trace_id: str):
+    """Stage timings of a shortlist run as Chrome trace JSON (open in chrome://tracing or ui.perfetto.dev)"""
+    trace = trace_store.load(trace_id)
+    if trace is None:
+        return JSONResponse(status_code=404, content={"success": False, "error": f"Trace '{trace_id}' not found"})
+    return JSONResponse(
+        content=trace,
+        headers={"Content-Disposition": f'attachment; filename="shortlist-trace-{trace_id}.json"'}
+    )
+
+@app.get("/api/analytics/candidates")
+async def candidate_analytics(
+    job_id: Optional[str] = None,
+    status: Optional[str] = None,
+    min_experience: Optional[float] = None,
+    max_experience: Optional[float] = None,
+    skills: Optional[str] = None,
+    refresh: bool = False
+):
+    """
+    Counts across all jobs' candidates from the columnar snapshot: total, top skills,
+    experience histogram and status spread. skills= is a comma-separated list the
+    candidates must all have, e.g. python,kubernetes. At most every SNAPSHOT_REBUILD_MINUTES
+    the snapshot is checked against the candidate files and rebuilt (in a worker thread)
+    if they changed, or right away with refresh=true.
+    """
+    try:
+        snapshot = await asyncio.to_thread(candidate_snapshots.current, candidate_index, refresh)
+        summary = snapshot.summary(
+            job_id=job_id,
+            status=status,
+            min_years=min_experience,
+            max_years=max_experience,
+            skills=[skill for skill in (skills or '').split(',') if skill.strip()]
+        )
+        return JSONResponse(content={
+            "success": True,
+            **summary,
+            "snapshot": {
+                "candidates": snapshot.rows,
+                "built_at": datetime.fromtimestamp(snapshot.meta['built_at']).isoformat()
+            }
+        })
+    except Exception as e:
+        return JSONResponse(status_code=500, content={"success": False, "error": str(e)})
+
+@app.get("/metrics")
+async def metrics():
+    """LLM call metrics (latency, tokens, retries, failures) in the Prometheus text format"""
+    return PlainTextResponse(llm_metrics.render_prometheus(), media_type="text/plain; version=0.0.4")
+
+def format_sse(event: str, payload: Dict[str, Any]) -> str:
+    """Serialize one Server-Sent Event"""
+    return f"event: {event}\ndata: {json.dumps(payload, ensure_ascii=False)}\n\n"
+
+@app.post("/api/shortlist/stream")
+async def shortlist_candidates_stream(request: ShortlistRequest):
+    """
+    Streaming variant of /api/shortlist using Server-Sent Events.
+    Emits "stage" events as intake/screening/evaluation start and finish, a "candidate"
+    event per screening result as it completes, then one "result" event carrying the
+    same payload /api/shortlist returns (plus status_code).
+    """
+    events = asyncio.Queue()
+    
+    async def run():
+        try:
+            status_code, content = await run_shortlist_pipeline(
+                request,
+                emit=lambda event, payload: events.put_nowait((event, payload))
+            )
+        except Exception as e:
+            print(f"❌ Error in shortlisting: {str(e)}")
+            status_code, content = 500, {"success": False, "error": str(e)}
+        events.put_nowait(("result", {**content, "status_code": status_code}))
+    
+    async def event_stream():
+        task = asyncio.create_task(run())
+        try:
+            while True:
+                event, payload = await events.get()
+                yield format_sse(event, payload)
+                if event == "result":
+                    break
+        finally:
+            # Client disconnected early: stop spending LLM calls on this run
+            if not task.done():
+                task.cancel()
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
 @app.post("/api/send-bulk-email")
 async def send_bulk_email(request: BulkEmailRequest):
     """
-    Send bulk emails to selected candidates
-    Note: This is a mock implementation. In production, integrate with an email service like SendGrid, AWS SES, or SMTP.
+    Queue bulk emails to selected candidates
+    Messages are delivered in the background over pooled SMTP connections; the
+    returned batch_id can be polled for per-recipient delivery status.
     """
     try:
         recipients = request.recipients
@@ -524,49 +895,48 @@ async def send_bulk_email(request: BulkEmailRequest):
                 }
             )
         
-        # Real email sending using Gmail SMTP
-        print(f"\n📧 Sending emails to {len(recipients)} candidates...")
+        if not SMTP_EMAIL or not SMTP_PASSWORD:
+            print("❌ Email credentials not configured. Cannot send email.")
+            return JSONResponse(
+                status_code=503,
+                content={
+                    "success": False,
+                    "error": "Email credentials not configured"
+                }
+            )
+        
+        print(f"\n📧 Queueing emails to {len(recipients)} candidates...")
         print(f"Subject: {subject}")
         print(f"Body preview: {body[:100]}...")
         
-        sent_count = 0
-        failed_emails = []
+        # Compile the templates once, then personalize per recipient
+        try:
+            template = EmailTemplate(subject, body)
+            rendered = template.render_many(recipients)
+        except EmailTemplateError as e:
+            return JSONResponse(
+                status_code=400,
+                content={
+                    "success": False,
+                    "error": str(e)
+                }
+            )
         
-        for recipient in recipients:
-            try:
-                name = recipient.get('name', 'Unknown')
-                email = recipient.get('email', 'N/A')
-                
-                # Personalize the email body by replacing placeholder if exists
-                personalized_body = body.replace('[Candidate Name]', name)
-                
-                # Send actual email
-                print(f"  ✉️  Sending to: {name} <{email}>")
-                
-                if send_email(subject, personalized_body, email):
-                    sent_count += 1
-                    print(f"  ✅ Successfully sent to {email}")
-                else:
-                    failed_emails.append(email)
-                    print(f"  ❌ Failed to send to {email}")
-                
-            except Exception as e:
-                print(f"  ❌ Failed to send to {email}: {str(e)}")
-                failed_emails.append(email)
+        messages = [
+            (recipient, build_message(SMTP_EMAIL, recipient.get('email', 'N/A'), personalized_subject, personalized_body))
+            for recipient, (personalized_subject, personalized_body) in zip(recipients, rendered)
+        ]
         
-        print(f"✅ Email sending complete. Sent: {sent_count}, Failed: {len(failed_emails)}")
+        batch = email_dispatcher.submit(messages)
         
-        response_data = {
+        return JSONResponse(status_code=202, content={
             "success": True,
-            "sent_count": sent_count,
-            "failed_count": len(failed_emails),
-            "message": f"Successfully sent emails to {sent_count} candidate(s)"
-        }
-        
-        if failed_emails:
-            response_data["failed_emails"] = failed_emails
-        
-        return JSONResponse(content=response_data)
+            "batch_id": batch['batch_id'],
+            "status": batch['status'],
+            "queued_count": batch['total'],
+            "status_url": f"/api/email-batches/{batch['batch_id']}",
+            "message": f"Queued emails to {batch['total']} candidate(s)"
+        })
         
     except Exception as e:
         print(f"❌ Error sending bulk emails: {str(e)}")
@@ -578,6 +948,14 @@ async def send_bulk_email(request: BulkEmailRequest):
             }
         )
 
+@app.get("/api/email-batches/{batch_id}")
+async def get_email_batch(batch_id: str):
+    """Delivery status of a bulk email batch, per recipient"""
+    batch = email_dispatcher.get(batch_id)
+    if batch is None:
+        return JSONResponse(status_code=404, content={"success": False, "error": f"Batch '{batch_id}' not found"})
+    return JSONResponse(content={"success": True, "batch": batch})
+
 if __name__ == "__main__":
     import uvicorn
     uvicorn.run(app, host="0.0.0.0", port=8000)
@@ -1,10 +1,16 @@
 # Source Package
 from .agents import IntakeAgent, ResumeScreenerAgent, EvaluatorAgent
-from .llm_provider import GeminiProvider
+from .llm_provider import LLMProvider, GeminiProvider, MockProvider
+from .cache import ScreeningCache
+from .storage import CandidateIndex
 
 __all__ = [
     'IntakeAgent',
     'ResumeScreenerAgent',
     'EvaluatorAgent',
-    'GeminiProvider'
+    'LLMProvider',
+    'GeminiProvider',
+    'MockProvider',
+    'ScreeningCache',
+    'CandidateIndex'
 ]
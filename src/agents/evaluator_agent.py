@@ -1,20 +1,27 @@
 # Evaluator Agent - Ranks and Shortlists Candidates
-from typing import Dict, Any, List
-from ..llm_provider import GeminiProvider
-from ..prompts import EVALUATOR_PROMPT
+from typing import Dict, Any, List, Optional
+from collections import Counter
+from ..llm_provider import LLMProvider
+from ..prompts import RECOMMENDATION_REASON_PROMPT
 from ..utils import extract_json_from_response
 import json
 
 class EvaluatorAgent:
-    """Agent responsible for final evaluation and candidate ranking"""
+    """Agent responsible for final evaluation and candidate ranking
     
-    def __init__(self, llm_provider: GeminiProvider):
+    Ranking, summary fields and interview focus areas are computed locally from
+    the screening results. The LLM is only used, when enabled, to write the
+    narrative recommendation_reason for shortlisted candidates.
+    """
+    
+    def __init__(self, llm_provider: Optional[LLMProvider] = None, generate_reasons: bool = False):
         self.llm = llm_provider
+        self.generate_reasons = generate_reasons
     
     def evaluate_and_rank(
         self, 
         screening_results: List[Dict[str, Any]], 
-        job_description: str,
+        job_description: str, 
         min_score: int = 70
     ) -> Dict[str, Any]:
         """
@@ -24,124 +31,74 @@ class EvaluatorAgent:
             screening_results: List of screening results from resume screener
             job_description: Original job description
             min_score: Minimum score for shortlisting (default: 70)
-            
+        
         Returns:
             Final evaluation with ranked shortlist
         """
-        try:
-            # Filter out candidates with errors
-            valid_results = [r for r in screening_results if r.get('match_score', 0) > 0]
-            
-            if not valid_results:
-                return {
-                    'success': True,
-                    'shortlisted_candidates': [],
-                    'summary': {
-                        'total_candidates_reviewed': len(screening_results),
-                        'total_shortlisted': 0,
-                        'message': 'No valid candidates found for evaluation'
-                    }
-                }
-            
-            # Format screening results for prompt
-            screening_summary = self._format_screening_results(valid_results)
-            
-            # Format prompt
-            prompt = EVALUATOR_PROMPT.format(
-                job_description=job_description,
-                screening_results=screening_summary
-            )
-            
-            # Get response from LLM with retry logic
-            response = self.llm.generate_json_response(prompt, max_retries=3)
-            
-            # Extract JSON from response
-            evaluation_result = extract_json_from_response(response)
-            
-            # Validate evaluation result
-            is_valid = self._validate_ranking(evaluation_result, valid_results)
-            if not is_valid:
-                print("⚠️  Validation failed, using fallback ranking")
-                return self._fallback_ranking(screening_results, min_score)
-            
-            # Filter by minimum score and add location/contact info
-            shortlisted = []
-            for candidate in evaluation_result.get('shortlisted_candidates', []):
-                if candidate.get('match_score', 0) >= min_score:
-                    # Find original screening result to get contact info
-                    original = next(
-                        (r for r in valid_results if r.get('candidate_name') == candidate.get('candidate_name')),
-                        None
-                    )
-                    if original:
-                        candidate['email'] = original.get('candidate_email', '')
-                        candidate['phone'] = original.get('candidate_phone', '')
-                    shortlisted.append(candidate)
-            
-            # Sort by match score
-            shortlisted.sort(key=lambda x: x.get('match_score', 0), reverse=True)
-            
-            # Update ranks
-            for idx, candidate in enumerate(shortlisted, 1):
-                candidate['rank'] = idx
-                
-            temp = {
-                'success': True,
-                'shortlisted_candidates': shortlisted,
-                'summary': evaluation_result.get('summary', {}),
-                'total_reviewed': len(screening_results),
-                'total_shortlisted': len(shortlisted)
-            }
-            
-            print("this is my eval agent result: ", temp)
-            
-            return temp
-            
-        except Exception as e:
-            print(f"❌ Evaluation error: {str(e)}, using fallback")
-            return self._fallback_ranking(screening_results, min_score)
+        evaluation = self.rank_candidates(screening_results, min_score)
+        
+        if self._should_generate_reasons(evaluation):
+            try:
+                prompt = self._build_reason_prompt(evaluation['shortlisted_candidates'], screening_results, job_description)
+                response = self.llm.generate_json_response(prompt, max_retries=3)
+                self._apply_reasons(response, evaluation['shortlisted_candidates'])
+            except Exception as e:
+                print(f"⚠️  Could not generate recommendation reasons: {str(e)}, keeping screening assessments")
+        
+        return evaluation
     
-    def _validate_ranking(self, result: Dict[str, Any], screening_results: List[Dict[str, Any]]) -> bool:
-        """Validate evaluation result for consistency"""
-        if 'shortlisted_candidates' not in result:
-            print("⚠️  Missing shortlisted_candidates field")
-            return False
+    async def evaluate_and_rank_async(
+        self, 
+        screening_results: List[Dict[str, Any]], 
+        job_description: str, 
+        min_score: int = 70
+    ) -> Dict[str, Any]:
+        """
+        Async variant of evaluate_and_rank that does not block the event loop
+        
+        Args:
+            screening_results: List of screening results from resume screener
+            job_description: Original job description
+            min_score: Minimum score for shortlisting (default: 70)
+        
+        Returns:
+            Final evaluation with ranked shortlist
+        """
+        evaluation = self.rank_candidates(screening_results, min_score)
         
-        shortlisted = result['shortlisted_candidates']
+        if self._should_generate_reasons(evaluation):
+            try:
+                prompt = self._build_reason_prompt(evaluation['shortlisted_candidates'], screening_results, job_description)
+                response = await self.llm.generate_json_response_async(prompt, max_retries=3)
+                self._apply_reasons(response, evaluation['shortlisted_candidates'])
+            except Exception as e:
+                print(f"⚠️  Could not generate recommendation reasons: {str(e)}, keeping screening assessments")
         
-        # Validate each candidate exists in original results
-        for candidate in shortlisted:
-            if 'candidate_name' not in candidate or 'match_score' not in candidate:
-                print("⚠️  Candidate missing required fields")
-                return False
-            
-            # Check if score matches original
-            name = candidate['candidate_name']
-            original = next((r for r in screening_results if r.get('candidate_name') == name), None)
-            if not original:
-                print(f"⚠️  Candidate {name} not found in original results")
-                return False
-            
-            if candidate['match_score'] != original.get('match_score'):
-                print(f"⚠️  Score mismatch for {name}")
-                return False
-        
-        # Validate ranking order
-        for i in range(len(shortlisted) - 1):
-            if shortlisted[i]['match_score'] < shortlisted[i + 1]['match_score']:
-                print("⚠️  Ranking order incorrect")
-                return False
-        
-        return True
+        return evaluation
     
-    def _fallback_ranking(self, screening_results: List[Dict[str, Any]], min_score: int) -> Dict[str, Any]:
-        """Fallback: Deterministic ranking by score if AI evaluation fails"""
-        print("✅ Using deterministic fallback ranking")
-        valid_results = [r for r in screening_results if r.get('match_score', 0) >= min_score]
-        valid_results.sort(key=lambda x: x.get('match_score', 0), reverse=True)
+    def rank_candidates(self, screening_results: List[Dict[str, Any]], min_score: int = 70) -> Dict[str, Any]:
+        """
+        Deterministically rank screening results and build the shortlist summary
+        
+        Args:
+            screening_results: List of screening results from resume screener
+            min_score: Minimum score for shortlisting (default: 70)
+        
+        Returns:
+            Final evaluation with ranked shortlist
+        """
+        # Filter out candidates with errors
+        valid_results = [r for r in screening_results if r.get('match_score', 0) > 0 and 'error' not in r]
+        
+        if not valid_results:
+            return self._empty_result(screening_results)
+        
+        # Filter by minimum score and sort by match score (stable, so ties keep screening order)
+        qualified = [r for r in valid_results if r.get('match_score', 0) >= min_score]
+        qualified.sort(key=lambda x: x.get('match_score', 0), reverse=True)
         
         shortlisted = []
-        for idx, result in enumerate(valid_results[:10], 1):  # Top 10 max
+        for idx, result in enumerate(qualified, 1):
             shortlisted.append({
                 'candidate_name': result.get('candidate_name', 'Unknown'),
                 'match_score': result.get('match_score', 0),
@@ -150,33 +107,120 @@ class EvaluatorAgent:
                 'phone': result.get('candidate_phone', ''),
                 'key_strengths': result.get('strengths', [])[:3],
                 'recommendation_reason': result.get('overall_assessment', 'Candidate meets requirements'),
+                'interview_focus_areas': self._interview_focus_areas(result)
             })
         
+        average_score = sum(r.get('match_score', 0) for r in valid_results) / len(valid_results)
+        
         return {
             'success': True,
             'shortlisted_candidates': shortlisted,
             'summary': {
                 'total_candidates_reviewed': len(screening_results),
                 'total_shortlisted': len(shortlisted),
-                'note': 'Deterministic ranking used'
+                'top_skills_found': self._top_skills(qualified),
+                'overall_candidate_quality': self._quality_band(average_score),
+                'average_match_score': round(average_score, 1)
+            },
+            'total_reviewed': len(screening_results),
+            'total_shortlisted': len(shortlisted)
+        }
+    
+    def _empty_result(self, screening_results: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Result returned when no candidate has a usable screening"""
+        return {
+            'success': True,
+            'shortlisted_candidates': [],
+            'summary': {
+                'total_candidates_reviewed': len(screening_results),
+                'total_shortlisted': 0,
+                'message': 'No valid candidates found for evaluation'
             }
         }
     
-    def _format_screening_results(self, screening_results: List[Dict[str, Any]]) -> str:
-        """Format screening results for prompt"""
+    def _interview_focus_areas(self, result: Dict[str, Any], limit: int = 4) -> List[str]:
+        """Derive interview focus areas from weaknesses and missing skills"""
+        focus_areas = list(result.get('weaknesses', []))[:2]
+        
+        for skill in result.get('skills_match', {}).get('missing_skills', []):
+            if len(focus_areas) >= limit:
+                break
+            # Skip skills a weakness already covers
+            if not any(str(skill).lower() in str(area).lower() for area in focus_areas):
+                focus_areas.append(f"Experience with {skill}")
+        
+        return focus_areas[:limit]
+    
+    def _top_skills(self, shortlisted_results: List[Dict[str, Any]], limit: int = 10) -> List[str]:
+        """Most frequently matched skills across shortlisted candidates"""
+        counts = Counter()
+        display_names = {}
+        
+        for result in shortlisted_results:
+            for skill in result.get('skills_match', {}).get('matched_skills', []):
+                key = str(skill).strip().lower()
+                counts[key] += 1
+                display_names.setdefault(key, str(skill).strip())
+        
+        return [display_names[key] for key, _ in counts.most_common(limit)]
+    
+    def _quality_band(self, average_score: float) -> str:
+        """Map an average match score onto the candidate quality bands"""
+        if average_score >= 85:
+            return 'excellent'
+        if average_score >= 70:
+            return 'good'
+        if average_score >= 50:
+            return 'fair'
+        return 'poor'
+    
+    def _should_generate_reasons(self, evaluation: Dict[str, Any]) -> bool:
+        return bool(self.generate_reasons and self.llm and evaluation['shortlisted_candidates'])
+    
+    def _build_reason_prompt(
+        self, 
+        shortlisted: List[Dict[str, Any]], 
+        screening_results: List[Dict[str, Any]], 
+        job_description: str
+    ) -> str:
+        """Format the recommendation reason prompt for the ranked shortlist"""
+        return RECOMMENDATION_REASON_PROMPT.format(
+            job_description=job_description,
+            shortlisted_candidates=self._format_shortlist(shortlisted, screening_results)
+        )
+    
+    def _apply_reasons(self, response: str, shortlisted: List[Dict[str, Any]]):
+        """Copy LLM-written reasons onto shortlisted candidates, matched by rank"""
+        reasons = extract_json_from_response(response).get('reasons', [])
+        by_rank = {
+            entry.get('rank'): entry.get('recommendation_reason')
+            for entry in reasons if isinstance(entry, dict)
+        }
+        
+        for candidate in shortlisted:
+            reason = by_rank.get(candidate['rank'])
+            if isinstance(reason, str) and reason.strip():
+                candidate['recommendation_reason'] = reason.strip()
+    
+    def _format_shortlist(self, shortlisted: List[Dict[str, Any]], screening_results: List[Dict[str, Any]]) -> str:
+        """Format the ranked shortlist with its screening data for the prompt"""
         formatted_results = []
         
-        for result in screening_results:
-            candidate_summary = {
-                'name': result.get('candidate_name', 'Unknown'),
-                'match_score': result.get('match_score', 0),
-                'skills_match': result.get('skills_match', {}).get('match_percentage', 0),
-                'experience_score': result.get('experience_match', {}).get('relevance_score', 0),
+        for candidate in shortlisted:
+            # Find original screening result for the full analysis
+            result = next(
+                (r for r in screening_results if r.get('candidate_name') == candidate['candidate_name']),
+                {}
+            )
+            formatted_results.append({
+                'rank': candidate['rank'],
+                'name': candidate['candidate_name'],
+                'match_score': candidate['match_score'],
+                'matched_skills': result.get('skills_match', {}).get('matched_skills', []),
+                'missing_skills': result.get('skills_match', {}).get('missing_skills', []),
                 'strengths': result.get('strengths', []),
                 'weaknesses': result.get('weaknesses', []),
-                'recommendation': result.get('recommendation', 'unknown'),
                 'assessment': result.get('overall_assessment', '')
-            }
-            formatted_results.append(candidate_summary)
+            })
         
         return json.dumps(formatted_results, indent=2)
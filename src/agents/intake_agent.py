@@ -1,52 +1,113 @@
-from typing import Dict, Any
-from ..llm_provider import GeminiProvider
+from typing import Dict, Any, Optional
+from ..llm_provider import LLMProvider
 from ..prompts import JOB_INTAKE_PROMPT
 from ..utils import extract_json_from_response
+from ..cache import load_job_requirements, save_job_requirements
 
 class IntakeAgent:
     """Agent responsible for analyzing job descriptions and extracting requirements"""
     
-    def __init__(self, llm_provider: GeminiProvider):
+    def __init__(self, llm_provider: LLMProvider):
         self.llm = llm_provider
     
-    def process_job_description(self, job_description: str) -> Dict[str, Any]:
+    def process_job_description(self, job_description: str, job_dir: Optional[str] = None) -> Dict[str, Any]:
         """
         Process job description and extract key requirements
         
         Args:
             job_description: Raw job description text
+            job_dir: Job folder to memoize the extraction in (optional)
             
         Returns:
             Dictionary with extracted job requirements
         """
         try:
+            # Reuse requirements extracted from the same description
+            cached = load_job_requirements(job_dir, job_description) if job_dir else None
+            if cached is not None:
+                return self._build_result(cached, job_description, cached=True)
+            
             # Format prompt with job description
             prompt = JOB_INTAKE_PROMPT.format(job_description=job_description)
             
             # Get response from LLM
             response = self.llm.generate_json_response(prompt)
             
-            # Extract JSON from response
-            job_requirements = extract_json_from_response(response)
+            job_requirements = self._parse_response(response)
+            if job_dir:
+                save_job_requirements(job_dir, job_description, job_requirements)
             
-            # Validate required fields
-            required_fields = ['required_skills', 'role_type']
-            for field in required_fields:
-                if field not in job_requirements:
-                    job_requirements[field] = [] if field.endswith('skills') else "Not specified"
+            return self._build_result(job_requirements, job_description)
             
-            return {
-                'success': True,
-                'job_requirements': job_requirements,
-                'raw_description': job_description
-            }
+        except Exception as e:
+            return self._error_result(e)
+    
+    async def process_job_description_async(
+        self, 
+        job_description: str, 
+        job_dir: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Async variant of process_job_description that does not block the event loop
+        
+        Args:
+            job_description: Raw job description text
+            job_dir: Job folder to memoize the extraction in (optional)
+            
+        Returns:
+            Dictionary with extracted job requirements
+        """
+        try:
+            cached = load_job_requirements(job_dir, job_description) if job_dir else None
+            if cached is not None:
+                return self._build_result(cached, job_description, cached=True)
+            
+            prompt = JOB_INTAKE_PROMPT.format(job_description=job_description)
+            response = await self.llm.generate_json_response_async(prompt)
+            
+            job_requirements = self._parse_response(response)
+            if job_dir:
+                save_job_requirements(job_dir, job_description, job_requirements)
+            
+            return self._build_result(job_requirements, job_description)
             
         except Exception as e:
-            return {
-                'success': False,
-                'error': str(e),
-                'job_requirements': None
-            }
+            return self._error_result(e)
+    
+    def _parse_response(self, response: str) -> Dict[str, Any]:
+        """Parse the LLM response into validated job requirements"""
+        # Extract JSON from response
+        job_requirements = extract_json_from_response(response)
+        
+        # Validate required fields
+        required_fields = ['required_skills', 'role_type']
+        for field in required_fields:
+            if field not in job_requirements:
+                job_requirements[field] = [] if field.endswith('skills') else "Not specified"
+        
+        return job_requirements
+    
+    def _build_result(
+        self, 
+        job_requirements: Dict[str, Any], 
+        job_description: str, 
+        cached: bool = False
+    ) -> Dict[str, Any]:
+        """Wrap job requirements in the intake result structure"""
+        return {
+            'success': True,
+            'job_requirements': job_requirements,
+            'raw_description': job_description,
+            'cached': cached
+        }
+    
+    def _error_result(self, error: Exception) -> Dict[str, Any]:
+        """Build the failure result returned when intake fails"""
+        return {
+            'success': False,
+            'error': str(error),
+            'job_requirements': None
+        }
     
     def get_requirement_summary(self, job_requirements: Dict[str, Any]) -> str:
         """Generate a human-readable summary of job requirements"""
@@ -1,14 +1,29 @@
 # Resume Screener Agent - Evaluates Individual Candidates
-from typing import Dict, Any, List
-from ..llm_provider import GeminiProvider
-from ..prompts import RESUME_SCREENING_PROMPT
+from typing import Dict, Any, List, Optional, Callable
+import asyncio
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from ..llm_provider import LLMProvider
+from ..prompts import RESUME_SCREENING_PROMPT, BATCH_RESUME_SCREENING_PROMPT, BATCH_CANDIDATE_TEMPLATE
 from ..utils import extract_json_from_response, format_candidate_info
+from ..cache import ScreeningCache, JobScreeningState
+from ..metrics import trace_span, traced
 
 class ResumeScreenerAgent:
     """Agent responsible for screening individual candidate resumes"""
     
-    def __init__(self, llm_provider: GeminiProvider):
+    def __init__(
+        self, 
+        llm_provider: LLMProvider, 
+        max_concurrency: int = 5, 
+        cache: Optional[ScreeningCache] = None,
+        batch_size: int = 1
+    ):
         self.llm = llm_provider
+        self.max_concurrency = max_concurrency
+        self.cache = cache
+        # Candidates packed into one screening prompt (1 = one prompt per candidate)
+        self.batch_size = max(1, batch_size)
     
     def screen_candidate(
         self, 
@@ -25,86 +40,386 @@ class ResumeScreenerAgent:
         Returns:
             Screening results with match score and analysis
         """
-        try:
-            # Format candidate information
-            candidate_info = format_candidate_info(candidate)
+        with trace_span('screen_candidate', candidate=self._candidate_label(candidate)):
+            try:
+                # Format candidate information
+                candidate_info = format_candidate_info(candidate)
+                
+                # Format job requirements as string
+                job_req_str = self._format_job_requirements(job_requirements)
+                
+                # Reuse a previous screening if neither side has changed
+                cached = self.cache.get(candidate_info, job_req_str) if self.cache else None
+                if cached is not None:
+                    return self._build_result(cached, candidate, candidate_info)
+                
+                prompt = self._build_prompt(candidate_info, job_req_str)
+                
+                # Get response from LLM with retry logic
+                response = self.llm.generate_json_response(prompt, max_retries=3)
+                
+                screening_result = self._parse_response(response, candidate_info['name'])
+                if self.cache:
+                    self.cache.put(candidate_info, job_req_str, screening_result)
+                
+                return self._build_result(screening_result, candidate, candidate_info)
+                
+            except Exception as e:
+                return self._error_result(candidate, e)
+    
+    async def screen_candidate_async(
+        self, 
+        candidate: Dict[str, Any], 
+        job_requirements: Dict[str, Any]
+    ) -> Dict[str, Any]:
+        """
+        Async variant of screen_candidate that does not block the event loop
+        
+        Args:
+            candidate: Candidate data from generalInformation.json
+            job_requirements: Extracted job requirements from intake agent
             
-            # Format job requirements as string
-            job_req_str = self._format_job_requirements(job_requirements)
+        Returns:
+            Screening results with match score and analysis
+        """
+        with trace_span('screen_candidate', candidate=self._candidate_label(candidate)):
+            try:
+                candidate_info = format_candidate_info(candidate)
+                job_req_str = self._format_job_requirements(job_requirements)
+                
+                cached = self.cache.get(candidate_info, job_req_str) if self.cache else None
+                if cached is not None:
+                    return self._build_result(cached, candidate, candidate_info)
+                
+                prompt = self._build_prompt(candidate_info, job_req_str)
+                response = await self.llm.generate_json_response_async(prompt, max_retries=3)
+                
+                screening_result = self._parse_response(response, candidate_info['name'])
+                if self.cache:
+                    self.cache.put(candidate_info, job_req_str, screening_result)
+                
+                return self._build_result(screening_result, candidate, candidate_info)
+                
+            except Exception as e:
+                return self._error_result(candidate, e)
+    
+    def screen_candidates_batch(
+        self, 
+        candidates: List[Dict[str, Any]], 
+        job_requirements: Dict[str, Any],
+        max_concurrency: int = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Screen multiple candidates in batch with bounded concurrency
+        
+        Args:
+            candidates: List of candidate data
+            job_requirements: Extracted job requirements
+            max_concurrency: Maximum screenings in flight at once (default: agent setting)
             
-            # Format prompt
-            prompt = RESUME_SCREENING_PROMPT.format(
-                job_requirements=job_req_str,
-                candidate_name=candidate_info['name'],
-                target_role=candidate_info['target_role'],
-                years_experience=candidate_info['years_experience'],
-                education=candidate_info['education'],
-                skills=candidate_info['skills'],
-                experience=candidate_info['experience'],
-                certifications=candidate_info['certifications']
+        Returns:
+            List of screening results, in the same order as candidates
+        """
+        if not candidates:
+            return []
+        
+        groups = self._split_into_groups(candidates)
+        workers = max(1, min(max_concurrency or self.max_concurrency, len(groups)))
+        
+        # Screening never raises, so a failing candidate only affects its own slot.
+        # Each worker runs in a copy of the caller's context so metrics labels carry over.
+        contexts = [contextvars.copy_context() for _ in groups]
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            group_results = executor.map(
+                lambda context, group: context.run(self._screen_group, group, job_requirements),
+                contexts,
+                groups
             )
-            
-            # Get response from LLM with retry logic
-            response = self.llm.generate_json_response(prompt, max_retries=3)
-            
-            # Extract JSON from response
-            screening_result = extract_json_from_response(response)
-            
-            # Validate and fix screening result
-            screening_result = self._validate_and_fix_result(screening_result, candidate_info['name'])
-            
-            # Add candidate basic info to result
-            screening_result['candidate_name'] = candidate_info['name']
-            screening_result['candidate_email'] = candidate.get('personalInfo', {}).get('email', '')
-            screening_result['candidate_phone'] = candidate.get('personalInfo', {}).get('phone', '')
-            screening_result['target_role'] = candidate_info['target_role']
-            screening_result['years_experience'] = candidate_info['years_experience']
-            
-            return {
-                'success': True,
-                'screening_result': screening_result
-            }
-            
-        except Exception as e:
-            return {
-                'success': False,
-                'error': str(e),
-                'candidate_name': candidate.get('personalInfo', {}).get('firstName', 'Unknown'),
-                'screening_result': None
-            }
+            return [self._to_batch_result(result) for results in group_results for result in results]
     
-    def screen_candidates_batch(
+    async def screen_candidates_batch_async(
         self, 
         candidates: List[Dict[str, Any]], 
-        job_requirements: Dict[str, Any]
+        job_requirements: Dict[str, Any],
+        max_concurrency: int = None,
+        on_result: Optional[Callable[[int, Dict[str, Any]], None]] = None
     ) -> List[Dict[str, Any]]:
         """
-        Screen multiple candidates in batch
+        Async variant of screen_candidates_batch bounded by a semaphore
         
         Args:
             candidates: List of candidate data
             job_requirements: Extracted job requirements
+            max_concurrency: Maximum screenings in flight at once (default: agent setting)
+            on_result: Called with (candidate index, screening result) as each one completes (optional)
             
         Returns:
-            List of screening results
+            List of screening results, in the same order as candidates
         """
-        results = []
+        semaphore = asyncio.Semaphore(max(1, max_concurrency or self.max_concurrency))
         
-        for candidate in candidates:
-            result = self.screen_candidate(candidate, job_requirements)
-            if result['success']:
-                results.append(result['screening_result'])
-            else:
-                # Include failed screenings with error info
-                results.append({
-                    'candidate_name': result.get('candidate_name', 'Unknown'),
-                    'match_score': 0,
-                    'error': result.get('error', 'Screening failed'),
-                    'recommendation': 'error'
-                })
+        async def screen(offset: int, group: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+            async with semaphore:
+                results = [self._to_batch_result(result) for result in await self._screen_group_async(group, job_requirements)]
+            if on_result:
+                for position, result in enumerate(results):
+                    on_result(offset + position, result)
+            return results
         
+        group_results = await asyncio.gather(*(
+            screen(idx * self.batch_size, group)
+            for idx, group in enumerate(self._split_into_groups(candidates))
+        ))
+        return [result for results in group_results for result in results]
+    
+    async def screen_candidates_incremental_async(
+        self, 
+        candidates: List[Dict[str, Any]], 
+        job_requirements: Dict[str, Any],
+        job_dir: str,
+        max_concurrency: int = None,
+        on_result: Optional[Callable[[int, Dict[str, Any]], None]] = None
+    ) -> Dict[str, Any]:
+        """
+        Screen only new or changed applicants, reusing stored results for the rest
+        
+        Args:
+            candidates: List of candidate data (with folderName, as from /api/candidates)
+            job_requirements: Extracted job requirements
+            job_dir: Job folder holding the stored screening results
+            max_concurrency: Maximum screenings in flight at once (default: agent setting)
+            on_result: Called with (candidate index, screening result) as each one is available (optional)
+            
+        Returns:
+            Screening results in the same order as candidates, plus screened/reused counts
+        """
+        state = JobScreeningState(job_dir, self._format_job_requirements(job_requirements))
+        
+        results = [state.lookup(candidate) for candidate in candidates]
+        pending = [idx for idx, result in enumerate(results) if result is None]
+        
+        if on_result:
+            for idx, result in enumerate(results):
+                if result is not None:
+                    on_result(idx, result)
+        
+        fresh_results = await self.screen_candidates_batch_async(
+            [candidates[idx] for idx in pending],
+            job_requirements,
+            max_concurrency,
+            on_result=(lambda position, result: on_result(pending[position], result)) if on_result else None
+        )
+        for idx, result in zip(pending, fresh_results):
+            results[idx] = result
+            state.record(candidates[idx], result)
+        
+        state.save()
+        
+        return {
+            'screening_results': results,
+            'screened_count': len(pending),
+            'reused_count': len(candidates) - len(pending)
+        }
+    
+    def _split_into_groups(self, candidates: List[Dict[str, Any]]) -> List[List[Dict[str, Any]]]:
+        """Chunk candidates into groups of batch_size for one prompt each"""
+        return [candidates[i:i + self.batch_size] for i in range(0, len(candidates), self.batch_size)]
+    
+    def _screen_group(self, group: List[Dict[str, Any]], job_requirements: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Screen a group of candidates with one batched prompt, falling back per candidate"""
+        if len(group) == 1:
+            return [self.screen_candidate(group[0], job_requirements)]
+        
+        job_req_str = self._format_job_requirements(job_requirements)
+        results, pending = self._prepare_group(group, job_req_str)
+        
+        if len(pending) > 1:
+            with trace_span('screen_batch', candidates=len(pending)):
+                try:
+                    prompt = self._build_batch_prompt([info for _, info in pending], job_req_str)
+                    response = self.llm.generate_json_response(prompt, max_retries=3)
+                    self._apply_batch_response(response, group, pending, job_req_str, results)
+                except Exception as e:
+                    print(f"⚠️  Batched screening failed, screening {len(pending)} candidates individually: {str(e)}")
+        
+        # Screen anyone the batch did not return on their own
+        return [
+            result if result is not None else self.screen_candidate(group[idx], job_requirements)
+            for idx, result in enumerate(results)
+        ]
+    
+    async def _screen_group_async(
+        self, 
+        group: List[Dict[str, Any]], 
+        job_requirements: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """Async variant of _screen_group"""
+        if len(group) == 1:
+            return [await self.screen_candidate_async(group[0], job_requirements)]
+        
+        job_req_str = self._format_job_requirements(job_requirements)
+        results, pending = self._prepare_group(group, job_req_str)
+        
+        if len(pending) > 1:
+            with trace_span('screen_batch', candidates=len(pending)):
+                try:
+                    prompt = self._build_batch_prompt([info for _, info in pending], job_req_str)
+                    response = await self.llm.generate_json_response_async(prompt, max_retries=3)
+                    self._apply_batch_response(response, group, pending, job_req_str, results)
+                except Exception as e:
+                    print(f"⚠️  Batched screening failed, screening {len(pending)} candidates individually: {str(e)}")
+        
+        for idx, result in enumerate(results):
+            if result is None:
+                results[idx] = await self.screen_candidate_async(group[idx], job_requirements)
         return results
     
+    def _prepare_group(self, group: List[Dict[str, Any]], job_req_str: str):
+        """Fill cached results for a group and list the candidates still to screen"""
+        results = [None] * len(group)
+        pending = []
+        
+        for idx, candidate in enumerate(group):
+            try:
+                candidate_info = format_candidate_info(candidate)
+            except Exception:
+                continue  # Screened individually so the error is reported as usual
+            
+            cached = self.cache.get(candidate_info, job_req_str) if self.cache else None
+            if cached is not None:
+                results[idx] = self._build_result(cached, candidate, candidate_info)
+            else:
+                pending.append((idx, candidate_info))
+        
+        return results, pending
+    
+    @traced('format_prompt', category='prompt')
+    def _build_batch_prompt(self, candidate_infos: List[Dict[str, str]], job_req_str: str) -> str:
+        """Format one screening prompt covering several candidates (ids C1..CN)"""
+        candidate_blocks = [
+            BATCH_CANDIDATE_TEMPLATE.format(
+                candidate_id=f"C{position}",
+                candidate_name=info['name'],
+                target_role=info['target_role'],
+                years_experience=info['years_experience'],
+                education=info['education'],
+                skills=info['skills'],
+                experience=info['experience'],
+                certifications=info['certifications'],
+                resume_text=info['resume_text']
+            )
+            for position, info in enumerate(candidate_infos, 1)
+        ]
+        
+        return BATCH_RESUME_SCREENING_PROMPT.format(
+            job_requirements=job_req_str,
+            candidates="\n".join(candidate_blocks)
+        )
+    
+    def _apply_batch_response(
+        self, 
+        response: str, 
+        group: List[Dict[str, Any]], 
+        pending: List, 
+        job_req_str: str, 
+        results: List[Optional[Dict[str, Any]]]
+    ):
+        """Match batched results back to candidates by id; missing ones stay None"""
+        payload = extract_json_from_response(response)
+        entries = payload.get('results', []) if isinstance(payload, dict) else payload
+        
+        by_id = {}
+        for entry in entries:
+            if isinstance(entry, dict) and 'match_score' in entry:
+                by_id.setdefault(str(entry.get('candidate_id', '')).strip('[] '), entry)
+        
+        for position, (idx, candidate_info) in enumerate(pending, 1):
+            entry = by_id.get(f"C{position}")
+            if entry is None:
+                print(f"⚠️  Batched screening missed {candidate_info['name']}, screening individually")
+                continue
+            
+            try:
+                entry.pop('candidate_id', None)
+                screening_result = self._validate_and_fix_result(entry, candidate_info['name'])
+            except Exception as e:
+                print(f"⚠️  Invalid batched result for {candidate_info['name']}: {str(e)}")
+                continue
+            
+            if self.cache:
+                self.cache.put(candidate_info, job_req_str, screening_result)
+            results[idx] = self._build_result(screening_result, group[idx], candidate_info)
+    
+    def _to_batch_result(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Unwrap a screen_candidate result into a batch entry"""
+        if result['success']:
+            return result['screening_result']
+        
+        # Include failed screenings with error info
+        return {
+            'candidate_name': result.get('candidate_name', 'Unknown'),
+            'match_score': 0,
+            'error': result.get('error', 'Screening failed'),
+            'recommendation': 'error'
+        }
+    
+    @traced('format_prompt', category='prompt')
+    def _build_prompt(self, candidate_info: Dict[str, str], job_req_str: str) -> str:
+        """Format the screening prompt for one candidate"""
+        return RESUME_SCREENING_PROMPT.format(
+            job_requirements=job_req_str,
+            candidate_name=candidate_info['name'],
+            target_role=candidate_info['target_role'],
+            years_experience=candidate_info['years_experience'],
+            education=candidate_info['education'],
+            skills=candidate_info['skills'],
+            experience=candidate_info['experience'],
+            certifications=candidate_info['certifications'],
+            resume_text=candidate_info['resume_text']
+        )
+    
+    def _parse_response(self, response: str, candidate_name: str) -> Dict[str, Any]:
+        """Parse the LLM response into a validated screening result"""
+        # Extract JSON from response
+        screening_result = extract_json_from_response(response)
+        
+        # Validate and fix screening result
+        return self._validate_and_fix_result(screening_result, candidate_name)
+    
+    def _build_result(
+        self, 
+        screening_result: Dict[str, Any], 
+        candidate: Dict[str, Any], 
+        candidate_info: Dict[str, str]
+    ) -> Dict[str, Any]:
+        """Attach candidate contact details to a screening result"""
+        # Add candidate basic info to result
+        screening_result['candidate_name'] = candidate_info['name']
+        screening_result['candidate_email'] = candidate.get('personalInfo', {}).get('email', '')
+        screening_result['candidate_phone'] = candidate.get('personalInfo', {}).get('phone', '')
+        screening_result['target_role'] = candidate_info['target_role']
+        screening_result['years_experience'] = candidate_info['years_experience']
+        
+        return {
+            'success': True,
+            'screening_result': screening_result
+        }
+    
+    def _candidate_label(self, candidate: Dict[str, Any]) -> str:
+        """Name shown on a candidate's trace span"""
+        personal_info = candidate.get('personalInfo', {})
+        name = f"{personal_info.get('firstName', '')} {personal_info.get('lastName', '')}".strip()
+        return name or candidate.get('folderName', 'Unknown')
+    
+    def _error_result(self, candidate: Dict[str, Any], error: Exception) -> Dict[str, Any]:
+        """Build the failure result returned when screening a candidate fails"""
+        return {
+            'success': False,
+            'error': str(error),
+            'candidate_name': candidate.get('personalInfo', {}).get('firstName', 'Unknown'),
+            'screening_result': None
+        }
+    
     def _validate_and_fix_result(self, result: Dict[str, Any], candidate_name: str) -> Dict[str, Any]:
         """Validate screening result and fix common issues"""
         # Ensure match_score is within valid range
@@ -0,0 +1,21 @@
+# Cache Package
+from .lru_store import LRUFileStore
+from .screening_cache import ScreeningCache
+from .prompt_cache import PromptCache
+from .requirements_cache import (
+    JOB_REQUIREMENTS_FILE,
+    load_job_requirements,
+    save_job_requirements
+)
+from .screening_state import SCREENING_STATE_FILE, JobScreeningState
+
+__all__ = [
+    'LRUFileStore',
+    'ScreeningCache',
+    'PromptCache',
+    'JOB_REQUIREMENTS_FILE',
+    'load_job_requirements',
+    'save_job_requirements',
+    'SCREENING_STATE_FILE',
+    'JobScreeningState'
+]
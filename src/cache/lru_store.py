@@ -0,0 +1,155 @@
+# LRU Store - Size-Bounded On-Disk JSON Entries Shared by the Caches
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Optional, Sequence, Callable
+
+class LRUFileStore:
+    """One JSON file per entry in a folder, evicted least recently used first
+    
+    The in-memory index is rebuilt from the folder on startup, oldest access
+    first; reads touch the entry file so access order survives restarts.
+    Each index entry holds the file size plus the entry fields named in
+    meta_fields, which callers can match on without reading the file.
+    Entries whose created_at is older than ttl_seconds count as misses.
+    """
+    
+    def __init__(
+        self,
+        cache_dir: str,
+        max_bytes: int,
+        meta_fields: Sequence[str] = (),
+        ttl_seconds: Optional[float] = None,
+        label: str = "cache"
+    ):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.meta_fields = tuple(meta_fields)
+        self.ttl_seconds = ttl_seconds
+        self.label = label
+        self._lock = threading.Lock()
+        # key -> {'size', *meta_fields}, oldest access first
+        self._index = OrderedDict()
+        self._total_bytes = 0
+        self._hits = 0
+        self._misses = 0
+        
+        os.makedirs(self.cache_dir, exist_ok=True)
+        self._load_index()
+    
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """The stored entry, or None on a miss, expired or unreadable entry"""
+        with self._lock:
+            meta = self._index.get(key)
+            if meta is None or self._expired(meta):
+                if meta is not None:
+                    self._remove(key)
+                self._misses += 1
+                return None
+            
+            path = self._entry_path(key)
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    entry = json.load(f)
+                os.utime(path)  # Persist access order for the next process
+            except (OSError, json.JSONDecodeError):
+                self._remove(key)
+                self._misses += 1
+                return None
+            
+            self._index.move_to_end(key)
+            self._hits += 1
+            return entry
+    
+    def put(self, key: str, entry: Dict[str, Any]):
+        """Atomically write an entry, evicting old entries if over budget"""
+        payload = json.dumps(entry, ensure_ascii=False)
+        
+        with self._lock:
+            path = self._entry_path(key)
+            # Unique per writer: several worker processes may share the folder
+            tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(payload)
+            os.replace(tmp_path, path)
+            
+            if key in self._index:
+                self._total_bytes -= self._index[key]['size']
+            self._index[key] = self._meta(entry, len(payload.encode('utf-8')))
+            self._index.move_to_end(key)
+            self._total_bytes += self._index[key]['size']
+            
+            self._evict()
+    
+    def remove_where(self, predicate: Callable[[Dict[str, Any]], bool]) -> int:
+        """Remove every entry whose index metadata matches and return how many were removed"""
+        with self._lock:
+            keys = [key for key, meta in self._index.items() if predicate(meta)]
+            for key in keys:
+                self._remove(key)
+            return len(keys)
+    
+    def clear(self) -> int:
+        """Remove every entry and return how many were removed"""
+        return self.remove_where(lambda meta: True)
+    
+    def stats(self) -> Dict[str, Any]:
+        """Current entry count, size and hit rate since startup"""
+        with self._lock:
+            return {
+                'entries': len(self._index),
+                'total_bytes': self._total_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self._hits,
+                'misses': self._misses
+            }
+    
+    def _entry_path(self, key: str) -> str:
+        return os.path.join(self.cache_dir, f"{key}.json")
+    
+    def _meta(self, entry: Dict[str, Any], size: int) -> Dict[str, Any]:
+        return {'size': size, **{field: entry.get(field) for field in self.meta_fields}}
+    
+    def _expired(self, meta: Dict[str, Any]) -> bool:
+        return bool(self.ttl_seconds) and time.time() - (meta.get('created_at') or 0) > self.ttl_seconds
+    
+    def _load_index(self):
+        """Rebuild the in-memory index from disk, oldest access first"""
+        entries = []
+        for file_name in os.listdir(self.cache_dir):
+            path = os.path.join(self.cache_dir, file_name)
+            if file_name.endswith('.tmp'):
+                os.remove(path)  # Leftover from an interrupted write
+                continue
+            if not file_name.endswith('.json'):
+                continue
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    entry = json.load(f)
+                entries.append((os.path.getmtime(path), file_name[:-len('.json')], os.path.getsize(path), entry))
+            except (OSError, json.JSONDecodeError):
+                print(f"⚠️  Dropping unreadable {self.label} entry: {file_name}")
+                os.remove(path)
+        
+        for _, key, size, entry in sorted(entries, key=lambda e: e[0]):
+            self._index[key] = self._meta(entry, size)
+            self._total_bytes += size
+        
+        self._evict()
+    
+    def _evict(self):
+        """Drop least recently used entries until within max_bytes (lock held)"""
+        while self._total_bytes > self.max_bytes and self._index:
+            self._remove(next(iter(self._index)))
+    
+    def _remove(self, key: str):
+        """Delete one entry from disk and index (lock held)"""
+        meta = self._index.pop(key, None)
+        if meta:
+            self._total_bytes -= meta['size']
+        try:
+            os.remove(self._entry_path(key))
+        except FileNotFoundError:
+            pass
@@ -0,0 +1,76 @@
+# Prompt Cache - Records LLM Responses for Replay
+import hashlib
+import time
+from typing import Dict, Any, Optional
+from .lru_store import LRUFileStore
+
+class PromptCache:
+    """Content-addressed on-disk cache of raw LLM responses
+    
+    Entries are keyed by the provider identity (model plus generation
+    settings) and a hash of the exact prompt, so a response is only replayed
+    for an identical request. Entries older than ttl_seconds are treated as
+    misses, and the least recently used entries are evicted once the cache
+    grows beyond max_bytes.
+    """
+    
+    def __init__(self, cache_dir: str, max_bytes: int = 100 * 1024 * 1024, ttl_seconds: Optional[float] = None):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self._store = LRUFileStore(
+            cache_dir, 
+            max_bytes, 
+            meta_fields=('created_at',), 
+            ttl_seconds=ttl_seconds, 
+            label="prompt cache"
+        )
+    
+    @staticmethod
+    def hash_prompt(prompt: str) -> str:
+        """Hash the exact prompt text"""
+        return hashlib.sha256(prompt.encode('utf-8')).hexdigest()
+    
+    def get(self, identity: str, prompt: str) -> Optional[str]:
+        """
+        Look up a recorded response
+        
+        Args:
+            identity: Provider identity (see LLMProvider.cache_identity)
+            prompt: Prompt about to be sent
+        
+        Returns:
+            The recorded response text, or None on a miss or expired entry
+        """
+        key = self._make_key(identity, self.hash_prompt(prompt))
+        entry = self._store.get(key)
+        return entry['response'] if entry is not None else None
+    
+    def put(self, identity: str, prompt: str, response: str):
+        """
+        Record a response, evicting old entries if over budget
+        
+        Args:
+            identity: Provider identity (see LLMProvider.cache_identity)
+            prompt: Prompt that produced the response
+            response: Raw response text
+        """
+        prompt_hash = self.hash_prompt(prompt)
+        key = self._make_key(identity, prompt_hash)
+        self._store.put(key, {
+            'identity': identity,
+            'prompt_hash': prompt_hash,
+            'created_at': time.time(),
+            'response': response
+        })
+    
+    def clear(self) -> int:
+        """Remove every recorded response and return how many were removed"""
+        return self._store.clear()
+    
+    def stats(self) -> Dict[str, Any]:
+        """Current entry count, size and hit rate since startup"""
+        return self._store.stats()
+    
+    def _make_key(self, identity: str, prompt_hash: str) -> str:
+        return hashlib.sha256(f"{identity}:{prompt_hash}".encode('utf-8')).hexdigest()
@@ -0,0 +1,59 @@
+# Requirements Cache - Memoizes Extracted Job Requirements Next to Each Job
+import hashlib
+import json
+import os
+import threading
+from typing import Dict, Any, Optional
+
+JOB_REQUIREMENTS_FILE = "jobRequirements.json"
+
+def hash_job_description(job_description: str) -> str:
+    """Hash job description text, ignoring surrounding whitespace"""
+    return hashlib.sha256(job_description.strip().encode('utf-8')).hexdigest()
+
+def load_job_requirements(job_dir: str, job_description: str) -> Optional[Dict[str, Any]]:
+    """
+    Load memoized job requirements if they were extracted from this exact description
+    
+    Args:
+        job_dir: Job folder (e.g. data/Job1)
+        job_description: Job description text about to be analyzed
+        
+    Returns:
+        Stored job requirements, or None if missing or stale
+    """
+    sidecar_path = os.path.join(job_dir, JOB_REQUIREMENTS_FILE)
+    if not os.path.exists(sidecar_path):
+        return None
+    
+    try:
+        with open(sidecar_path, 'r', encoding='utf-8') as f:
+            sidecar = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"⚠️  Ignoring unreadable {sidecar_path}: {str(e)}")
+        return None
+    
+    if sidecar.get('description_hash') != hash_job_description(job_description):
+        return None
+    
+    return sidecar.get('job_requirements')
+
+def save_job_requirements(job_dir: str, job_description: str, job_requirements: Dict[str, Any]):
+    """
+    Store extracted job requirements next to the job, keyed by description hash
+    
+    Args:
+        job_dir: Job folder (e.g. data/Job1)
+        job_description: Job description text the requirements came from
+        job_requirements: Output of the intake agent
+    """
+    sidecar_path = os.path.join(job_dir, JOB_REQUIREMENTS_FILE)
+    # Unique per writer: background precompute and a shortlist request may save the same job at once
+    tmp_path = f"{sidecar_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump({
+            'description_hash': hash_job_description(job_description),
+            'job_requirements': job_requirements
+        }, f, indent=2, ensure_ascii=False)
+    os.replace(tmp_path, sidecar_path)
@@ -0,0 +1,106 @@
+# Screening Cache - Persists Per-Candidate Screening Results
+import hashlib
+import json
+from typing import Dict, Any, Optional
+from .lru_store import LRUFileStore
+
+class ScreeningCache:
+    """Content-addressed on-disk cache of resume screening results
+    
+    Entries are keyed by a hash of the formatted candidate information and the
+    formatted job requirements, so an entry is reused only while both are
+    unchanged. The least recently used entries are evicted once the cache
+    grows beyond max_bytes.
+    """
+    
+    def __init__(self, cache_dir: str, max_bytes: int = 50 * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self._store = LRUFileStore(
+            cache_dir, 
+            max_bytes, 
+            meta_fields=('candidate_hash', 'requirements_hash'), 
+            label="screening cache"
+        )
+    
+    @staticmethod
+    def hash_candidate(candidate_info: Dict[str, str]) -> str:
+        """Hash the output of format_candidate_info"""
+        payload = json.dumps(candidate_info, sort_keys=True, ensure_ascii=False)
+        return hashlib.sha256(payload.encode('utf-8')).hexdigest()
+    
+    @staticmethod
+    def hash_requirements(requirements_text: str) -> str:
+        """Hash the formatted job requirements"""
+        return hashlib.sha256(requirements_text.encode('utf-8')).hexdigest()
+    
+    def get(self, candidate_info: Dict[str, str], requirements_text: str) -> Optional[Dict[str, Any]]:
+        """
+        Look up a cached screening result
+        
+        Args:
+            candidate_info: Output of format_candidate_info
+            requirements_text: Formatted job requirements
+        
+        Returns:
+            The cached screening result, or None on a miss
+        """
+        key = self._make_key(self.hash_candidate(candidate_info), self.hash_requirements(requirements_text))
+        entry = self._store.get(key)
+        return entry['result'] if entry is not None else None
+    
+    def put(self, candidate_info: Dict[str, str], requirements_text: str, result: Dict[str, Any]):
+        """
+        Store a screening result, evicting old entries if over budget
+        
+        Args:
+            candidate_info: Output of format_candidate_info
+            requirements_text: Formatted job requirements
+            result: Screening result to cache
+        """
+        candidate_hash = self.hash_candidate(candidate_info)
+        requirements_hash = self.hash_requirements(requirements_text)
+        key = self._make_key(candidate_hash, requirements_hash)
+        
+        self._store.put(key, {
+            'candidate_hash': candidate_hash,
+            'requirements_hash': requirements_hash,
+            'result': result
+        })
+    
+    def invalidate(
+        self, 
+        candidate_info: Optional[Dict[str, str]] = None, 
+        requirements_text: Optional[str] = None
+    ) -> int:
+        """
+        Remove cached entries for a candidate, a set of requirements, or both
+        
+        Args:
+            candidate_info: Drop entries for this candidate (any requirements)
+            requirements_text: Drop entries for these requirements (any candidate)
+        
+        Returns:
+            Number of entries removed
+        """
+        if candidate_info is None and requirements_text is None:
+            raise ValueError("Specify candidate_info and/or requirements_text, or use clear()")
+        
+        candidate_hash = self.hash_candidate(candidate_info) if candidate_info is not None else None
+        requirements_hash = self.hash_requirements(requirements_text) if requirements_text is not None else None
+        
+        return self._store.remove_where(
+            lambda meta: (candidate_hash is None or meta['candidate_hash'] == candidate_hash)
+            and (requirements_hash is None or meta['requirements_hash'] == requirements_hash)
+        )
+    
+    def clear(self) -> int:
+        """Remove every cached entry and return how many were removed"""
+        return self._store.clear()
+    
+    def stats(self) -> Dict[str, Any]:
+        """Current entry count, size and hit rate since startup"""
+        return self._store.stats()
+    
+    def _make_key(self, candidate_hash: str, requirements_hash: str) -> str:
+        return hashlib.sha256(f"{candidate_hash}:{requirements_hash}".encode('utf-8')).hexdigest()
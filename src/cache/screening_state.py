@@ -0,0 +1,96 @@
+# Screening State - Remembers Which Applicants a Job Has Already Screened
+import hashlib
+import json
+import os
+import threading
+from typing import Dict, Any, Optional
+
+SCREENING_STATE_FILE = "screeningResults.json"
+
+class JobScreeningState:
+    """Per-job record of screening results keyed by candidate folder
+    
+    Each entry stores a fingerprint of the candidate folder (file names, sizes
+    and modification times) together with its screening result. A candidate
+    only needs screening again when its fingerprint changes or the job
+    requirements it was screened against change.
+    """
+    
+    def __init__(self, job_dir: str, requirements_text: str):
+        self.job_dir = job_dir
+        self.requirements_hash = hashlib.sha256(requirements_text.encode('utf-8')).hexdigest()
+        self.path = os.path.join(job_dir, SCREENING_STATE_FILE)
+        self.entries = self._load()
+    
+    @staticmethod
+    def fingerprint(candidate_dir: str) -> str:
+        """Cheap change detector for a candidate folder based on file metadata"""
+        parts = []
+        for file_name in sorted(os.listdir(candidate_dir)):
+            stat = os.stat(os.path.join(candidate_dir, file_name))
+            parts.append(f"{file_name}:{stat.st_size}:{stat.st_mtime_ns}")
+        return hashlib.sha256("|".join(parts).encode('utf-8')).hexdigest()
+    
+    def candidate_dir(self, candidate: Dict[str, Any]) -> Optional[str]:
+        """Folder of a candidate returned by /api/candidates, if known"""
+        folder_name = candidate.get('folderName')
+        if not folder_name:
+            return None
+        return os.path.join(self.job_dir, "applications", folder_name)
+    
+    def lookup(self, candidate: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Stored screening result for a candidate if its folder is unchanged"""
+        candidate_dir = self.candidate_dir(candidate)
+        if not candidate_dir or not os.path.isdir(candidate_dir):
+            return None
+        
+        entry = self.entries.get(candidate['folderName'])
+        if not entry or entry.get('fingerprint') != self.fingerprint(candidate_dir):
+            return None
+        
+        return entry['screening_result']
+    
+    def record(self, candidate: Dict[str, Any], screening_result: Dict[str, Any]):
+        """Remember a fresh screening result (failed screenings are not kept)"""
+        candidate_dir = self.candidate_dir(candidate)
+        if not candidate_dir or not os.path.isdir(candidate_dir) or 'error' in screening_result:
+            return
+        
+        self.entries[candidate['folderName']] = {
+            'fingerprint': self.fingerprint(candidate_dir),
+            'screening_result': screening_result
+        }
+    
+    def save(self):
+        """Persist results, dropping candidates whose folder no longer exists"""
+        applications_dir = os.path.join(self.job_dir, "applications")
+        entries = {
+            name: entry for name, entry in self.entries.items()
+            if os.path.isdir(os.path.join(applications_dir, name))
+        }
+        
+        tmp_path = f"{self.path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump({
+                'requirements_hash': self.requirements_hash,
+                'candidates': entries
+            }, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, self.path)
+        self.entries = entries
+    
+    def _load(self) -> Dict[str, Any]:
+        """Load stored entries, discarding them if the requirements changed"""
+        if not os.path.exists(self.path):
+            return {}
+        
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+        except (OSError, json.JSONDecodeError) as e:
+            print(f"⚠️  Ignoring unreadable {self.path}: {str(e)}")
+            return {}
+        
+        if state.get('requirements_hash') != self.requirements_hash:
+            return {}
+        
+        return state.get('candidates', {})
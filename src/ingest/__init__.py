@@ -0,0 +1,47 @@
+# Ingest Package
+from .resume_text import (
+    RESUME_FILE,
+    RESUME_TEXT_FILE,
+    ResumeTextError,
+    hash_file,
+    extract_pdf_text,
+    load_resume_text,
+    ensure_resume_text
+)
+from .resume_ingestor import ResumeIngestor
+from .uploads import (
+    FORM_OVERHEAD_BYTES,
+    UploadRejected,
+    RequestSizeLimit,
+    save_upload,
+    save_pdf_upload,
+    remove_stale_uploads
+)
+from .applications import (
+    REQUIRED_FIELDS,
+    ApplicationError,
+    validate_application,
+    save_candidate_folder
+)
+# bulk_import is left out so `python -m src.ingest.bulk_import` runs it cleanly as a script
+
+__all__ = [
+    'RESUME_FILE',
+    'RESUME_TEXT_FILE',
+    'ResumeTextError',
+    'hash_file',
+    'extract_pdf_text',
+    'load_resume_text',
+    'ensure_resume_text',
+    'ResumeIngestor',
+    'FORM_OVERHEAD_BYTES',
+    'UploadRejected',
+    'RequestSizeLimit',
+    'save_upload',
+    'save_pdf_upload',
+    'remove_stale_uploads',
+    'REQUIRED_FIELDS',
+    'ApplicationError',
+    'validate_application',
+    'save_candidate_folder'
+]
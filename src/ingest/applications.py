@@ -0,0 +1,120 @@
+# Applications - Validation and Storage of Candidate Applications
+import itertools
+import json
+import os
+import re
+import shutil
+from datetime import datetime
+from typing import Dict, Any, Tuple, Iterator
+from ..storage.allocation import claim_folder
+
+# Fields every generalInformation.json must have (see candidateInterface.js)
+REQUIRED_FIELDS = ['personalInfo', 'education', 'experience', 'skills', 'targetRole',
+                   'applicationDate', 'status', 'yearsOfExperience']
+REQUIRED_SKILL_FIELDS = ['programming', 'frameworks', 'tools', 'cloud', 'databases', 'testing']
+# Anything but letters, digits, _ and - is dropped from names used as folder names
+UNSAFE_FOLDER_CHARS = re.compile(r'[^\w-]')
+
+class ApplicationError(ValueError):
+    """Raised when an application is incomplete or targets an unknown job"""
+    
+    def __init__(self, message: str, status_code: int = 400):
+        super().__init__(message)
+        self.status_code = status_code
+
+def validate_application(application: Dict[str, Any], data_dir: str = "data") -> Tuple[str, Dict[str, Any]]:
+    """
+    Check an application and shape it for storage
+    
+    Args:
+        application: Application data including jobId
+        data_dir: Folder holding the job folders
+    
+    Returns:
+        Tuple of (job id, generalInformation.json content without jobId and with all skill fields)
+    
+    Raises:
+        ApplicationError: Missing jobId, names or required fields (400), or unknown job (404)
+    """
+    if not isinstance(application, dict):
+        raise ApplicationError("Application must be a JSON object")
+    
+    job_id = application.get('jobId')
+    if not job_id or not isinstance(job_id, str):
+        raise ApplicationError("jobId is required")
+    
+    job_path = os.path.join(data_dir, job_id)
+    if os.path.basename(job_id) != job_id or job_id.startswith('.') or not os.path.isdir(job_path):
+        raise ApplicationError(f"Job '{job_id}' not found", status_code=404)
+    
+    personal_info = application.get('personalInfo', {})
+    if not isinstance(personal_info, dict):
+        raise ApplicationError("personalInfo must be an object")
+    
+    first_name = personal_info.get('firstName', '')
+    last_name = personal_info.get('lastName', '')
+    if not isinstance(first_name, str) or not isinstance(last_name, str):
+        raise ApplicationError("First name and last name must be strings")
+    if not _folder_safe(first_name) or not _folder_safe(last_name):
+        raise ApplicationError("First name and last name are required")
+    
+    # Remove jobId from data before saving (not part of interface)
+    application_to_save = {k: v for k, v in application.items() if k != 'jobId'}
+    
+    for field in REQUIRED_FIELDS:
+        if field not in application_to_save:
+            raise ApplicationError(f"Missing required field: {field}")
+    
+    skills = application_to_save['skills']
+    if not isinstance(skills, dict):
+        raise ApplicationError("skills must be an object")
+    for skill_field in REQUIRED_SKILL_FIELDS:
+        if skill_field not in skills:
+            skills[skill_field] = []
+    
+    return job_id, application_to_save
+
+def candidate_folder_names(first_name: str, last_name: str) -> Iterator[str]:
+    """Folder names to try for a candidate: FirstName_LastName, then with a timestamp, then numbered"""
+    base_name = f"{_folder_safe(first_name)}_{_folder_safe(last_name)}"
+    timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    yield base_name
+    yield f"{base_name}_{timestamp}"
+    for number in itertools.count(2):
+        yield f"{base_name}_{timestamp}_{number}"
+
+def save_candidate_folder(staging_dir: str, job_path: str, application: Dict[str, Any]) -> Tuple[str, str]:
+    """
+    Write generalInformation.json into a staged candidate folder and move it into place
+    
+    The staging folder (already holding resume.pdf, if any) is renamed into
+    job_path/applications in one step, so readers never see a partial
+    candidate, and the rename only succeeds on a free name, so concurrent
+    submissions of the same name never overwrite each other. It is removed
+    if anything fails.
+    
+    Args:
+        staging_dir: Private folder on the same filesystem as job_path
+        job_path: Job folder (e.g. data/Job1)
+        application: Validated generalInformation.json content
+    
+    Returns:
+        Tuple of (candidate folder name, candidate folder path)
+    """
+    try:
+        with open(os.path.join(staging_dir, "generalInformation.json"), 'w', encoding='utf-8') as f:
+            json.dump(application, f, indent=2, ensure_ascii=False)
+        
+        applications_dir = os.path.join(job_path, "applications")
+        candidate_folder_name = claim_folder(
+            staging_dir,
+            applications_dir,
+            candidate_folder_names(application['personalInfo']['firstName'], application['personalInfo']['lastName'])
+        )
+        return candidate_folder_name, os.path.join(applications_dir, candidate_folder_name)
+    finally:
+        shutil.rmtree(staging_dir, ignore_errors=True)
+
+def _folder_safe(name: str) -> str:
+    """Name reduced to letters, digits, _ and - (spaces become _), so it cannot leave applications/"""
+    return UNSAFE_FOLDER_CHARS.sub('', name.strip().replace(" ", "_"))
@@ -0,0 +1,206 @@
+# Bulk Import - Loads Many Applications From an NDJSON File or Zip Archive
+import argparse
+import json
+import os
+import shutil
+import sys
+import uuid
+import zipfile
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, Any, List, Optional, Iterator, Tuple
+from .applications import ApplicationError, validate_application, save_candidate_folder
+from .uploads import is_pdf, PDF_MAGIC_WINDOW, UPLOAD_CHUNK_SIZE
+
+# Manifest looked up inside a zip archive
+MANIFEST_NAMES = ('applications.ndjson', 'applications.jsonl')
+
+def import_applications(
+    archive_path: str,
+    data_dir: str = "data",
+    staging_root: Optional[str] = None,
+    default_job_id: Optional[str] = None,
+    max_workers: int = 8,
+    max_resume_bytes: int = 10 * 1024 * 1024,
+    index=None
+) -> Dict[str, Any]:
+    """
+    Import every application in an archive, validating each like /api/submit-application
+    
+    Archive formats:
+    - .ndjson / .jsonl: one application per line, the same JSON as submit-application's applicationData
+    - .zip: an applications.ndjson (or .jsonl) manifest plus resume PDFs; a record
+      names its PDF with "resumeFile" (path inside the zip)
+    
+    Candidate folders are written in parallel, each staged and renamed into
+    place, and the candidate index is updated once per job at the end.
+    
+    Args:
+        archive_path: NDJSON file or zip archive
+        data_dir: Folder holding the job folders
+        staging_root: Where candidate folders are assembled (default: data_dir/.uploads)
+        default_job_id: jobId for records that do not name one
+        max_workers: Candidate folders written at once
+        max_resume_bytes: Largest resume accepted per record
+        index: CandidateIndex to update (optional)
+    
+    Returns:
+        Report with total/imported/failed counts and a result per record
+        ({record, status, jobId, candidateId, error}, in archive order)
+    """
+    staging_root = staging_root or os.path.join(data_dir, ".uploads")
+    os.makedirs(staging_root, exist_ok=True)
+    
+    archive = zipfile.ZipFile(archive_path) if zipfile.is_zipfile(archive_path) else None
+    try:
+        records = list(_read_records(archive_path, archive))
+        
+        def run(record: Tuple[int, Any]) -> Dict[str, Any]:
+            record_no, application = record
+            return _import_record(record_no, application, archive, data_dir, staging_root,
+                                  default_job_id, max_resume_bytes)
+        
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as executor:
+            results = list(executor.map(run, records))
+    finally:
+        if archive is not None:
+            archive.close()
+    
+    imported = [result for result in results if result['status'] == 'imported']
+    if index is not None:
+        by_job = defaultdict(list)
+        for result in imported:
+            by_job[result['jobId']].append((result['candidateId'], result.pop('application')))
+        for job_id, entries in by_job.items():
+            index.add_candidates(job_id, entries)
+    
+    for result in results:
+        result.pop('application', None)
+    
+    return {
+        'total': len(results),
+        'imported': len(imported),
+        'failed': len(results) - len(imported),
+        'results': results
+    }
+
+def _read_records(archive_path: str, archive: Optional[zipfile.ZipFile]) -> Iterator[Tuple[int, Any]]:
+    """(line number, parsed application or ApplicationError) for every non-blank manifest line"""
+    if archive is not None:
+        manifest = next((name for name in archive.namelist() if os.path.basename(name) in MANIFEST_NAMES), None)
+        if manifest is None:
+            raise ApplicationError(f"Zip archive has no {' or '.join(MANIFEST_NAMES)} manifest")
+        lines = (line.decode('utf-8') for line in archive.open(manifest))
+    else:
+        lines = open(archive_path, 'r', encoding='utf-8')
+    
+    try:
+        for line_no, line in enumerate(lines, 1):
+            if not line.strip():
+                continue
+            try:
+                yield line_no, json.loads(line)
+            except json.JSONDecodeError as e:
+                yield line_no, ApplicationError(f"Invalid JSON data: {str(e)}")
+    finally:
+        lines.close()
+
+def _import_record(
+    record_no: int,
+    application: Any,
+    archive: Optional[zipfile.ZipFile],
+    data_dir: str,
+    staging_root: str,
+    default_job_id: Optional[str],
+    max_resume_bytes: int
+) -> Dict[str, Any]:
+    """Validate and store one application; never raises"""
+    result = {'record': record_no, 'status': 'failed', 'jobId': None, 'candidateId': None, 'error': None}
+    staging_dir = None
+    try:
+        if isinstance(application, Exception):
+            raise application
+        if isinstance(application, dict):
+            application = dict(application)
+            if default_job_id and not application.get('jobId'):
+                application['jobId'] = default_job_id
+            resume_file = application.pop('resumeFile', None)
+            result['jobId'] = application.get('jobId')
+        else:
+            resume_file = None
+        
+        job_id, application_to_save = validate_application(application, data_dir)
+        result['jobId'] = job_id
+        
+        staging_dir = os.path.join(staging_root, uuid.uuid4().hex)
+        os.makedirs(staging_dir)
+        if resume_file:
+            _copy_resume(archive, resume_file, os.path.join(staging_dir, "resume.pdf"), max_resume_bytes)
+        
+        folder_name, _ = save_candidate_folder(staging_dir, os.path.join(data_dir, job_id), application_to_save)
+        result.update({'status': 'imported', 'candidateId': folder_name, 'application': application_to_save})
+    except Exception as e:
+        result['error'] = str(e)
+        if staging_dir:
+            shutil.rmtree(staging_dir, ignore_errors=True)
+    return result
+
+def _copy_resume(archive: Optional[zipfile.ZipFile], member: str, dest_path: str, max_bytes: int):
+    """Copy a resume PDF out of the zip archive, checking its size and PDF marker"""
+    if archive is None:
+        raise ApplicationError("resumeFile needs a zip archive holding the PDF")
+    try:
+        info = archive.getinfo(member)
+    except KeyError:
+        raise ApplicationError(f"Resume file '{member}' not found in archive")
+    if info.file_size > max_bytes:
+        raise ApplicationError(f"Resume is larger than {max_bytes / (1024 * 1024):g} MB", status_code=413)
+    
+    with archive.open(info) as src, open(dest_path, 'wb') as dst:
+        head = src.read(PDF_MAGIC_WINDOW)
+        if not is_pdf(head):
+            raise ApplicationError("Resume must be a PDF file")
+        dst.write(head)
+        shutil.copyfileobj(src, dst, UPLOAD_CHUNK_SIZE)
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Command line entry point: python -m src.ingest.bulk_import ARCHIVE [--job JobN]"""
+    from ..storage import CandidateIndex
+    
+    parser = argparse.ArgumentParser(description="Import applications from an NDJSON file or zip archive")
+    parser.add_argument("archive", help="NDJSON file, or zip with applications.ndjson and resume PDFs")
+    parser.add_argument("--job", dest="job_id", help="jobId for records that do not name one")
+    parser.add_argument("--data-dir", default="data", help="Data folder (default: data)")
+    parser.add_argument("--workers", type=int, default=8, help="Candidate folders written at once (default: 8)")
+    parser.add_argument("--max-resume-mb", type=int, default=10, help="Largest resume accepted (default: 10)")
+    parser.add_argument("--index-db", help="SQLite candidate index to update (CANDIDATE_INDEX_DB)")
+    args = parser.parse_args(argv)
+    
+    index = None
+    if args.index_db:
+        index = CandidateIndex(args.data_dir, sqlite_path=args.index_db)
+        index.load()
+    
+    try:
+        report = import_applications(
+            args.archive,
+            data_dir=args.data_dir,
+            default_job_id=args.job_id,
+            max_workers=args.workers,
+            max_resume_bytes=args.max_resume_mb * 1024 * 1024,
+            index=index
+        )
+    except (ApplicationError, OSError, zipfile.BadZipFile) as e:
+        print(f"❌ Import failed: {str(e)}")
+        return 1
+    
+    for result in report['results']:
+        if result['status'] == 'failed':
+            print(f"❌ Record {result['record']}: {result['error']}")
+    print(f"✅ Imported {report['imported']} of {report['total']} applications ({report['failed']} failed)")
+    print("   A running server picks them up within CANDIDATE_INDEX_REVALIDATE_SECONDS; "
+          "POST /api/reindex to refresh it right away")
+    return 0 if report['failed'] == 0 else 1
+
+if __name__ == "__main__":
+    sys.exit(main())
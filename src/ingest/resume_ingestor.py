@@ -0,0 +1,77 @@
+# Resume Ingestor - Background Resume Text Extraction for New Applications
+import asyncio
+import os
+from typing import Dict, Any, List, Optional
+from .resume_text import ensure_resume_text
+
+class ResumeIngestor:
+    """Extracts resume text off the request path, at most once per PDF
+    
+    submit() schedules extraction right after an application is saved, so
+    the upload returns immediately. attach_resume_text() gives the shortlist
+    pipeline each candidate's text, waiting for extractions still in flight
+    and backfilling candidates that were saved before ingestion existed.
+    Extraction runs in worker threads, max_workers at a time.
+    """
+    
+    def __init__(self, max_workers: int = 2):
+        self.max_workers = max(1, max_workers)
+        self._semaphore = None
+        self._in_flight = {}  # candidate folder -> asyncio.Task
+    
+    def submit(self, candidate_dir: str, pdf_hash: Optional[str] = None) -> asyncio.Task:
+        """
+        Queue text extraction for a candidate folder; must be called from the event loop
+        
+        Args:
+            candidate_dir: Candidate folder holding resume.pdf
+            pdf_hash: SHA-256 of resume.pdf if already known
+        
+        Returns:
+            The task resolving to the extracted text (or None)
+        """
+        task = self._in_flight.get(candidate_dir)
+        if task is not None and not task.done():
+            return task
+        
+        task = asyncio.create_task(self._extract(candidate_dir, pdf_hash))
+        self._in_flight[candidate_dir] = task
+        task.add_done_callback(lambda done: self._forget(candidate_dir, done))
+        return task
+    
+    async def attach_resume_text(self, job_dir: str, candidates: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Copies of candidates with their extracted resume text as resumeText
+        
+        Args:
+            job_dir: Job folder (e.g. data/Job1)
+            candidates: Candidates with folderName, as from the candidate index
+        
+        Returns:
+            New candidate dicts in the same order; resumeText is left out when there is none
+        """
+        texts = await asyncio.gather(*(
+            self.submit(os.path.join(job_dir, "applications", candidate.get('folderName', '')))
+            for candidate in candidates
+        ))
+        
+        return [
+            {**candidate, 'resumeText': text} if text else candidate
+            for candidate, text in zip(candidates, texts)
+        ]
+    
+    async def _extract(self, candidate_dir: str, pdf_hash: Optional[str]) -> Optional[str]:
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_workers)
+        
+        async with self._semaphore:
+            try:
+                return await asyncio.to_thread(ensure_resume_text, candidate_dir, pdf_hash)
+            except Exception as e:
+                # One unreadable resume must not fail the shortlist; the candidate is screened without text
+                print(f"⚠️  Resume text extraction failed for {candidate_dir}: {type(e).__name__}: {str(e)}")
+                return None
+    
+    def _forget(self, candidate_dir: str, task: asyncio.Task):
+        if self._in_flight.get(candidate_dir) is task:
+            del self._in_flight[candidate_dir]
@@ -0,0 +1,131 @@
+# Resume Text - Extracts Resume PDF Text Once Into a Sidecar Next to the Candidate
+import hashlib
+import json
+import os
+import re
+import threading
+from typing import Dict, Any, Optional
+
+try:
+    from pypdf import PdfReader
+except ImportError:  # Optional: without pypdf candidates are screened on generalInformation.json alone
+    PdfReader = None
+
+RESUME_FILE = "resume.pdf"
+RESUME_TEXT_FILE = "resumeText.json"
+# Longest text kept in the sidecar; prompts use a shorter excerpt
+MAX_RESUME_TEXT_CHARS = 20000
+
+class ResumeTextError(Exception):
+    """Raised when a resume PDF cannot be read"""
+    pass
+
+def hash_file(path: str) -> str:
+    """SHA-256 of a file's bytes, read in chunks"""
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for chunk in iter(lambda: f.read(1024 * 1024), b''):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+def compact_text(text: str) -> str:
+    """Collapse the runs of spaces and blank lines PDF extraction leaves behind"""
+    lines = (re.sub(r'[ \t\u00a0]+', ' ', line).strip() for line in text.splitlines())
+    return '\n'.join(line for line in lines if line)
+
+def extract_pdf_text(pdf_path: str) -> str:
+    """
+    Extract the plain text of a PDF
+    
+    Args:
+        pdf_path: Path to the PDF file
+    
+    Returns:
+        Compacted text of all pages, truncated to MAX_RESUME_TEXT_CHARS
+    """
+    if PdfReader is None:
+        raise ResumeTextError("pypdf is not installed")
+    
+    try:
+        reader = PdfReader(pdf_path)
+        pages = [page.extract_text() or '' for page in reader.pages]
+    except Exception as e:
+        raise ResumeTextError(f"Could not read {pdf_path}: {str(e)}") from e
+    
+    return compact_text('\n'.join(pages))[:MAX_RESUME_TEXT_CHARS]
+
+def load_resume_text(candidate_dir: str) -> Optional[Dict[str, Any]]:
+    """
+    Load the extracted text sidecar if it still belongs to the current resume.pdf
+    
+    The PDF is only re-hashed when its size or modification time changed
+    since extraction.
+    
+    Args:
+        candidate_dir: Candidate folder (e.g. data/Job1/applications/Mark_Pakin)
+    
+    Returns:
+        The sidecar ({pdf_sha256, text, error, ...}), or None if missing or stale
+    """
+    pdf_path = os.path.join(candidate_dir, RESUME_FILE)
+    sidecar_path = os.path.join(candidate_dir, RESUME_TEXT_FILE)
+    if not os.path.exists(sidecar_path) or not os.path.exists(pdf_path):
+        return None
+    
+    try:
+        with open(sidecar_path, 'r', encoding='utf-8') as f:
+            sidecar = json.load(f)
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"⚠️  Ignoring unreadable {sidecar_path}: {str(e)}")
+        return None
+    
+    stat = os.stat(pdf_path)
+    if sidecar.get('pdf_size') == stat.st_size and sidecar.get('pdf_mtime_ns') == stat.st_mtime_ns:
+        return sidecar
+    
+    if sidecar.get('pdf_sha256') != hash_file(pdf_path):
+        return None
+    return sidecar
+
+def ensure_resume_text(candidate_dir: str, pdf_hash: Optional[str] = None) -> Optional[str]:
+    """
+    Text of a candidate's resume, extracting it into the sidecar on first use
+    
+    Args:
+        candidate_dir: Candidate folder holding resume.pdf
+        pdf_hash: SHA-256 of resume.pdf if already known (saves re-reading it)
+    
+    Returns:
+        The extracted text, or None if there is no readable resume
+    """
+    sidecar = load_resume_text(candidate_dir)
+    if sidecar is not None:
+        return sidecar.get('text') or None
+    
+    pdf_path = os.path.join(candidate_dir, RESUME_FILE)
+    if not os.path.exists(pdf_path):
+        return None
+    
+    stat = os.stat(pdf_path)
+    sidecar = {
+        'pdf_sha256': pdf_hash or hash_file(pdf_path),
+        'pdf_size': stat.st_size,
+        'pdf_mtime_ns': stat.st_mtime_ns,
+        'text': '',
+        'error': None
+    }
+    try:
+        sidecar['text'] = extract_pdf_text(pdf_path)
+    except ResumeTextError as e:
+        if PdfReader is None:
+            return None  # Nothing stored, so resumes are extracted once pypdf is installed
+        print(f"⚠️  {str(e)}")
+        sidecar['error'] = str(e)  # Stored so a broken PDF is not parsed again on every run
+    
+    sidecar_path = os.path.join(candidate_dir, RESUME_TEXT_FILE)
+    tmp_path = f"{sidecar_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(sidecar, f, ensure_ascii=False)
+    os.replace(tmp_path, sidecar_path)
+    
+    return sidecar['text'] or None
@@ -0,0 +1,194 @@
+# Uploads - Streams Resume Uploads to Disk With Size, Type and Hash Checks
+import asyncio
+import hashlib
+import json
+import os
+import shutil
+import time
+from typing import Dict, Optional, Tuple
+
+# Every PDF carries this marker within its first 1024 bytes
+PDF_MAGIC = b'%PDF-'
+PDF_MAGIC_WINDOW = 1024
+UPLOAD_CHUNK_SIZE = 1024 * 1024
+# Room for the other form fields next to the file in a multipart request
+FORM_OVERHEAD_BYTES = 1024 * 1024
+
+class UploadRejected(ValueError):
+    """Raised when an upload is too large or not the expected file type"""
+    
+    def __init__(self, message: str, status_code: int = 400):
+        super().__init__(message)
+        self.status_code = status_code
+
+def is_pdf(head: bytes) -> bool:
+    """True if the first bytes of a file carry the PDF marker"""
+    return PDF_MAGIC in head[:PDF_MAGIC_WINDOW]
+
+async def save_upload(
+    upload,
+    dest_path: str,
+    max_bytes: int,
+    label: str = 'Upload',
+    magic: Optional[bytes] = None,
+    type_name: str = '',
+    chunk_size: int = UPLOAD_CHUNK_SIZE
+) -> Tuple[int, str]:
+    """
+    Copy an uploaded file to dest_path chunk by chunk
+    
+    Reads and writes run in worker threads so large uploads do not hold up
+    the event loop. The SHA-256 is computed along the way, and the copy
+    stops as soon as the upload exceeds max_bytes.
+    
+    Args:
+        upload: FastAPI UploadFile
+        dest_path: File to write (normally inside a staging folder)
+        max_bytes: Largest accepted upload
+        label: Name of the upload in error messages, e.g. "Resume"
+        magic: Marker required within the first 1024 bytes (optional)
+        type_name: File type named when the marker is missing, e.g. "PDF"
+        chunk_size: Bytes read per step
+    
+    Returns:
+        Tuple of (size in bytes, SHA-256 hex digest)
+    
+    Raises:
+        UploadRejected: Upload is empty, too large (413) or lacks the marker
+    """
+    too_large = f"{label} is larger than {max_bytes / (1024 * 1024):g} MB"
+    if getattr(upload, 'size', None) and upload.size > max_bytes:
+        raise UploadRejected(too_large, status_code=413)
+    
+    digest = hashlib.sha256()
+    size = 0
+    head = b''
+    
+    with open(dest_path, 'wb') as f:
+        while True:
+            chunk = await upload.read(chunk_size)
+            if not chunk:
+                break
+            
+            size += len(chunk)
+            if size > max_bytes:
+                raise UploadRejected(too_large, status_code=413)
+            
+            if magic and len(head) < PDF_MAGIC_WINDOW:
+                head += chunk[:PDF_MAGIC_WINDOW - len(head)]
+                if len(head) >= PDF_MAGIC_WINDOW and magic not in head:
+                    raise UploadRejected(f"{label} must be a {type_name} file")
+            
+            digest.update(chunk)
+            await asyncio.to_thread(f.write, chunk)
+    
+    if size == 0:
+        raise UploadRejected(f"{label} file is empty")
+    if magic and magic not in head:
+        raise UploadRejected(f"{label} must be a {type_name} file")
+    
+    return size, digest.hexdigest()
+
+async def save_pdf_upload(upload, dest_path: str, max_bytes: int, chunk_size: int = UPLOAD_CHUNK_SIZE) -> Tuple[int, str]:
+    """save_upload for resumes: must be a PDF (checked by content, not file name)"""
+    return await save_upload(
+        upload, dest_path, max_bytes, label='Resume', magic=PDF_MAGIC, type_name='PDF', chunk_size=chunk_size
+    )
+
+class RequestSizeLimit:
+    """ASGI middleware capping request bodies per path before they are spooled
+    
+    The framework reads the whole multipart body into a temporary file
+    before an endpoint runs, so save_upload's own limit alone would only
+    apply after an oversized upload had been fully received. This rejects
+    a request whose Content-Length is over the limit without reading it,
+    and stops reading a body (e.g. chunked, without Content-Length) as soon
+    as it grows past the limit, answering 413 in both cases.
+    """
+    
+    def __init__(self, app, limits: Dict[str, int]):
+        self.app = app
+        self.limits = limits
+    
+    async def __call__(self, scope, receive, send):
+        max_bytes = self.limits.get(scope.get('path')) if scope['type'] == 'http' else None
+        if max_bytes is None:
+            await self.app(scope, receive, send)
+            return
+        
+        content_length = dict(scope['headers']).get(b'content-length', b'')
+        if content_length.isdigit() and int(content_length) > max_bytes:
+            await self._reject(send, max_bytes)
+            return
+        
+        received = 0
+        too_large = False
+        rejected = False
+        
+        async def limited_receive():
+            nonlocal received, too_large
+            message = await receive()
+            if message['type'] == 'http.request':
+                received += len(message.get('body', b''))
+                if received > max_bytes:
+                    too_large = True
+                    raise UploadRejected("Request body too large", status_code=413)
+            return message
+        
+        async def guarded_send(message):
+            nonlocal rejected
+            # The framework answers the aborted read with its own error; replace it with the 413
+            if not too_large:
+                await send(message)
+            elif message['type'] == 'http.response.start' and not rejected:
+                rejected = True
+                await self._reject(send, max_bytes)
+        
+        try:
+            await self.app(scope, limited_receive, guarded_send)
+        except UploadRejected:
+            if not too_large:
+                raise
+            if not rejected:
+                await self._reject(send, max_bytes)
+    
+    @staticmethod
+    async def _reject(send, max_bytes: int):
+        body = json.dumps({
+            "success": False,
+            "error": f"Upload is larger than {max_bytes / (1024 * 1024):g} MB"
+        }).encode('utf-8')
+        await send({
+            'type': 'http.response.start',
+            'status': 413,
+            'headers': [(b'content-type', b'application/json'), (b'content-length', str(len(body)).encode('ascii'))]
+        })
+        await send({'type': 'http.response.body', 'body': body})
+
+def remove_stale_uploads(staging_dir: str, max_age_seconds: float = 3600) -> int:
+    """
+    Delete staging folders and files (import archives) left behind by uploads interrupted by a crash
+    
+    Entries younger than max_age_seconds are kept, since another worker
+    process may still be writing them.
+    
+    Returns:
+        Number of folders and files removed
+    """
+    if not os.path.isdir(staging_dir):
+        return 0
+    
+    removed = 0
+    cutoff = time.time() - max_age_seconds
+    for name in os.listdir(staging_dir):
+        path = os.path.join(staging_dir, name)
+        try:
+            if os.path.getmtime(path) < cutoff:
+                if os.path.isdir(path):
+                    shutil.rmtree(path, ignore_errors=True)
+                else:
+                    os.remove(path)
+                removed += 1
+        except OSError:
+            continue
+    return removed
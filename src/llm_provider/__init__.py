@@ -1,4 +1,8 @@
 # LLM Provider Package
+from .base_provider import LLMProvider
 from .gemini_provider import GeminiProvider
+from .mock_provider import MockProvider
+from .caching_provider import CachingProvider, PromptCacheMiss
+from .rate_limiter import RateLimiter, AdaptiveConcurrency
 
-__all__ = ['GeminiProvider']
+__all__ = ['LLMProvider', 'GeminiProvider', 'MockProvider', 'CachingProvider', 'PromptCacheMiss', 'RateLimiter', 'AdaptiveConcurrency']
@@ -0,0 +1,33 @@
+# LLM Provider Interface
+import asyncio
+from abc import ABC, abstractmethod
+
+class LLMProvider(ABC):
+    """Interface every LLM backend implements for the agents
+    
+    Providers return the model's raw JSON text; agents parse it. Async callers
+    get a thread-offloaded fallback unless a provider has a native client.
+    """
+    
+    model_name = 'unknown'
+    
+    @classmethod
+    def cache_identity(cls) -> str:
+        """Model and generation settings that determine a response, for prompt caching"""
+        return cls.model_name
+    
+    @abstractmethod
+    def generate_json_response(self, prompt: str, max_retries: int = 3) -> str:
+        """Generate JSON formatted response with retry logic
+        
+        Args:
+            prompt: The prompt to send to the model
+            max_retries: Maximum number of retry attempts (default: 3)
+            
+        Returns:
+            JSON string response from the model
+        """
+    
+    async def generate_json_response_async(self, prompt: str, max_retries: int = 3) -> str:
+        """Async variant of generate_json_response"""
+        return await asyncio.to_thread(self.generate_json_response, prompt, max_retries)
@@ -0,0 +1,64 @@
+# Caching Provider - Record-and-Replay Wrapper Around Any LLM Provider
+from typing import Optional
+from .base_provider import LLMProvider
+from ..cache import PromptCache
+from ..metrics import record_llm_call
+
+class PromptCacheMiss(LookupError):
+    """Raised in replay-only mode when a prompt has no recorded response"""
+
+class CachingProvider(LLMProvider):
+    """Serves repeated prompts from a PromptCache instead of the wrapped provider
+    
+    In record mode misses go to the wrapped provider and successful responses
+    are stored. In replay-only mode the wrapped provider is never called (it
+    may be None) and a miss raises PromptCacheMiss, which makes runs fully
+    deterministic and offline.
+    """
+    
+    def __init__(
+        self, 
+        provider: Optional[LLMProvider], 
+        cache: PromptCache, 
+        identity: Optional[str] = None, 
+        replay_only: bool = False
+    ):
+        if provider is None and not replay_only:
+            raise ValueError("A provider is required unless replay_only is set")
+        
+        self.provider = provider
+        self.cache = cache
+        self.identity = identity or provider.cache_identity()
+        self.replay_only = replay_only
+        self.model_name = provider.model_name if provider else self.identity
+    
+    def cache_identity(self) -> str:
+        return self.identity
+    
+    def generate_json_response(self, prompt: str, max_retries: int = 3) -> str:
+        recorded = self._lookup(prompt)
+        if recorded is not None:
+            return recorded
+        
+        response = self.provider.generate_json_response(prompt, max_retries=max_retries)
+        self.cache.put(self.identity, prompt, response)
+        return response
+    
+    async def generate_json_response_async(self, prompt: str, max_retries: int = 3) -> str:
+        recorded = self._lookup(prompt)
+        if recorded is not None:
+            return recorded
+        
+        response = await self.provider.generate_json_response_async(prompt, max_retries=max_retries)
+        self.cache.put(self.identity, prompt, response)
+        return response
+    
+    def _lookup(self, prompt: str) -> Optional[str]:
+        """Recorded response, or None when the wrapped provider should be called"""
+        recorded = self.cache.get(self.identity, prompt)
+        if recorded is not None:
+            record_llm_call(self.model_name, 0.0, True, cached=True)
+        elif self.replay_only:
+            record_llm_call(self.model_name, 0.0, False)
+            raise PromptCacheMiss(f"No recorded response for prompt {PromptCache.hash_prompt(prompt)[:12]} ({self.identity})")
+        return recorded
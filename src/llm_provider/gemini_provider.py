@@ -2,21 +2,55 @@
 from google import genai
 from google.genai import types
 import os
-from typing import Optional
+import asyncio
+import time
+from typing import Optional, Dict, Any
 from dotenv import load_dotenv
 import json
+import re
+from .base_provider import LLMProvider
+from .rate_limiter import RateLimiter, AdaptiveConcurrency, is_throttling_error, backoff_delay
+from ..metrics import record_llm_call, usage_tokens
 
 # Load environment variables
 load_dotenv()
 
-class GeminiProvider:
-    def __init__(self, api_key: Optional[str] = None):
-        """Initialize Gemini API"""
+# Rough output size reserved against the tokens-per-minute budget before a call
+ESTIMATED_OUTPUT_TOKENS = 1024
+
+class GeminiProvider(LLMProvider):
+    model_name = 'models/gemini-2.5-flash'
+    generation_settings = {
+        'temperature': 0.0,  # Zero temperature for deterministic output
+        'max_output_tokens': 8192  # Increased for detailed reasoning
+    }
+    
+    def __init__(
+        self, 
+        api_key: Optional[str] = None, 
+        max_concurrent_requests: int = 8, 
+        requests_per_minute: Optional[int] = None, 
+        tokens_per_minute: Optional[int] = None
+    ):
+        """Initialize Gemini API
+        
+        Args:
+            api_key: Gemini API key (default: GEMINI_API_KEY environment variable)
+            max_concurrent_requests: Global cap on in-flight requests shared by every agent and run
+            requests_per_minute: Request budget shared by every caller (default: unlimited)
+            tokens_per_minute: Token budget shared by every caller (default: unlimited)
+        """
         self.api_key = api_key or os.getenv("GEMINI_API_KEY")
         if not self.api_key:
             raise ValueError("Gemini API key not found. Set GEMINI_API_KEY environment variable.")
         
         self.client = genai.Client(api_key=self.api_key)
+        
+        # Shared by every agent using this provider: rate budget, and a concurrency
+        # limit that shrinks when Gemini throttles and grows back on success
+        self.max_concurrent_requests = max(1, max_concurrent_requests)
+        self.rate_limiter = RateLimiter(requests_per_minute, tokens_per_minute)
+        self.concurrency = AdaptiveConcurrency(self.max_concurrent_requests)
     
     def generate_json_response(self, prompt: str, max_retries: int = 3) -> str:
         """Generate JSON formatted response with retry logic
@@ -29,39 +63,155 @@ class GeminiProvider:
             JSON string response from the model
         """
         last_error = None
+        estimated_tokens = self._estimate_tokens(prompt)
+        call = self._start_call()
         
         for attempt in range(max_retries):
+            if attempt > 0:
+                time.sleep(self._retry_delay(attempt, last_error))
+            
+            self.rate_limiter.acquire(estimated_tokens)
+            self.concurrency.acquire()
             try:
                 response = self.client.models.generate_content(
-                    model='models/gemini-2.5-flash',
+                    model=self.model_name,
                     contents=prompt,
-                    config=types.GenerateContentConfig(
-                        temperature=0.0,  # Zero temperature for deterministic output
-                        max_output_tokens=8192,  # Increased for detailed reasoning
-                    )
+                    config=self._generation_config()
                 )
-                
-                # Validate response is not empty
-                if not response.text or response.text.strip() == "":
-                    raise ValueError("Empty response from model")
-                
-                # Validate JSON structure
-                try:
-                    json.loads(response.text)
-                except json.JSONDecodeError:
-                    # Try to extract JSON from response
-                    import re
-                    json_match = re.search(r'\{.*\}', response.text, re.DOTALL)
-                    if json_match:
-                        json.loads(json_match.group(0))  # Validate it's valid JSON
-                
-                return response.text
-                
             except Exception as e:
                 last_error = e
-                if attempt < max_retries - 1:
-                    print(f"⚠️  Attempt {attempt + 1}/{max_retries} failed: {str(e)}")
-                    print("   Retrying...")
+                self._on_failure(e, estimated_tokens, call)
+                self._log_retry(attempt, max_retries, e)
                 continue
+            finally:
+                self.concurrency.release()
+            
+            self._on_success(response, estimated_tokens, call)
+            try:
+                text = self._validate_response(response)
+                self._finish_call(call, attempt + 1, success=True)
+                return text
+            except Exception as e:
+                last_error = e
+                self._log_retry(attempt, max_retries, e)
         
+        self._finish_call(call, max_retries, success=False)
         raise Exception(f"Error generating JSON response after {max_retries} attempts: {str(last_error)}")
+    
+    async def generate_json_response_async(self, prompt: str, max_retries: int = 3) -> str:
+        """Async variant of generate_json_response using the non-blocking client
+        
+        Args:
+            prompt: The prompt to send to the model
+            max_retries: Maximum number of retry attempts (default: 3)
+            
+        Returns:
+            JSON string response from the model
+        """
+        last_error = None
+        estimated_tokens = self._estimate_tokens(prompt)
+        call = self._start_call()
+        
+        for attempt in range(max_retries):
+            if attempt > 0:
+                await asyncio.sleep(self._retry_delay(attempt, last_error))
+            
+            await self.rate_limiter.acquire_async(estimated_tokens)
+            await self.concurrency.acquire_async()
+            try:
+                response = await self.client.aio.models.generate_content(
+                    model=self.model_name,
+                    contents=prompt,
+                    config=self._generation_config()
+                )
+            except Exception as e:
+                last_error = e
+                self._on_failure(e, estimated_tokens, call)
+                self._log_retry(attempt, max_retries, e)
+                continue
+            finally:
+                await self.concurrency.release_async()
+            
+            self._on_success(response, estimated_tokens, call)
+            try:
+                text = self._validate_response(response)
+                self._finish_call(call, attempt + 1, success=True)
+                return text
+            except Exception as e:
+                last_error = e
+                self._log_retry(attempt, max_retries, e)
+        
+        self._finish_call(call, max_retries, success=False)
+        raise Exception(f"Error generating JSON response after {max_retries} attempts: {str(last_error)}")
+    
+    def _estimate_tokens(self, prompt: str) -> int:
+        """Prompt tokens (~4 characters each) plus the expected output"""
+        return len(prompt) // 4 + ESTIMATED_OUTPUT_TOKENS
+    
+    def _retry_delay(self, attempt: int, error: Optional[Exception]) -> float:
+        """Backoff before retry number attempt; throttling backs off harder"""
+        if error is not None and is_throttling_error(error):
+            return backoff_delay(attempt - 1, base_delay=2.0, max_delay=60.0)
+        return backoff_delay(attempt - 1, base_delay=0.5, max_delay=8.0)
+    
+    def _on_success(self, response, estimated_tokens: int, call: Dict[str, Any]):
+        """Grow concurrency back and settle the token budget with the real usage"""
+        self.concurrency.on_success()
+        usage = getattr(response, 'usage_metadata', None)
+        self.rate_limiter.record_usage(estimated_tokens, getattr(usage, 'total_token_count', None))
+        
+        for key, count in usage_tokens(response).items():
+            call[key] += count
+    
+    def _on_failure(self, error: Exception, estimated_tokens: int, call: Dict[str, Any]):
+        """Shrink concurrency when throttled; a rejected request used no tokens"""
+        if is_throttling_error(error):
+            call['throttled'] += 1
+            self.concurrency.on_throttle()
+            self.rate_limiter.record_usage(estimated_tokens, 0)
+    
+    def _start_call(self) -> Dict[str, Any]:
+        """Per-call accounting across retries, reported to the metrics on completion"""
+        return {'started': time.monotonic(), 'throttled': 0, 'prompt_tokens': 0, 'output_tokens': 0}
+    
+    def _finish_call(self, call: Dict[str, Any], attempts: int, success: bool):
+        record_llm_call(
+            self.model_name,
+            time.monotonic() - call['started'],
+            success,
+            attempts=attempts,
+            throttled=call['throttled'],
+            prompt_tokens=call['prompt_tokens'],
+            output_tokens=call['output_tokens']
+        )
+    
+    @classmethod
+    def cache_identity(cls) -> str:
+        return json.dumps({'model': cls.model_name, **cls.generation_settings}, sort_keys=True)
+    
+    def _generation_config(self) -> types.GenerateContentConfig:
+        """Shared generation settings for every request"""
+        return types.GenerateContentConfig(**self.generation_settings)
+    
+    def _validate_response(self, response) -> str:
+        """Check a model response is non-empty JSON and return its text"""
+        # Validate response is not empty
+        if not response.text or response.text.strip() == "":
+            raise ValueError("Empty response from model")
+        
+        # Validate JSON structure
+        try:
+            json.loads(response.text)
+        except json.JSONDecodeError:
+            # Try to extract JSON from response
+            json_match = re.search(r'\{.*\}', response.text, re.DOTALL)
+            if json_match:
+                json.loads(json_match.group(0))  # Validate it's valid JSON
+        
+        return response.text
+    
+    def _log_retry(self, attempt: int, max_retries: int, error: Exception):
+        """Report a failed attempt when another one will follow"""
+        if attempt < max_retries - 1:
+            print(f"⚠️  Attempt {attempt + 1}/{max_retries} failed: {str(error)}")
+            print("   Retrying with backoff...")
@@ -0,0 +1,200 @@
+# Mock Provider - Offline, Deterministic Stand-In for Benchmarks and Load Tests
+import asyncio
+import hashlib
+import json
+import random
+import re
+import time
+from typing import Dict, Any, List, Optional
+from .base_provider import LLMProvider
+from ..metrics import record_llm_call
+from ..utils.prefilter import normalize_skill, SKILL_SYNONYMS
+
+# Skills recognised when synthesising job requirements from a description
+KNOWN_SKILLS = sorted(set(SKILL_SYNONYMS.values()) | {
+    'python', 'java', 'javascript', 'typescript', 'go', 'rust', 'c#', 'c++', 'sql', 'bash',
+    'powershell', 'linux', 'docker', 'kubernetes', 'terraform', 'cloudformation', 'ansible',
+    'aws', 'azure', 'google cloud', 'react', 'angular', 'vue', 'node.js', 'django', 'flask',
+    'fastapi', 'spring', 'postgresql', 'mysql', 'mongodb', 'redis', 'kafka', 'spark',
+    'pandas', 'numpy', 'tensorflow', 'pytorch', 'scikit-learn', 'git', 'jenkins',
+    'prometheus', 'grafana', 'cloudwatch', 'graphql', 'rest', 'ci cd', 'devops', 'agile',
+    'networking', 'html', 'css', 'tableau', 'excel'
+})
+
+class MockProvider(LLMProvider):
+    """Local provider that answers agent prompts without any network access
+    
+    Responses come from a recorded file when the prompt's SHA-256 is found
+    there ({"<sha256>": "<response text>"}), otherwise they are synthesised
+    deterministically from the prompt: skill overlap drives the match score, so
+    rankings are stable and plausible. latency_ms (+/- latency_jitter_ms)
+    simulates model latency for throughput tests.
+    """
+    
+    model_name = 'mock'
+    
+    def __init__(
+        self,
+        responses_path: Optional[str] = None,
+        latency_ms: float = 0,
+        latency_jitter_ms: float = 0
+    ):
+        self.latency_ms = latency_ms
+        self.latency_jitter_ms = latency_jitter_ms
+        self.recorded = {}
+        
+        if responses_path:
+            with open(responses_path, 'r', encoding='utf-8') as f:
+                self.recorded = json.load(f)
+    
+    def generate_json_response(self, prompt: str, max_retries: int = 3) -> str:
+        latency = self._latency()
+        time.sleep(latency)
+        record_llm_call(self.model_name, latency, True)
+        return self.respond(prompt)
+    
+    async def generate_json_response_async(self, prompt: str, max_retries: int = 3) -> str:
+        latency = self._latency()
+        await asyncio.sleep(latency)
+        record_llm_call(self.model_name, latency, True)
+        return self.respond(prompt)
+    
+    def respond(self, prompt: str) -> str:
+        """Recorded or synthetic response for a prompt, without simulated latency"""
+        prompt_hash = hashlib.sha256(prompt.encode('utf-8')).hexdigest()
+        if prompt_hash in self.recorded:
+            return self.recorded[prompt_hash]
+        
+        if '"results": [' in prompt and '"candidate_id"' in prompt:
+            result = self._screen_batch(prompt)
+        elif 'Candidate Information:' in prompt:
+            result = self._screen_candidate(prompt.split('Candidate Information:', 1)[1], prompt)
+        elif '"reasons": [' in prompt:
+            result = self._recommendation_reasons(prompt)
+        elif 'extract key requirements' in prompt:
+            result = self._job_requirements(prompt)
+        else:
+            result = {}
+        
+        return json.dumps(result)
+    
+    def _latency(self) -> float:
+        jitter = random.uniform(-self.latency_jitter_ms, self.latency_jitter_ms) if self.latency_jitter_ms else 0
+        return max(0.0, self.latency_ms + jitter) / 1000
+    
+    def _job_requirements(self, prompt: str) -> Dict[str, Any]:
+        description = prompt.split('Job Description:', 1)[-1].split('Extract and return', 1)[0]
+        text = description.lower()
+        
+        # Skills under a "preferred" heading are preferred; everything else counts as required
+        required_text, _, preferred_text = text.partition('preferred')
+        required = self._find_skills(required_text)
+        preferred = [s for s in self._find_skills(preferred_text) if s not in required]
+        
+        title = re.search(r'job title:\s*(.+)', description, re.IGNORECASE)
+        years = re.search(r'(\d+\s*(?:[-–+]\s*\d*)?)\s*years?', description, re.IGNORECASE)
+        degrees = [d for d in ("Bachelor's degree", "Master's degree", 'PhD') if d.split("'")[0].lower() in text]
+        
+        return {
+            'required_skills': required,
+            'preferred_skills': preferred,
+            'experience_required': f"{years.group(1).strip()} years" if years else 'Not specified',
+            'education_required': degrees,
+            'key_responsibilities': [],
+            'role_type': title.group(1).strip() if title else '',
+            'technical_requirements': [],
+            'soft_skills': []
+        }
+    
+    def _find_skills(self, text: str) -> List[str]:
+        """Known skills (or their aliases) mentioned in text, as canonical names"""
+        found = {
+            normalize_skill(skill) for skill in list(KNOWN_SKILLS) + list(SKILL_SYNONYMS)
+            if re.search(rf'(?<![\w+#]){re.escape(skill)}(?![\w+#])', text)
+        }
+        return sorted(found)
+    
+    def _screen_batch(self, prompt: str) -> Dict[str, Any]:
+        candidates_text = prompt.split('Candidates (each starts with its candidate_id in square brackets):', 1)[-1]
+        candidates_text = candidates_text.split('EVALUATION PROCESS', 1)[0]
+        
+        results = []
+        for match in re.finditer(r'\[(C\d+)\]\n(.*?)(?=\n\[C\d+\]\n|\Z)', candidates_text, re.DOTALL):
+            result = self._screen_candidate(match.group(2), prompt)
+            result['candidate_id'] = match.group(1)
+            results.append(result)
+        return {'results': results}
+    
+    def _screen_candidate(self, candidate_text: str, prompt: str) -> Dict[str, Any]:
+        requirements = prompt.split('Job Requirements:', 1)[-1]
+        required = [normalize_skill(s) for s in self._field(requirements, 'Required Skills').split(',') if s.strip()]
+        skills = {normalize_skill(s) for s in self._field(candidate_text, 'Skills').split(',') if s.strip()}
+        
+        matched = [s for s in required if s in skills]
+        missing = [s for s in required if s not in skills]
+        match_percentage = round(100 * len(matched) / len(required)) if required else 100
+        
+        years = self._number(self._field(candidate_text, 'Years of Experience'))
+        years_required = self._number(self._field(requirements, 'Experience Required'))
+        experience_score = 90 if years >= years_required else max(30, 90 - 20 * (years_required - years))
+        education_score = 40 if self._field(candidate_text, 'Education') in ('', 'Not specified') else 85
+        
+        match_score = round(match_percentage * 0.5 + experience_score * 0.35 + education_score * 0.15)
+        
+        return {
+            'match_score': match_score,
+            'skills_match': {
+                'matched_skills': matched,
+                'missing_skills': missing,
+                'match_percentage': match_percentage
+            },
+            'experience_match': {
+                'is_qualified': years >= years_required,
+                'years_gap': max(0, years_required - years),
+                'relevance_score': experience_score
+            },
+            'education_match': {
+                'meets_requirements': education_score >= 70,
+                'education_score': education_score
+            },
+            'strengths': [f"Experience with {skill}" for skill in matched[:3]],
+            'weaknesses': [f"No listed experience with {skill}" for skill in missing[:2]],
+            'overall_assessment': f"Matches {len(matched)} of {len(required)} required skills with {years:g} years of experience.",
+            'recommendation': self._recommendation(match_score)
+        }
+    
+    def _recommendation_reasons(self, prompt: str) -> Dict[str, Any]:
+        start = prompt.find('[', prompt.find('Shortlisted Candidates'))
+        try:
+            candidates, _ = json.JSONDecoder().raw_decode(prompt, start)
+        except ValueError:
+            candidates = []
+        return {
+            'reasons': [
+                {
+                    'rank': candidate.get('rank'),
+                    'recommendation_reason': (
+                        f"{candidate.get('name', 'Candidate')} scored {candidate.get('match_score', 0)} "
+                        f"and brings {', '.join(candidate.get('matched_skills', [])[:3]) or 'relevant experience'}."
+                    )
+                }
+                for candidate in candidates
+            ]
+        }
+    
+    def _field(self, text: str, label: str) -> str:
+        match = re.search(rf'^{re.escape(label)}:\s*(.*)$', text, re.MULTILINE)
+        return match.group(1).strip() if match else ''
+    
+    def _number(self, text: str) -> float:
+        match = re.search(r'\d+(?:\.\d+)?', text)
+        return float(match.group(0)) if match else 0.0
+    
+    def _recommendation(self, match_score: int) -> str:
+        if match_score >= 85:
+            return 'strong_match'
+        if match_score >= 70:
+            return 'good_match'
+        if match_score >= 50:
+            return 'potential_match'
+        return 'not_recommended'
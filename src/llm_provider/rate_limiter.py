@@ -0,0 +1,160 @@
+# Rate Limiting - Shared Request/Token Budgets and Adaptive Concurrency for LLM Calls
+import asyncio
+import random
+import threading
+import time
+from typing import Optional
+
+class TokenBucket:
+    """Token bucket refilled continuously at capacity per minute
+    
+    reserve() always succeeds and returns how long the caller must wait for
+    its reservation to be covered, so waiting callers queue up fairly instead
+    of racing for refills.
+    """
+    
+    def __init__(self, capacity_per_minute: float):
+        self.capacity = float(capacity_per_minute)
+        self.rate = self.capacity / 60.0
+        self._available = self.capacity
+        self._updated = time.monotonic()
+    
+    def reserve(self, amount: float, now: float) -> float:
+        """Take amount from the bucket (possibly going negative) and return the wait in seconds"""
+        self._refill(now)
+        # A single request larger than the whole budget must still be able to run
+        amount = min(amount, self.capacity)
+        self._available -= amount
+        return 0.0 if self._available >= 0 else -self._available / self.rate
+    
+    def adjust(self, delta: float, now: float):
+        """Give back (positive) or charge (negative) tokens after the fact"""
+        self._refill(now)
+        self._available = min(self.capacity, self._available + delta)
+    
+    def _refill(self, now: float):
+        self._available = min(self.capacity, self._available + (now - self._updated) * self.rate)
+        self._updated = now
+
+class RateLimiter:
+    """Requests-per-minute and tokens-per-minute budget shared by all callers
+    
+    Either limit may be None (unlimited). Token usage is reserved from an
+    estimate before the call and corrected with the real count afterwards.
+    """
+    
+    def __init__(self, requests_per_minute: Optional[int] = None, tokens_per_minute: Optional[int] = None):
+        self._requests = TokenBucket(requests_per_minute) if requests_per_minute else None
+        self._tokens = TokenBucket(tokens_per_minute) if tokens_per_minute else None
+        self._lock = threading.Lock()
+    
+    def acquire(self, estimated_tokens: int = 0):
+        """Block until a request with estimated_tokens fits in the budget"""
+        delay = self._reserve(estimated_tokens)
+        if delay > 0:
+            time.sleep(delay)
+    
+    async def acquire_async(self, estimated_tokens: int = 0):
+        """Async variant of acquire that does not block the event loop"""
+        delay = self._reserve(estimated_tokens)
+        if delay > 0:
+            await asyncio.sleep(delay)
+    
+    def record_usage(self, estimated_tokens: int, actual_tokens: Optional[int]):
+        """Correct the token budget once the real usage of a call is known"""
+        if self._tokens is None or actual_tokens is None:
+            return
+        with self._lock:
+            self._tokens.adjust(estimated_tokens - actual_tokens, time.monotonic())
+    
+    def _reserve(self, estimated_tokens: int) -> float:
+        with self._lock:
+            now = time.monotonic()
+            delay = 0.0
+            if self._requests is not None:
+                delay = max(delay, self._requests.reserve(1, now))
+            if self._tokens is not None and estimated_tokens > 0:
+                delay = max(delay, self._tokens.reserve(estimated_tokens, now))
+            return delay
+
+class AdaptiveConcurrency:
+    """Concurrency limit that halves on throttling and grows back on success
+    
+    Additive increase / multiplicative decrease: throttling halves the limit
+    (down to min_limit, at most once per second so one burst of 429s counts
+    once), and each run of `limit` consecutive successes raises it by one (up
+    to max_limit). Blocking and async callers share one in-flight count, so
+    the limit holds across both paths.
+    """
+    
+    # Async callers poll for a free slot, backing off up to this many seconds
+    ASYNC_POLL_MAX_SECONDS = 0.1
+    
+    def __init__(self, max_limit: int, min_limit: int = 1):
+        self.max_limit = max(1, max_limit)
+        self.min_limit = max(1, min(min_limit, self.max_limit))
+        self.limit = self.max_limit
+        self._successes = 0
+        self._last_decrease = 0.0
+        self._in_flight = 0
+        self._lock = threading.Condition()
+    
+    def acquire(self):
+        with self._lock:
+            while self._in_flight >= self.limit:
+                self._lock.wait(timeout=1.0)
+            self._in_flight += 1
+    
+    def release(self):
+        with self._lock:
+            self._in_flight -= 1
+            self._lock.notify()
+    
+    async def acquire_async(self):
+        # Never wait on the thread lock's condition here: that would block the event loop
+        delay = 0.005
+        while not self._try_acquire():
+            await asyncio.sleep(delay)
+            delay = min(delay * 2, self.ASYNC_POLL_MAX_SECONDS)
+    
+    async def release_async(self):
+        self.release()
+    
+    def _try_acquire(self) -> bool:
+        with self._lock:
+            if self._in_flight >= self.limit:
+                return False
+            self._in_flight += 1
+            return True
+    
+    def on_success(self):
+        with self._lock:
+            self._successes += 1
+            if self._successes >= self.limit and self.limit < self.max_limit:
+                self.limit += 1
+                self._successes = 0
+                self._lock.notify()
+    
+    def on_throttle(self):
+        with self._lock:
+            self._successes = 0
+            now = time.monotonic()
+            if now - self._last_decrease < 1.0:
+                return
+            self._last_decrease = now
+            new_limit = max(self.min_limit, self.limit // 2)
+            if new_limit < self.limit:
+                print(f"⚠️  LLM rate limited, reducing concurrency {self.limit} -> {new_limit}")
+            self.limit = new_limit
+
+def is_throttling_error(error: Exception) -> bool:
+    """True for rate-limit / overload errors (HTTP 429, 503, RESOURCE_EXHAUSTED)"""
+    code = getattr(error, 'code', None) or getattr(error, 'status_code', None)
+    if code in (429, 503):
+        return True
+    message = str(error)
+    return 'RESOURCE_EXHAUSTED' in message or '429' in message or 'UNAVAILABLE' in message
+
+def backoff_delay(attempt: int, base_delay: float = 1.0, max_delay: float = 30.0) -> float:
+    """Exponential backoff with full jitter for the given zero-based retry attempt"""
+    return random.uniform(0, min(max_delay, base_delay * (2 ** attempt)))
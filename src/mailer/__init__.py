@@ -0,0 +1,9 @@
+# Mailer Package
+from .smtp_pool import SMTPConnectionPool, build_message, is_transient_smtp_error
+from .email_dispatcher import EmailDispatcher
+from .email_templates import EmailTemplate, EmailTemplateError, TEMPLATE_FIELDS, build_template_context
+
+__all__ = [
+    'SMTPConnectionPool', 'build_message', 'is_transient_smtp_error', 'EmailDispatcher',
+    'EmailTemplate', 'EmailTemplateError', 'TEMPLATE_FIELDS', 'build_template_context'
+]
@@ -0,0 +1,185 @@
+# Email Dispatcher - Background Bulk Email Delivery with Retry and Status Tracking
+import asyncio
+import json
+import os
+import random
+import threading
+import uuid
+from datetime import datetime
+from email.mime.multipart import MIMEMultipart
+from typing import Dict, Any, List, Optional, Tuple
+from .smtp_pool import SMTPConnectionPool
+
+BATCHES_FOLDER = os.path.join(".email", "batches")
+
+# Statuses a batch can no longer leave
+FINISHED_STATUSES = ('completed', 'interrupted')
+
+class EmailDispatcher:
+    """In-process dispatcher that delivers bulk email batches in the background
+    
+    Each batch is recorded in data/.email/batches/<batch_id>.json with a status
+    per recipient (pending, retrying, sent, failed). Messages go out over the
+    shared SMTP pool; transient failures (dropped connections, 4xx replies)
+    are retried with exponential backoff, permanent ones fail immediately.
+    """
+    
+    def __init__(
+        self,
+        pool: SMTPConnectionPool,
+        data_dir: str = "data",
+        max_attempts: int = 3,
+        backoff_seconds: float = 2.0
+    ):
+        self.pool = pool
+        self.data_dir = data_dir
+        self.max_attempts = max(1, max_attempts)
+        self.backoff_seconds = backoff_seconds
+        self._batches = {}  # batch_id -> record, for batches started by this process
+        self._tasks = {}    # batch_id -> asyncio.Task
+    
+    def submit(self, messages: List[Tuple[Dict[str, Any], MIMEMultipart]]) -> Dict[str, Any]:
+        """
+        Queue a batch of messages; must be called from the event loop
+        
+        Args:
+            messages: (recipient, message) pairs; recipient is the {id, name, email} dict from the request
+        
+        Returns:
+            The new batch record
+        """
+        batch_id = uuid.uuid4().hex
+        record = {
+            'batch_id': batch_id,
+            'status': 'queued',
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'finished_at': None,
+            'total': len(messages),
+            'recipients': [
+                {
+                    'id': recipient.get('id'),
+                    'name': recipient.get('name', 'Unknown'),
+                    'email': recipient.get('email', 'N/A'),
+                    'status': 'pending',
+                    'attempts': 0,
+                    'error': None,
+                    'sent_at': None
+                }
+                for recipient, _ in messages
+            ]
+        }
+        self._batches[batch_id] = record
+        self._save(record)
+        
+        self._tasks[batch_id] = asyncio.create_task(self._deliver(record, [msg for _, msg in messages]))
+        return self._snapshot(record)
+    
+    def get(self, batch_id: str) -> Optional[Dict[str, Any]]:
+        """Status of a batch with per-recipient delivery state, from memory or disk"""
+        record = self._batches.get(batch_id)
+        if record is not None:
+            return self._snapshot(record)
+        
+        record = self._load(batch_id)
+        if record is not None and record['status'] not in FINISHED_STATUSES:
+            # Left unfinished by a previous server process
+            record['status'] = 'interrupted'
+        return record
+    
+    async def _deliver(self, record: Dict[str, Any], messages: List[MIMEMultipart]):
+        """Send every message, retrying transient failures with backoff"""
+        pending = list(range(len(messages)))
+        record['status'] = 'sending'
+        
+        try:
+            for attempt in range(1, self.max_attempts + 1):
+                if attempt > 1:
+                    # Exponential backoff with jitter so retries don't hit the server in lockstep
+                    delay = self.backoff_seconds * (2 ** (attempt - 2))
+                    await asyncio.sleep(delay * random.uniform(0.8, 1.2))
+                
+                for idx in pending:
+                    record['recipients'][idx]['attempts'] = attempt
+                
+                results = await asyncio.to_thread(
+                    self.pool.send_many,
+                    [messages[idx] for idx in pending],
+                    lambda position, success, error: self._on_result(record, pending[position], success, error)
+                )
+                
+                retry = []
+                for idx, result in zip(pending, results):
+                    if not result['success'] and result['transient'] and attempt < self.max_attempts:
+                        record['recipients'][idx]['status'] = 'retrying'
+                        retry.append(idx)
+                    elif not result['success']:
+                        record['recipients'][idx]['status'] = 'failed'
+                
+                self._save(record)
+                
+                pending = retry
+                if not pending:
+                    break
+        except Exception as e:
+            print(f"❌ Email batch {record['batch_id']} stopped: {str(e)}")
+            for idx in pending:
+                entry = record['recipients'][idx]
+                if entry['status'] != 'sent':
+                    entry['status'] = 'failed'
+                    entry['error'] = entry['error'] or str(e)
+        finally:
+            record['status'] = 'completed'
+            record['finished_at'] = datetime.now().isoformat(timespec='seconds')
+            self._save(record)
+            self._tasks.pop(record['batch_id'], None)
+            counts = self._count_statuses(record['recipients'])
+            print(f"✅ Email batch {record['batch_id']} complete. Sent: {counts['sent']}, Failed: {counts['failed']}")
+    
+    def _on_result(self, record: Dict[str, Any], idx: int, success: bool, error: Optional[str]):
+        """Record one send attempt as it finishes (called from the pool's worker threads)"""
+        entry = record['recipients'][idx]
+        if success:
+            entry['status'] = 'sent'
+            entry['error'] = None
+            entry['sent_at'] = datetime.now().isoformat(timespec='seconds')
+        else:
+            entry['error'] = error
+            print(f"  ❌ Failed to send to {entry['email']} (attempt {entry['attempts']}): {error}")
+    
+    def _count_statuses(self, recipients: List[Dict[str, Any]]) -> Dict[str, int]:
+        """Tally recipients as sent, failed or still pending (incl. retrying)"""
+        counts = {'pending': 0, 'sent': 0, 'failed': 0}
+        for entry in recipients:
+            key = entry['status'] if entry['status'] in ('sent', 'failed') else 'pending'
+            counts[key] += 1
+        return counts
+    
+    def _snapshot(self, record: Dict[str, Any]) -> Dict[str, Any]:
+        """Copy of a live record that is safe to serialize while sends are in flight"""
+        snapshot = dict(record)
+        snapshot['recipients'] = [dict(entry) for entry in record['recipients']]
+        snapshot['counts'] = self._count_statuses(snapshot['recipients'])
+        return snapshot
+    
+    def _batch_path(self, batch_id: str) -> str:
+        return os.path.join(self.data_dir, BATCHES_FOLDER, f"{batch_id}.json")
+    
+    def _save(self, record: Dict[str, Any]):
+        """Atomically write a batch record"""
+        path = self._batch_path(record['batch_id'])
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(self._snapshot(record), f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    
+    def _load(self, batch_id: str) -> Optional[Dict[str, Any]]:
+        """Read a batch record from disk by id"""
+        if not batch_id or not all(c in '0123456789abcdef' for c in batch_id):
+            return None
+        
+        try:
+            with open(self._batch_path(batch_id), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
@@ -0,0 +1,77 @@
+# Email Templates - Precompiled Candidate Email Templates
+from typing import Dict, Any, List, Tuple
+from jinja2 import TemplateError
+from jinja2.sandbox import SandboxedEnvironment
+
+# Bracket placeholders from the original send page, mapped onto template fields
+LEGACY_PLACEHOLDERS = {
+    '[Candidate Name]': '{{ name }}',
+    '[Role]': '{{ role }}',
+    '[Rank]': '{{ rank }}',
+    '[Match Score]': '{{ match_score }}',
+}
+
+# Fields available to templates, for the send page and error messages
+TEMPLATE_FIELDS = (
+    'name', 'first_name', 'email', 'role', 'rank', 'match_score',
+    'interview_focus_areas', 'key_strengths'
+)
+
+# Templates are written by HR users, so they run sandboxed; emails are plain text (no autoescaping)
+_environment = SandboxedEnvironment(trim_blocks=True, lstrip_blocks=True, keep_trailing_newline=True)
+
+class EmailTemplateError(ValueError):
+    """Raised when a subject or body template cannot be compiled or rendered"""
+
+def build_template_context(recipient: Dict[str, Any]) -> Dict[str, Any]:
+    """Normalize a recipient from the send request into template fields"""
+    name = recipient.get('name') or 'Candidate'
+    return {
+        'name': name,
+        'first_name': name.split()[0] if name.split() else name,
+        'email': recipient.get('email', ''),
+        'role': recipient.get('role') or '',
+        'rank': recipient.get('rank'),
+        'match_score': recipient.get('match_score'),
+        'interview_focus_areas': list(recipient.get('interview_focus_areas') or []),
+        'key_strengths': list(recipient.get('key_strengths') or []),
+    }
+
+class EmailTemplate:
+    """Subject and body compiled once, then rendered per recipient
+    
+    Templates use Jinja syntax, e.g. "Dear {{ first_name }}" or
+    "{% for area in interview_focus_areas %}- {{ area }}{% endfor %}". The
+    bracket placeholders of the original page ("[Candidate Name]") still work.
+    """
+    
+    def __init__(self, subject: str, body: str):
+        self._subject = self._compile(subject, 'subject')
+        self._body = self._compile(body, 'body')
+    
+    def render(self, recipient: Dict[str, Any]) -> Tuple[str, str]:
+        """Render (subject, body) for one recipient"""
+        context = build_template_context(recipient)
+        try:
+            # Subjects must stay on one line
+            subject = ' '.join(self._subject.render(context).split())
+            return subject, self._body.render(context)
+        except TemplateError as e:
+            raise EmailTemplateError(f"Could not render email for {context['email'] or context['name']}: {str(e)}")
+        except Exception as e:
+            # Valid templates can still fail on a recipient's data, e.g. {{ rank + 1 }} without a rank
+            raise EmailTemplateError(
+                f"Could not render email for {context['email'] or context['name']}: {type(e).__name__}: {str(e)}"
+            )
+    
+    def render_many(self, recipients: List[Dict[str, Any]]) -> List[Tuple[str, str]]:
+        """Render every recipient with the already-compiled templates"""
+        return [self.render(recipient) for recipient in recipients]
+    
+    def _compile(self, source: str, part: str):
+        for placeholder, field in LEGACY_PLACEHOLDERS.items():
+            source = source.replace(placeholder, field)
+        try:
+            return _environment.from_string(source)
+        except TemplateError as e:
+            raise EmailTemplateError(f"Invalid email {part} template: {str(e)}")
@@ -0,0 +1,164 @@
+# SMTP Pool - Reusable Authenticated SMTP Connections for Bulk Email
+import queue
+import smtplib
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from email.mime.text import MIMEText
+from email.mime.multipart import MIMEMultipart
+from typing import Dict, Any, List, Optional, Callable
+
+def is_transient_smtp_error(error: Exception) -> bool:
+    """True when a failed send is worth retrying later (dropped connection or 4xx reply)"""
+    if isinstance(error, smtplib.SMTPRecipientsRefused):
+        return all(400 <= code < 500 for code, _ in error.recipients.values())
+    if isinstance(error, smtplib.SMTPAuthenticationError):
+        return False
+    if isinstance(error, smtplib.SMTPResponseException):
+        return 400 <= error.smtp_code < 500
+    if isinstance(error, smtplib.SMTPServerDisconnected):
+        return True
+    return isinstance(error, OSError) and not isinstance(error, smtplib.SMTPException)
+
+def build_message(sender: str, receiver: str, subject: str, body: str) -> MIMEMultipart:
+    """Build a plain-text email message"""
+    msg = MIMEMultipart()
+    msg['From'] = sender
+    msg['To'] = receiver
+    msg['Subject'] = subject
+    
+    # Attach body
+    msg.attach(MIMEText(body, 'plain'))
+    return msg
+
+class SMTPConnectionPool:
+    """Pool of logged-in SMTP connections reused across messages
+    
+    Connections are opened lazily (STARTTLS + login once each), handed out to
+    one sender at a time, and recycled after max_messages_per_connection
+    messages. A connection the server has dropped is replaced and the
+    message retried once on the new connection.
+    """
+    
+    def __init__(
+        self, 
+        host: str, 
+        port: int, 
+        username: Optional[str], 
+        password: Optional[str], 
+        pool_size: int = 3, 
+        timeout: float = 30, 
+        max_messages_per_connection: int = 100, 
+        use_starttls: bool = True
+    ):
+        self.host = host
+        self.port = port
+        self.username = username
+        self.password = password
+        self.pool_size = max(1, pool_size)
+        self.timeout = timeout
+        self.max_messages_per_connection = max_messages_per_connection
+        self.use_starttls = use_starttls
+        
+        self._idle = queue.LifoQueue()   # (connection, messages sent), most recently used first
+        self._slots = threading.BoundedSemaphore(self.pool_size)
+    
+    def send(self, msg: MIMEMultipart):
+        """Send one message over a pooled connection; raises on failure"""
+        with self._slots:
+            server, sent = self._checkout()
+            try:
+                try:
+                    server.send_message(msg)
+                except Exception as e:
+                    if not self._is_connection_error(e):
+                        raise
+                    # Stale connection: reconnect and retry once
+                    self._discard(server)
+                    server, sent = self._connect(), 0
+                    server.send_message(msg)
+            except Exception:
+                self._discard(server)
+                raise
+            
+            sent += 1
+            if self.max_messages_per_connection and sent >= self.max_messages_per_connection:
+                self._discard(server)
+            else:
+                self._idle.put((server, sent))
+    
+    def send_many(
+        self, 
+        messages: List[MIMEMultipart], 
+        on_result: Optional[Callable[[int, bool, Optional[str]], None]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Send messages over up to pool_size parallel connections
+        
+        Args:
+            messages: Messages to send
+            on_result: Called with (message index, success, error) as each send finishes (optional)
+            
+        Returns:
+            Per-message results in input order: {'success': bool, 'error': str or None, 'transient': bool}
+        """
+        def send_one(idx: int) -> Dict[str, Any]:
+            try:
+                self.send(messages[idx])
+                result = {'success': True, 'error': None, 'transient': False}
+            except Exception as e:
+                result = {'success': False, 'error': str(e), 'transient': is_transient_smtp_error(e)}
+            if on_result:
+                on_result(idx, result['success'], result['error'])
+            return result
+        
+        if not messages:
+            return []
+        
+        with ThreadPoolExecutor(max_workers=min(self.pool_size, len(messages))) as executor:
+            return list(executor.map(send_one, range(len(messages))))
+    
+    def close(self):
+        """Politely close every idle connection"""
+        while True:
+            try:
+                server, _ = self._idle.get_nowait()
+            except queue.Empty:
+                return
+            self._discard(server)
+    
+    def _checkout(self):
+        """Reuse an idle connection or open a new one"""
+        try:
+            return self._idle.get_nowait()
+        except queue.Empty:
+            return self._connect(), 0
+    
+    def _connect(self) -> smtplib.SMTP:
+        """Open, secure and authenticate a new connection"""
+        server = smtplib.SMTP(self.host, self.port, timeout=self.timeout)
+        try:
+            if self.use_starttls:
+                server.starttls()
+            # Local relays and test servers may not offer AUTH at all
+            server.ehlo_or_helo_if_needed()
+            if self.username and self.password and server.has_extn('auth'):
+                server.login(self.username, self.password)
+        except Exception:
+            self._discard(server)
+            raise
+        return server
+    
+    def _is_connection_error(self, error: Exception) -> bool:
+        """True for a dropped or broken connection, False for a rejected message"""
+        if isinstance(error, smtplib.SMTPServerDisconnected):
+            return True
+        return isinstance(error, OSError) and not isinstance(error, smtplib.SMTPException)
+    
+    def _discard(self, server: smtplib.SMTP):
+        try:
+            server.quit()
+        except Exception:
+            try:
+                server.close()
+            except Exception:
+                pass
@@ -0,0 +1,27 @@
+# Metrics Package
+from .llm_metrics import (
+    llm_metrics,
+    llm_labels,
+    track_llm_usage,
+    record_llm_call,
+    usage_tokens,
+    LLMMetrics,
+    LLMUsageSummary
+)
+from .tracing import start_trace, trace_span, traced, record_span, Tracer, TraceStore
+
+__all__ = [
+    'llm_metrics',
+    'llm_labels',
+    'track_llm_usage',
+    'record_llm_call',
+    'usage_tokens',
+    'LLMMetrics',
+    'LLMUsageSummary',
+    'start_trace',
+    'trace_span',
+    'traced',
+    'record_span',
+    'Tracer',
+    'TraceStore'
+]
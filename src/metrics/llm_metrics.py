@@ -0,0 +1,188 @@
+# LLM Metrics - Per-Call Latency, Token and Retry Accounting
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Any, Optional, Iterator
+from .tracing import record_span
+
+# Upper bounds (seconds) of the call duration histogram buckets
+LATENCY_BUCKETS = (0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60)
+
+# Labels (agent, job_id) for calls made in the current context; copied into asyncio tasks and to_thread workers
+_labels: ContextVar[Dict[str, str]] = ContextVar('llm_labels', default={})
+# Per-run usage summary collecting the calls made in the current context, if any
+_run_usage: ContextVar[Optional['LLMUsageSummary']] = ContextVar('llm_run_usage', default=None)
+
+@contextmanager
+def llm_labels(**labels: str) -> Iterator[None]:
+    """Tag LLM calls made inside the block, e.g. llm_labels(agent='screener', job_id='Job1')"""
+    token = _labels.set({**_labels.get(), **labels})
+    try:
+        yield
+    finally:
+        _labels.reset(token)
+
+@contextmanager
+def track_llm_usage() -> Iterator['LLMUsageSummary']:
+    """Collect a usage summary of every LLM call made inside the block"""
+    summary = LLMUsageSummary()
+    token = _run_usage.set(summary)
+    try:
+        yield summary
+    finally:
+        _run_usage.reset(token)
+
+def record_llm_call(
+    model: str,
+    latency_seconds: float,
+    success: bool,
+    attempts: int = 1,
+    throttled: int = 0,
+    prompt_tokens: int = 0,
+    output_tokens: int = 0,
+    cached: bool = False
+):
+    """Record one logical LLM call (including its retries) with the current labels"""
+    labels = _labels.get()
+    call = {
+        'agent': labels.get('agent', 'unknown'),
+        'job_id': labels.get('job_id', ''),
+        'model': model,
+        'latency_seconds': latency_seconds,
+        'success': success,
+        'attempts': attempts,
+        'throttled': throttled,
+        'prompt_tokens': prompt_tokens,
+        'output_tokens': output_tokens,
+        'cached': cached
+    }
+    
+    llm_metrics.add(call)
+    record_span('llm_call', latency_seconds, category='llm', model=model, agent=call['agent'],
+                success=success, attempts=attempts, cached=cached)
+    summary = _run_usage.get()
+    if summary is not None:
+        summary.add(call)
+
+def usage_tokens(response) -> Dict[str, int]:
+    """Prompt/output token counts from a Gemini response's usage_metadata (0 when absent)"""
+    usage = getattr(response, 'usage_metadata', None)
+    return {
+        'prompt_tokens': getattr(usage, 'prompt_token_count', None) or 0,
+        'output_tokens': getattr(usage, 'candidates_token_count', None) or 0
+    }
+
+class LLMUsageSummary:
+    """Totals of the LLM calls made during one shortlist run, overall and per agent"""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._totals = defaultdict(self._empty)
+    
+    def add(self, call: Dict[str, Any]):
+        with self._lock:
+            for key in ('all', call['agent']):
+                totals = self._totals[key]
+                totals['calls'] += 1
+                totals['cache_hits'] += 1 if call['cached'] else 0
+                totals['failures'] += 0 if call['success'] else 1
+                totals['retries'] += max(0, call['attempts'] - 1)
+                totals['throttled'] += call['throttled']
+                totals['prompt_tokens'] += call['prompt_tokens']
+                totals['output_tokens'] += call['output_tokens']
+                totals['latency_seconds'] += call['latency_seconds']
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """JSON-ready summary: overall totals plus a by_agent breakdown"""
+        with self._lock:
+            summary = self._format(self._totals['all'])
+            summary['by_agent'] = {
+                agent: self._format(totals)
+                for agent, totals in sorted(self._totals.items()) if agent != 'all'
+            }
+            return summary
+    
+    @staticmethod
+    def _empty() -> Dict[str, Any]:
+        return {
+            'calls': 0, 'cache_hits': 0, 'failures': 0, 'retries': 0, 'throttled': 0,
+            'prompt_tokens': 0, 'output_tokens': 0, 'latency_seconds': 0.0
+        }
+    
+    @staticmethod
+    def _format(totals: Dict[str, Any]) -> Dict[str, Any]:
+        formatted = dict(totals)
+        formatted['total_tokens'] = totals['prompt_tokens'] + totals['output_tokens']
+        formatted['latency_seconds'] = round(totals['latency_seconds'], 3)
+        formatted['average_latency_seconds'] = round(totals['latency_seconds'] / totals['calls'], 3) if totals['calls'] else 0.0
+        return formatted
+
+class LLMMetrics:
+    """Process-wide LLM call counters, rendered in the Prometheus text format"""
+    
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._calls = defaultdict(int)       # (agent, job_id, model, outcome) -> count
+        self._retries = defaultdict(int)     # (agent, job_id, model) -> count
+        self._throttled = defaultdict(int)   # (agent, job_id, model) -> count
+        self._tokens = defaultdict(int)      # (agent, job_id, model, type) -> count
+        self._latency = defaultdict(lambda: {'buckets': [0] * len(LATENCY_BUCKETS), 'sum': 0.0, 'count': 0})  # (agent, model)
+    
+    def add(self, call: Dict[str, Any]):
+        agent, job_id, model = call['agent'], call['job_id'], call['model']
+        outcome = 'cache_hit' if call['cached'] else ('success' if call['success'] else 'failure')
+        
+        with self._lock:
+            self._calls[(agent, job_id, model, outcome)] += 1
+            self._retries[(agent, job_id, model)] += max(0, call['attempts'] - 1)
+            self._throttled[(agent, job_id, model)] += call['throttled']
+            self._tokens[(agent, job_id, model, 'prompt')] += call['prompt_tokens']
+            self._tokens[(agent, job_id, model, 'output')] += call['output_tokens']
+            
+            if not call['cached']:
+                latency = self._latency[(agent, model)]
+                for idx, bound in enumerate(LATENCY_BUCKETS):
+                    if call['latency_seconds'] <= bound:
+                        latency['buckets'][idx] += 1
+                latency['sum'] += call['latency_seconds']
+                latency['count'] += 1
+    
+    def render_prometheus(self) -> str:
+        """All metrics in the Prometheus text exposition format"""
+        lines = []
+        with self._lock:
+            self._render_counter(lines, 'llm_calls_total', 'LLM calls by outcome (success, failure, cache_hit)',
+                                 ('agent', 'job_id', 'model', 'outcome'), self._calls)
+            self._render_counter(lines, 'llm_retries_total', 'LLM call attempts beyond the first',
+                                 ('agent', 'job_id', 'model'), self._retries)
+            self._render_counter(lines, 'llm_throttled_total', 'LLM attempts rejected by rate limiting',
+                                 ('agent', 'job_id', 'model'), self._throttled)
+            self._render_counter(lines, 'llm_tokens_total', 'Tokens reported in usage_metadata',
+                                 ('agent', 'job_id', 'model', 'type'), self._tokens)
+            
+            lines.append('# HELP llm_call_duration_seconds LLM call latency including retries')
+            lines.append('# TYPE llm_call_duration_seconds histogram')
+            for (agent, model), latency in sorted(self._latency.items()):
+                labels = self._format_labels(('agent', 'model'), (agent, model))
+                for bound, count in zip(LATENCY_BUCKETS, latency['buckets']):
+                    lines.append(f'llm_call_duration_seconds_bucket{{{labels},le="{bound}"}} {count}')
+                lines.append(f'llm_call_duration_seconds_bucket{{{labels},le="+Inf"}} {latency["count"]}')
+                lines.append(f'llm_call_duration_seconds_sum{{{labels}}} {latency["sum"]:.6f}')
+                lines.append(f'llm_call_duration_seconds_count{{{labels}}} {latency["count"]}')
+        
+        return '\n'.join(lines) + '\n'
+    
+    def _render_counter(self, lines, name: str, help_text: str, label_names, values: Dict):
+        lines.append(f'# HELP {name} {help_text}')
+        lines.append(f'# TYPE {name} counter')
+        for label_values, value in sorted(values.items()):
+            lines.append(f'{name}{{{self._format_labels(label_names, label_values)}}} {value}')
+    
+    @staticmethod
+    def _format_labels(names, values) -> str:
+        escaped = (str(v).replace('\\', '\\\\').replace('"', '\\"').replace('\n', '\\n') for v in values)
+        return ','.join(f'{name}="{value}"' for name, value in zip(names, escaped))
+
+# Shared by every provider in the process
+llm_metrics = LLMMetrics()
@@ -0,0 +1,160 @@
+# Tracing - Stage Spans of a Shortlist Run, Exported as Chrome Trace JSON
+import asyncio
+import functools
+import json
+import os
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Dict, Any, List, Optional, Iterator, Callable
+
+# Trace collecting spans in the current context, if any
+_tracer: ContextVar[Optional['Tracer']] = ContextVar('tracer', default=None)
+
+class Tracer:
+    """Collects complete ("X") events for one run in the Chrome trace event format
+    
+    Each asyncio task and thread gets its own lane (tid), so concurrent
+    candidate screenings show up side by side in chrome://tracing or Perfetto.
+    """
+    
+    def __init__(self, name: str):
+        self.name = name
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+        self._events = []
+        self._lanes = {}  # (thread id, task id) -> tid
+    
+    def add_span(self, name: str, start: float, duration: float, category: str = 'stage', args: Optional[Dict[str, Any]] = None):
+        """
+        Record a finished span
+        
+        Args:
+            name: Span name, e.g. "intake" or "screen_candidate"
+            start: time.perf_counter() value when the span began
+            duration: Span length in seconds
+            category: Chrome trace category used for filtering
+            args: Extra fields shown when the span is selected
+        """
+        event = {
+            'name': name,
+            'cat': category,
+            'ph': 'X',
+            'ts': round((start - self._origin) * 1_000_000, 1),
+            'dur': round(duration * 1_000_000, 1),
+            'pid': 1,
+            'tid': self._lane(),
+            'args': args or {}
+        }
+        with self._lock:
+            self._events.append(event)
+    
+    def to_chrome_trace(self) -> Dict[str, Any]:
+        """The trace as a JSON-ready Chrome trace object"""
+        with self._lock:
+            events = sorted(self._events, key=lambda e: e['ts'])
+            lanes = sorted(self._lanes.values())
+        
+        metadata = [{'name': 'process_name', 'ph': 'M', 'pid': 1, 'args': {'name': self.name}}]
+        metadata += [
+            {'name': 'thread_name', 'ph': 'M', 'pid': 1, 'tid': tid, 'args': {'name': f'lane {tid}'}}
+            for tid in lanes
+        ]
+        return {'traceEvents': metadata + events, 'displayTimeUnit': 'ms'}
+    
+    def _lane(self) -> int:
+        try:
+            task = asyncio.current_task()
+        except RuntimeError:
+            task = None
+        key = (threading.get_ident(), id(task) if task else None)
+        with self._lock:
+            if key not in self._lanes:
+                self._lanes[key] = len(self._lanes) + 1
+            return self._lanes[key]
+
+@contextmanager
+def start_trace(name: str) -> Iterator[Tracer]:
+    """Collect every span recorded inside the block into a new Tracer"""
+    tracer = Tracer(name)
+    token = _tracer.set(tracer)
+    try:
+        yield tracer
+    finally:
+        _tracer.reset(token)
+
+@contextmanager
+def trace_span(name: str, category: str = 'stage', **args) -> Iterator[None]:
+    """Time the block as a span of the current trace (no-op outside a trace)"""
+    tracer = _tracer.get()
+    if tracer is None:
+        yield
+        return
+    
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        tracer.add_span(name, start, time.perf_counter() - start, category, args)
+
+def traced(name: str, category: str = 'stage') -> Callable:
+    """Decorator form of trace_span for plain functions"""
+    def decorator(func: Callable) -> Callable:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _tracer.get() is None:
+                return func(*args, **kwargs)
+            with trace_span(name, category):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def record_span(name: str, duration: float, category: str = 'stage', **args):
+    """Record a span that just ended after duration seconds (no-op outside a trace)"""
+    tracer = _tracer.get()
+    if tracer is not None:
+        tracer.add_span(name, time.perf_counter() - duration, duration, category, args)
+
+class TraceStore:
+    """Keeps the most recent traces as Chrome trace JSON files on disk"""
+    
+    def __init__(self, traces_dir: str, keep: int = 50):
+        self.traces_dir = traces_dir
+        self.keep = keep
+    
+    def save(self, trace_id: str, tracer: Tracer):
+        """Write a trace atomically and drop the oldest ones beyond keep"""
+        os.makedirs(self.traces_dir, exist_ok=True)
+        path = self._trace_path(trace_id)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(tracer.to_chrome_trace(), f)
+        os.replace(tmp_path, path)
+        
+        self._prune()
+    
+    def load(self, trace_id: str) -> Optional[Dict[str, Any]]:
+        """Read a stored trace by id"""
+        if not trace_id or not all(c in '0123456789abcdef' for c in trace_id):
+            return None
+        try:
+            with open(self._trace_path(trace_id), 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
+    
+    def _trace_path(self, trace_id: str) -> str:
+        return os.path.join(self.traces_dir, f"{trace_id}.json")
+    
+    def _prune(self):
+        paths: List[str] = [
+            os.path.join(self.traces_dir, name)
+            for name in os.listdir(self.traces_dir) if name.endswith('.json')
+        ]
+        paths.sort(key=os.path.getmtime)
+        for path in paths[:max(0, len(paths) - self.keep)]:
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
@@ -2,11 +2,15 @@
 from .agent_prompts import (
     JOB_INTAKE_PROMPT,
     RESUME_SCREENING_PROMPT,
-    EVALUATOR_PROMPT
+    RECOMMENDATION_REASON_PROMPT,
+    BATCH_CANDIDATE_TEMPLATE,
+    BATCH_RESUME_SCREENING_PROMPT
 )
 
 __all__ = [
     'JOB_INTAKE_PROMPT',
     'RESUME_SCREENING_PROMPT',
-    'EVALUATOR_PROMPT'
+    'RECOMMENDATION_REASON_PROMPT',
+    'BATCH_CANDIDATE_TEMPLATE',
+    'BATCH_RESUME_SCREENING_PROMPT'
 ]
@@ -44,6 +44,8 @@ Education: {education}
 Skills: {skills}
 Experience: {experience}
 Certifications: {certifications}
+Resume Text (extracted from the candidate's PDF; use it to confirm and fill gaps in the fields above):
+{resume_text}
 
 EVALUATION PROCESS - Follow these steps systematically:
 
@@ -108,61 +110,119 @@ CRITICAL INSTRUCTIONS FOR CONSISTENCY:
 - Follow the 6-step process in order for consistent results
 """
 
-EVALUATOR_PROMPT = """
-You are an expert hiring manager. Review the screening results and provide final recommendations using systematic evaluation.
+RECOMMENDATION_REASON_PROMPT = """
+You are an expert hiring manager. The candidates below have already been screened and ranked. Write a short recommendation reason for each of them.
 
 Job Description:
 {job_description}
 
-Candidates Screening Results:
-{screening_results}
+Shortlisted Candidates (ranked by match_score, highest = rank 1):
+{shortlisted_candidates}
 
-EVALUATION PROCESS - Follow these steps:
+Return in JSON format, with exactly one entry per candidate:
+{{
+    "reasons": [
+        {{
+            "rank": 1,
+            "recommendation_reason": "Why this candidate is recommended"
+        }}
+    ]
+}}
+
+CRITICAL INSTRUCTIONS FOR CONSISTENCY:
+- Use the EXACT rank of each candidate from the list above - do NOT re-rank
+- Base each recommendation_reason ONLY on that candidate's screening data - no external knowledge
+- Mention concrete matched skills or strengths; do not invent qualifications
+- Keep each recommendation_reason to one or two sentences
+"""
+
+BATCH_CANDIDATE_TEMPLATE = """[{candidate_id}]
+Name: {candidate_name}
+Target Role: {target_role}
+Years of Experience: {years_experience}
+Education: {education}
+Skills: {skills}
+Experience: {experience}
+Certifications: {certifications}
+Resume Text:
+{resume_text}
+"""
 
-STEP 1 - FILTER: Include ONLY candidates with match_score >= 70
+BATCH_RESUME_SCREENING_PROMPT = """
+You are an expert resume screener. Evaluate EACH of the following candidates against the job requirements using a systematic approach.
 
-STEP 2 - RANK: Sort by match_score in descending order (highest = rank 1)
+Job Requirements:
+{job_requirements}
+
+Candidates (each starts with its candidate_id in square brackets):
+{candidates}
 
-STEP 3 - ANALYZE EACH CANDIDATE:
-- Extract key_strengths from their screening result
-- Create recommendation_reason from factual screening data
-- Identify interview_focus_areas from weaknesses/missing_skills
+EVALUATION PROCESS - Follow these steps systematically for EACH candidate:
 
-STEP 4 - GENERATE SUMMARY:
-- Count total reviewed and shortlisted
-- Extract top_skills_found from matched_skills of shortlisted candidates
-- Assess quality: excellent (avg≥85), good (70-84), fair (50-69), poor (<50)
+STEP 1 - SKILLS ANALYSIS: Compare candidate skills with job requirements
+- List matched skills (skills in BOTH candidate profile AND job requirements)
+- List missing skills (required skills NOT in candidate profile)
+- Calculate match_percentage = (matched count / total required) * 100
 
-Return in JSON format:
+STEP 2 - EXPERIENCE EVALUATION: Assess years and relevance
+- Compare candidate years with requirements
+- Determine if qualified (meets/exceeds years required)
+- Score relevance based on job role alignment
+
+STEP 3 - EDUCATION CHECK: Verify education requirements
+- Check if candidate meets minimum education
+- Score education fit for the role
+
+STEP 4 - CALCULATE MATCH SCORE (0-100):
+Formula: (skills_match % × 0.5) + (experience_score × 0.35) + (education_score × 0.15)
+
+STEP 5 - DETERMINE RECOMMENDATION:
+- 85-100: "strong_match"
+- 70-84: "good_match"
+- 50-69: "potential_match"
+- 0-49: "not_recommended"
+
+STEP 6 - IDENTIFY STRENGTHS & WEAKNESSES:
+- List top 3 strengths from actual data
+- List top 2 gaps or missing qualifications
+
+Return your evaluations in JSON format, with exactly one entry per candidate:
 {{
-    "shortlisted_candidates": [
+    "results": [
         {{
-            "candidate_name": "Name",
-            "match_score": 95,
-            "rank": 1,
-            "key_strengths": ["strength1", "strength2", "strength3"],
-            "recommendation_reason": "Why this candidate is recommended",
-            "interview_focus_areas": ["area1", "area2"]
+            "candidate_id": "C1",
+            "match_score": 85,
+            "skills_match": {{
+                "matched_skills": ["skill1", "skill2"],
+                "missing_skills": ["skill1", "skill2"],
+                "match_percentage": 75
+            }},
+            "experience_match": {{
+                "is_qualified": true,
+                "years_gap": 0,
+                "relevance_score": 90
+            }},
+            "education_match": {{
+                "meets_requirements": true,
+                "education_score": 85
+            }},
+            "strengths": ["strength1", "strength2", "strength3"],
+            "weaknesses": ["weakness1", "weakness2"],
+            "overall_assessment": "Brief assessment of the candidate",
+            "recommendation": "strong_match/good_match/potential_match/not_recommended"
         }}
-    ],
-    "summary": {{
-        "total_candidates_reviewed": 5,
-        "total_shortlisted": 3,
-        "top_skills_found": ["skill1", "skill2"],
-        "overall_candidate_quality": "excellent/good/fair/poor"
-    }}
+    ]
 }}
 
 CRITICAL INSTRUCTIONS FOR CONSISTENCY:
-- Use ONLY information from screening results - no external knowledge
-- For candidate_name and match_score: use EXACT values from screening results
-- For rank: assign strictly by match_score descending (highest = 1)
-- For key_strengths: extract ONLY from "strengths" field in screening result
-- For recommendation_reason: base on factual screening data only
-- For interview_focus_areas: derive from "weaknesses"/"missing_skills" in screening result
-- For total_candidates_reviewed: count EXACT number in screening results
-- For total_shortlisted: count ONLY candidates with match_score >= 70
-- For top_skills_found: extract from "matched_skills" of shortlisted candidates only
-- For overall_candidate_quality: calculate average and apply thresholds strictly
-- Follow the 4-step process in order for consistent ranking
+- Return one result for EVERY candidate_id listed above, using the exact candidate_id
+- Evaluate each candidate independently - never compare candidates or let one affect another's score
+- Base evaluation ONLY on provided data - no assumptions or external knowledge
+- For matched_skills: include ONLY skills in BOTH candidate profile AND job requirements (case-insensitive)
+- For missing_skills: include ONLY required skills NOT in candidate profile
+- Calculate match_percentage exactly: (matched count / required count) * 100
+- Use the exact weighted formula for match_score calculation
+- Apply recommendation thresholds strictly
+- For strengths/weaknesses: cite ONLY factual evidence from provided data
+- Follow the 6-step process in order for consistent results
 """
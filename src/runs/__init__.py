@@ -0,0 +1,4 @@
+# Runs Package
+from .shortlist_runs import ShortlistRunQueue
+
+__all__ = ['ShortlistRunQueue']
@@ -0,0 +1,169 @@
+# Shortlist Runs - Background Queue for Long-Running Shortlist Pipelines
+import asyncio
+import collections
+import glob
+import json
+import os
+import threading
+import uuid
+from datetime import datetime
+from typing import Dict, Any, Optional, Callable, Awaitable, Tuple
+
+RUNS_FOLDER = "shortlistRuns"
+
+# Statuses a run can no longer leave
+FINISHED_STATUSES = ('completed', 'failed', 'interrupted')
+
+class ShortlistRunQueue:
+    """In-process queue that runs shortlist pipelines in the background
+    
+    Each run is recorded in data/JobX/shortlistRuns/<run_id>.json, so its status
+    and final result survive page reloads and client timeouts. At most
+    max_parallel_runs pipelines execute at once; the rest wait as "queued".
+    Only the max_finished_runs most recently finished records stay in memory;
+    older ones are served from their files.
+    """
+    
+    def __init__(self, data_dir: str = "data", max_parallel_runs: int = 2, max_finished_runs: int = 100):
+        self.data_dir = data_dir
+        self.max_parallel_runs = max(1, max_parallel_runs)
+        self.max_finished_runs = max(0, max_finished_runs)
+        self._runs = {}   # run_id -> record, for runs started by this process
+        self._tasks = {}  # run_id -> asyncio.Task
+        self._finished = collections.deque()  # finished run ids, oldest first
+        self._slots = None
+    
+    def submit(
+        self, 
+        job_id: str, 
+        runner: Callable[[Callable[[str, Dict[str, Any]], None]], Awaitable[Tuple[int, Dict[str, Any]]]]
+    ) -> Dict[str, Any]:
+        """
+        Queue a shortlist run; must be called from the event loop
+        
+        Args:
+            job_id: Job the run belongs to (results are stored under its folder)
+            runner: Coroutine function taking an emit callback and returning (status code, content)
+        
+        Returns:
+            The new run record
+        
+        Raises:
+            ValueError: job_id is not a plain folder name
+        """
+        if os.path.basename(job_id) != job_id or job_id.startswith('.'):
+            raise ValueError(f"Invalid job id '{job_id}'")
+        if self._slots is None:
+            self._slots = asyncio.Semaphore(self.max_parallel_runs)
+        
+        run_id = uuid.uuid4().hex
+        record = {
+            'run_id': run_id,
+            'job_id': job_id,
+            'status': 'queued',
+            'created_at': datetime.now().isoformat(timespec='seconds'),
+            'started_at': None,
+            'finished_at': None,
+            'stage': None,
+            'progress': {'completed': 0, 'total': 0},
+            'error': None
+        }
+        self._runs[run_id] = record
+        self._save(record)
+        
+        self._tasks[run_id] = asyncio.create_task(self._execute(record, runner))
+        return dict(record)
+    
+    def get(self, run_id: str) -> Optional[Dict[str, Any]]:
+        """Status of a run (without its result), from memory or disk"""
+        record = self._runs.get(run_id) or self._load(run_id)
+        if record is None:
+            return None
+        
+        status = {k: v for k, v in record.items() if k != 'result'}
+        if run_id not in self._runs and status['status'] not in FINISHED_STATUSES:
+            # Left unfinished by a previous server process
+            status['status'] = 'interrupted'
+        return status
+    
+    def get_result(self, run_id: str) -> Optional[Dict[str, Any]]:
+        """Full record including the result once the run has finished"""
+        record = self._runs.get(run_id)
+        if record is None or record['status'] in FINISHED_STATUSES:
+            record = self._load(run_id) or record
+        return record
+    
+    async def _execute(self, record: Dict[str, Any], runner):
+        """Wait for a slot, run the pipeline and store its outcome"""
+        try:
+            async with self._slots:
+                record['status'] = 'running'
+                record['started_at'] = datetime.now().isoformat(timespec='seconds')
+                self._save(record)
+                
+                status_code, content = await runner(lambda event, payload: self._on_event(record, event, payload))
+                
+                record['status'] = 'completed' if status_code == 200 else 'failed'
+                record['status_code'] = status_code
+                record['error'] = None if status_code == 200 else content.get('error')
+                record['result'] = content
+        except Exception as e:
+            print(f"❌ Shortlist run {record['run_id']} failed: {str(e)}")
+            record['status'] = 'failed'
+            record['status_code'] = 500
+            record['error'] = str(e)
+        finally:
+            record['finished_at'] = datetime.now().isoformat(timespec='seconds')
+            self._save(record)
+            # The file now holds the result; keep only the lightweight status in memory
+            record.pop('result', None)
+            self._tasks.pop(record['run_id'], None)
+            self._forget_finished(record['run_id'])
+    
+    def _forget_finished(self, run_id: str):
+        """Drop the oldest finished records from memory beyond max_finished_runs"""
+        self._finished.append(run_id)
+        while len(self._finished) > self.max_finished_runs:
+            self._runs.pop(self._finished.popleft(), None)
+    
+    def _on_event(self, record: Dict[str, Any], event: str, payload: Dict[str, Any]):
+        """Track pipeline progress; stage changes are persisted, per-candidate ticks are not"""
+        if event == 'stage':
+            record['stage'] = payload.get('stage')
+            if payload.get('stage') == 'screening' and payload.get('status') == 'started':
+                record['progress'] = {'completed': 0, 'total': payload.get('total', 0)}
+            self._save(record)
+        elif event == 'candidate':
+            record['progress'] = {'completed': payload.get('completed', 0), 'total': payload.get('total', 0)}
+    
+    def _run_path(self, job_id: str, run_id: str) -> str:
+        return os.path.join(self.data_dir, job_id, RUNS_FOLDER, f"{run_id}.json")
+    
+    def _save(self, record: Dict[str, Any]):
+        """Atomically write a run record under its job folder"""
+        path = self._run_path(record['job_id'], record['run_id'])
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            json.dump(record, f, indent=2, ensure_ascii=False)
+        os.replace(tmp_path, path)
+    
+    def _load(self, run_id: str) -> Optional[Dict[str, Any]]:
+        """Find a run record on disk by id"""
+        if not run_id or not all(c in '0123456789abcdef' for c in run_id):
+            return None
+        
+        record = self._runs.get(run_id)
+        if record:
+            path = self._run_path(record['job_id'], run_id)
+        else:
+            matches = glob.glob(os.path.join(self.data_dir, '*', RUNS_FOLDER, f"{run_id}.json"))
+            if not matches:
+                return None
+            path = matches[0]
+        
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                return json.load(f)
+        except (OSError, json.JSONDecodeError):
+            return None
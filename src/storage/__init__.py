@@ -0,0 +1,23 @@
+# Storage Package
+from .candidate_index import CandidateIndex
+from .allocation import claim_folder, next_job_ids
+from .candidate_snapshot import CandidateSnapshot, CandidateSnapshotStore, build_snapshot
+from .candidate_query import (
+    encode_cursor,
+    decode_cursor,
+    build_candidate_filter,
+    project_candidate
+)
+
+__all__ = [
+    'CandidateIndex',
+    'claim_folder',
+    'next_job_ids',
+    'CandidateSnapshot',
+    'CandidateSnapshotStore',
+    'build_snapshot',
+    'encode_cursor',
+    'decode_cursor',
+    'build_candidate_filter',
+    'project_candidate'
+]
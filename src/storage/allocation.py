@@ -0,0 +1,49 @@
+# Allocation - Race-Free Names for New Job and Candidate Folders
+import errno
+import itertools
+import os
+from typing import Iterable, Iterator
+
+def claim_folder(staging_dir: str, parent_dir: str, names: Iterable[str]) -> str:
+    """
+    Move a fully written staging folder to the first free name under parent_dir
+    
+    Each attempt is a single rename, which fails if the name already holds a
+    folder with content, so there is no existence check that could go stale:
+    concurrent requests, or several worker processes, can never claim the
+    same name or overwrite each other; a taken name just moves on to the next.
+    
+    Args:
+        staging_dir: Complete folder to publish (same filesystem as parent_dir)
+        parent_dir: Folder the new folder appears in
+        names: Candidate names in order of preference (must not run out)
+    
+    Returns:
+        The name the folder was published under
+    
+    Raises:
+        ValueError: A name is not a plain folder name directly under parent_dir
+    """
+    os.makedirs(parent_dir, exist_ok=True)
+    real_parent = os.path.realpath(parent_dir)
+    for name in names:
+        if name in ('', '.', '..') or os.path.dirname(os.path.realpath(os.path.join(parent_dir, name))) != real_parent:
+            raise ValueError(f"Folder name '{name}' would leave {parent_dir}")
+        try:
+            os.rename(staging_dir, os.path.join(parent_dir, name))
+            return name
+        except OSError as e:
+            if e.errno not in (errno.EEXIST, errno.ENOTEMPTY):
+                raise
+    raise FileExistsError(f"No free folder name left under {parent_dir}")
+
+def next_job_ids(data_dir: str, prefix: str = "Job") -> Iterator[str]:
+    """JobN names starting after the highest existing number (a hint; claim_folder settles races)"""
+    existing = []
+    if os.path.isdir(data_dir):
+        for folder_name in os.listdir(data_dir):
+            if folder_name.startswith(prefix) and folder_name[len(prefix):].isdigit():
+                existing.append(int(folder_name[len(prefix):]))
+    
+    start = max(existing) + 1 if existing else 1
+    return (f"{prefix}{number}" for number in itertools.count(start))
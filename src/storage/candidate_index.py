@@ -0,0 +1,498 @@
+# Candidate Index - In-Process Store of Jobs and Applications
+import bisect
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from typing import Dict, Any, List, Optional, Callable, Tuple
+
+class CandidateIndex:
+    """In-memory index of jobs and candidate applications under the data folder
+    
+    The filesystem stays the source of truth: the index is built from
+    data/JobX/jobDescription.txt and data/JobX/applications/*/generalInformation.json
+    once, then kept current by add_job/add_candidate as the API writes new files.
+    With sqlite_path set, the index is also persisted so restarts skip the scan.
+    
+    With revalidate_seconds set, reads at most that often compare each job
+    folder's jobDescription.txt and applications/ modification times with the
+    last scan, and rescan only the jobs that changed (reading just new candidate
+    folders). That picks up jobs and candidates written by other worker
+    processes or the bulk import CLI. Edits of an existing
+    generalInformation.json do not change those times, so listing a job's
+    candidates also compares each candidate file's modification time and
+    reloads the files that changed.
+    """
+    
+    def __init__(self, data_dir: str = "data", sqlite_path: Optional[str] = None, revalidate_seconds: Optional[float] = None):
+        self.data_dir = data_dir
+        self.sqlite_path = sqlite_path
+        self.revalidate_seconds = revalidate_seconds
+        self._lock = threading.RLock()
+        self._revalidate_lock = threading.Lock()
+        self._last_revalidate = time.monotonic()
+        self._signatures = {}  # job_id -> modification times of the job folder at its last scan
+        self._jobs = {}        # job_id -> {'id', 'name', 'description'}
+        self._candidates = {}  # job_id -> {folder_name: candidate data}
+        self._order = {}       # job_id -> sorted folder names, for cursor pagination
+        self._mtimes = {}      # job_id -> {folder_name: generalInformation.json mtime_ns when read}
+        self.version = 0       # bumped on every change, so derived copies can tell they are stale
+        self._db = None
+        
+        if self.sqlite_path:
+            self._db = sqlite3.connect(self.sqlite_path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS jobs (job_id TEXT PRIMARY KEY, description TEXT NOT NULL)"
+            )
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS candidates ("
+                "job_id TEXT NOT NULL, folder_name TEXT NOT NULL, data TEXT NOT NULL, mtime_ns INTEGER, "
+                "PRIMARY KEY (job_id, folder_name))"
+            )
+            # Databases created before file times were tracked
+            if 'mtime_ns' not in {row[1] for row in self._db.execute("PRAGMA table_info(candidates)")}:
+                self._db.execute("ALTER TABLE candidates ADD COLUMN mtime_ns INTEGER")
+            self._db.commit()
+    
+    def load(self):
+        """Populate the index from SQLite if it has data, otherwise from the filesystem"""
+        if self._db and self._load_from_db():
+            print(f"✅ Candidate index loaded from {self.sqlite_path}")
+            # The copy may predate jobs and candidates written since; pick those up now
+            self.revalidate(force=True)
+            return
+        self.rebuild()
+    
+    def rebuild(self):
+        """Rescan the data folder and replace the index (and SQLite copy) with it"""
+        signatures = self._job_signatures()
+        jobs, candidates, mtimes = self._scan_data_dir()
+        
+        with self._lock:
+            self._jobs = jobs
+            self._candidates = candidates
+            self._order = {job_id: sorted(job_candidates) for job_id, job_candidates in candidates.items()}
+            self._mtimes = mtimes
+            self._signatures = signatures
+            self._last_revalidate = time.monotonic()
+            self.version += 1
+            if self._db:
+                with self._db:
+                    self._db.execute("DELETE FROM jobs")
+                    self._db.execute("DELETE FROM candidates")
+                    self._db.executemany(
+                        "INSERT INTO jobs (job_id, description) VALUES (?, ?)",
+                        [(job_id, job['description']) for job_id, job in jobs.items()]
+                    )
+                    self._db.executemany(
+                        "INSERT INTO candidates (job_id, folder_name, data, mtime_ns) VALUES (?, ?, ?, ?)",
+                        [
+                            (job_id, folder_name, json.dumps(data, ensure_ascii=False), mtimes[job_id].get(folder_name))
+                            for job_id, job_candidates in candidates.items()
+                            for folder_name, data in job_candidates.items()
+                        ]
+                    )
+        
+        print(f"✅ Candidate index built: {len(jobs)} jobs, {sum(len(c) for c in candidates.values())} candidates")
+    
+    def revalidate(self, force: bool = False) -> bool:
+        """
+        Rescan the job folders changed on disk since they were last scanned
+        
+        Runs at most once per revalidate_seconds (never when it is None) unless
+        force is set; concurrent callers skip instead of waiting.
+        
+        Returns:
+            True if any job folder was rescanned
+        """
+        if not force and (self.revalidate_seconds is None or time.monotonic() - self._last_revalidate < self.revalidate_seconds):
+            return False
+        if not self._revalidate_lock.acquire(blocking=False):
+            return False
+        
+        try:
+            self._last_revalidate = time.monotonic()
+            # Signatures are taken before scanning, so writes during the scan show up next time
+            signatures = self._job_signatures()
+            with self._lock:
+                changed = [job_id for job_id, signature in signatures.items() if self._signatures.get(job_id) != signature]
+                removed = [job_id for job_id in set(self._candidates) | set(self._jobs) if job_id not in signatures]
+                known = {job_id: set(self._candidates.get(job_id, {})) for job_id in changed}
+            if not changed and not removed:
+                return False
+            
+            scanned = {job_id: self._scan_job(job_id, known[job_id]) for job_id in changed}
+            
+            with self._lock:
+                for job_id in removed:
+                    self._jobs.pop(job_id, None)
+                    self._candidates.pop(job_id, None)
+                    self._order.pop(job_id, None)
+                    self._mtimes.pop(job_id, None)
+                    self._signatures.pop(job_id, None)
+                
+                new_rows = []
+                gone_rows = []
+                for job_id, (job, new_candidates, present, new_mtimes) in scanned.items():
+                    if job:
+                        self._jobs[job_id] = job
+                    else:
+                        self._jobs.pop(job_id, None)
+                    job_candidates = self._candidates.setdefault(job_id, {})
+                    job_mtimes = self._mtimes.setdefault(job_id, {})
+                    for folder_name in [name for name in job_candidates if name not in present]:
+                        del job_candidates[folder_name]
+                        job_mtimes.pop(folder_name, None)
+                        gone_rows.append((job_id, folder_name))
+                    job_candidates.update(new_candidates)
+                    job_mtimes.update(new_mtimes)
+                    new_rows.extend(
+                        (job_id, folder_name, json.dumps(data, ensure_ascii=False), new_mtimes.get(folder_name))
+                        for folder_name, data in new_candidates.items()
+                    )
+                    self._order[job_id] = sorted(job_candidates)
+                    self._signatures[job_id] = signatures[job_id]
+                self.version += 1
+                
+                if self._db:
+                    with self._db:
+                        self._db.executemany("DELETE FROM jobs WHERE job_id = ?", [(job_id,) for job_id in removed])
+                        self._db.executemany("DELETE FROM candidates WHERE job_id = ?", [(job_id,) for job_id in removed])
+                        self._db.executemany(
+                            "INSERT OR REPLACE INTO jobs (job_id, description) VALUES (?, ?)",
+                            [(job_id, job['description']) for job_id, (job, _, _, _) in scanned.items() if job]
+                        )
+                        self._db.executemany("DELETE FROM candidates WHERE job_id = ? AND folder_name = ?", gone_rows)
+                        self._db.executemany(
+                            "INSERT OR REPLACE INTO candidates (job_id, folder_name, data, mtime_ns) VALUES (?, ?, ?, ?)",
+                            new_rows
+                        )
+            
+            if removed or new_rows or gone_rows:
+                print(f"🔄 Candidate index revalidated: {len(new_rows)} new and {len(gone_rows)} removed candidates, "
+                      f"{len(removed)} removed jobs")
+            return True
+        finally:
+            self._revalidate_lock.release()
+    
+    def refresh_candidates(self, job_id: Optional[str] = None) -> bool:
+        """
+        Reload candidate files edited since they were read (one stat per candidate)
+        
+        Args:
+            job_id: Only check this job's candidates (default: every job)
+        
+        Returns:
+            True if any candidate was reloaded
+        """
+        with self._lock:
+            job_ids = [job_id] if job_id is not None else list(self._candidates)
+            known = {
+                (job, folder_name): self._mtimes.get(job, {}).get(folder_name)
+                for job in job_ids
+                for folder_name in self._candidates.get(job, {})
+            }
+        
+        reloaded = {}
+        for (job, folder_name), known_mtime in known.items():
+            json_file = os.path.join(self.data_dir, job, "applications", folder_name, "generalInformation.json")
+            mtime = _mtime_ns(json_file)
+            # A missing file is left to revalidate(), which drops removed folders
+            if mtime is None or mtime == known_mtime:
+                continue
+            try:
+                with open(json_file, 'r', encoding='utf-8') as f:
+                    candidate_data = json.load(f)
+            except Exception as e:
+                print(f"Error reading {json_file}: {str(e)}")
+                continue
+            candidate_data['folderName'] = folder_name
+            reloaded[(job, folder_name)] = (candidate_data, mtime)
+        
+        if not reloaded:
+            return False
+        
+        with self._lock:
+            rows = []
+            for (job, folder_name), (candidate_data, mtime) in reloaded.items():
+                if folder_name not in self._candidates.get(job, {}):
+                    continue
+                self._candidates[job][folder_name] = candidate_data
+                self._mtimes.setdefault(job, {})[folder_name] = mtime
+                rows.append((job, folder_name, json.dumps(candidate_data, ensure_ascii=False), mtime))
+            self.version += 1
+            if self._db:
+                with self._db:
+                    self._db.executemany(
+                        "INSERT OR REPLACE INTO candidates (job_id, folder_name, data, mtime_ns) VALUES (?, ?, ?, ?)",
+                        rows
+                    )
+        
+        print(f"🔄 Candidate index reloaded {len(reloaded)} edited candidate files")
+        return True
+    
+    def list_jobs(self) -> List[Dict[str, Any]]:
+        """All jobs that have a job description"""
+        self.revalidate()
+        with self._lock:
+            return [dict(job) for job in self._jobs.values()]
+    
+    def get_job(self, job_id: str) -> Optional[Dict[str, Any]]:
+        self.revalidate()
+        with self._lock:
+            job = self._jobs.get(job_id)
+            return dict(job) if job else None
+    
+    def add_job(self, job_id: str, description: str):
+        """Record a newly created (or updated) job"""
+        with self._lock:
+            self._jobs[job_id] = {'id': job_id, 'name': job_id, 'description': description}
+            self._candidates.setdefault(job_id, {})
+            self._order.setdefault(job_id, [])
+            self.version += 1
+            if self._db:
+                with self._db:
+                    self._db.execute(
+                        "INSERT OR REPLACE INTO jobs (job_id, description) VALUES (?, ?)",
+                        (job_id, description)
+                    )
+    
+    def list_candidates(self, job_id: str) -> List[Dict[str, Any]]:
+        """All candidates of a job, each including its folderName, as currently on disk"""
+        self.revalidate()
+        self.refresh_candidates(job_id)
+        with self._lock:
+            return [dict(candidate) for candidate in self._candidates.get(job_id, {}).values()]
+    
+    def count_candidates(self, job_id: str) -> int:
+        self.revalidate()
+        with self._lock:
+            return len(self._candidates.get(job_id, {}))
+    
+    def query_candidates(
+        self, 
+        job_id: str, 
+        predicate: Optional[Callable[[Dict[str, Any]], bool]] = None, 
+        after: Optional[str] = None, 
+        limit: Optional[int] = None
+    ) -> Tuple[List[Dict[str, Any]], int, Optional[str]]:
+        """
+        Page through a job's candidates in folder-name order
+        
+        Args:
+            job_id: Job folder name
+            predicate: Keep only candidates for which this returns True (optional)
+            after: Folder name of the last candidate on the previous page (optional)
+            limit: Maximum candidates to return (None = all remaining)
+        
+        Returns:
+            Tuple of (page of candidates, total matching candidates, folder name to resume after or None)
+        """
+        self.revalidate()
+        self.refresh_candidates(job_id)
+        with self._lock:
+            job_candidates = self._candidates.get(job_id, {})
+            order = self._order.get(job_id, [])
+            start = bisect.bisect_right(order, after) if after else 0
+            
+            page = []
+            next_after = None
+            for folder_name in order[start:]:
+                candidate = job_candidates[folder_name]
+                if predicate and not predicate(candidate):
+                    continue
+                if limit is not None and len(page) >= limit:
+                    # Another match exists, so the page needs a cursor
+                    next_after = page[-1]['folderName']
+                    break
+                page.append(dict(candidate))
+            
+            if predicate:
+                total = sum(1 for candidate in job_candidates.values() if predicate(candidate))
+            else:
+                total = len(job_candidates)
+            
+            return page, total, next_after
+    
+    def get_candidate(self, job_id: str, folder_name: str) -> Optional[Dict[str, Any]]:
+        self.revalidate()
+        self.refresh_candidates(job_id)
+        with self._lock:
+            candidate = self._candidates.get(job_id, {}).get(folder_name)
+            return dict(candidate) if candidate else None
+    
+    def content_signature(self) -> str:
+        """Hash of every indexed candidate's job, folder and file time; equal across processes for the same files"""
+        with self._lock:
+            return self._content_signature()
+    
+    def snapshot_candidates(self) -> Tuple[str, List[Tuple[str, Dict[str, Any]]]]:
+        """content_signature() plus every (job id, candidate) pair in job and folder-name order, taken atomically"""
+        self.revalidate()
+        with self._lock:
+            return self._content_signature(), [
+                (job_id, dict(self._candidates[job_id][folder_name]))
+                for job_id in sorted(self._candidates)
+                for folder_name in self._order.get(job_id, [])
+            ]
+    
+    def add_candidate(self, job_id: str, folder_name: str, candidate_data: Dict[str, Any]):
+        """Record a newly saved (or updated) generalInformation.json"""
+        self.add_candidates(job_id, [(folder_name, candidate_data)])
+    
+    def add_candidates(self, job_id: str, entries: List[Tuple[str, Dict[str, Any]]]):
+        """Record many saved candidates of one job in a single pass (one sort, one SQLite transaction)"""
+        candidates = []
+        for folder_name, candidate_data in entries:
+            candidate = dict(candidate_data)
+            candidate['folderName'] = folder_name
+            candidates.append(candidate)
+        # Times of the files just written, so later reads only reload them once they are edited
+        mtimes = {
+            c['folderName']: _mtime_ns(os.path.join(
+                self.data_dir, job_id, "applications", c['folderName'], "generalInformation.json"
+            ))
+            for c in candidates
+        }
+        
+        with self._lock:
+            job_candidates = self._candidates.setdefault(job_id, {})
+            order = self._order.setdefault(job_id, [])
+            new_names = list(dict.fromkeys(c['folderName'] for c in candidates if c['folderName'] not in job_candidates))
+            if len(new_names) == 1:
+                bisect.insort(order, new_names[0])
+            elif new_names:
+                order.extend(new_names)
+                order.sort()
+            
+            job_mtimes = self._mtimes.setdefault(job_id, {})
+            for candidate in candidates:
+                job_candidates[candidate['folderName']] = candidate
+                job_mtimes[candidate['folderName']] = mtimes[candidate['folderName']]
+            self.version += 1
+            
+            if self._db:
+                with self._db:
+                    self._db.executemany(
+                        "INSERT OR REPLACE INTO candidates (job_id, folder_name, data, mtime_ns) VALUES (?, ?, ?, ?)",
+                        [
+                            (job_id, c['folderName'], json.dumps(c, ensure_ascii=False), mtimes[c['folderName']])
+                            for c in candidates
+                        ]
+                    )
+    
+    def _content_signature(self) -> str:
+        digest = hashlib.sha256()
+        for job_id in sorted(self._candidates):
+            job_mtimes = self._mtimes.get(job_id, {})
+            for folder_name in self._order.get(job_id, []):
+                digest.update(f"{job_id}/{folder_name}:{job_mtimes.get(folder_name)}\n".encode('utf-8'))
+        return digest.hexdigest()
+    
+    def _scan_data_dir(self):
+        """Read every job description and candidate file under the data folder"""
+        jobs = {}
+        candidates = {}
+        mtimes = {}
+        
+        for job_folder in sorted(self._job_signatures()):
+            job, job_candidates, _, job_mtimes = self._scan_job(job_folder)
+            if job:
+                jobs[job_folder] = job
+            candidates[job_folder] = job_candidates
+            mtimes[job_folder] = job_mtimes
+        
+        return jobs, candidates, mtimes
+    
+    def _scan_job(self, job_folder: str, known: Optional[set] = None):
+        """
+        Read one job folder
+        
+        Args:
+            job_folder: Job folder name
+            known: Candidate folders already indexed, which are not read again
+        
+        Returns:
+            Tuple of (job or None without a description, newly read candidates by folder name,
+            names of all candidate folders present, file modification times of the newly read candidates)
+        """
+        job_path = os.path.join(self.data_dir, job_folder)
+        known = known or set()
+        
+        job = None
+        job_desc_path = os.path.join(job_path, "jobDescription.txt")
+        if os.path.exists(job_desc_path):
+            with open(job_desc_path, 'r', encoding='utf-8') as f:
+                job = {'id': job_folder, 'name': job_folder, 'description': f.read()}
+        
+        applications_dir = os.path.join(job_path, "applications")
+        job_candidates = {}
+        present = set()
+        mtimes = {}
+        if os.path.isdir(applications_dir):
+            for student_folder in sorted(os.listdir(applications_dir)):
+                json_file = os.path.join(applications_dir, student_folder, "generalInformation.json")
+                if student_folder in known:
+                    present.add(student_folder)
+                    continue
+                # Taken before reading, so an edit during the read is picked up next time
+                mtime = _mtime_ns(json_file)
+                if mtime is None:
+                    continue
+                try:
+                    with open(json_file, 'r', encoding='utf-8') as f:
+                        candidate_data = json.load(f)
+                    candidate_data['folderName'] = student_folder
+                    job_candidates[student_folder] = candidate_data
+                    mtimes[student_folder] = mtime
+                    present.add(student_folder)
+                except Exception as e:
+                    print(f"Error reading {json_file}: {str(e)}")
+                    continue
+        
+        return job, job_candidates, present, mtimes
+    
+    def _job_signatures(self) -> Dict[str, Tuple[Optional[int], Optional[int]]]:
+        """Modification times of jobDescription.txt and applications/ for every job folder"""
+        signatures = {}
+        if not os.path.isdir(self.data_dir):
+            return signatures
+        
+        for job_folder in os.listdir(self.data_dir):
+            job_path = os.path.join(self.data_dir, job_folder)
+            if job_folder.startswith('.') or not os.path.isdir(job_path):
+                continue
+            signatures[job_folder] = tuple(
+                _mtime_ns(os.path.join(job_path, name)) for name in ("jobDescription.txt", "applications")
+            )
+        return signatures
+    
+    def _load_from_db(self) -> bool:
+        """Load the index from SQLite; returns False when the database is empty"""
+        with self._lock:
+            job_rows = self._db.execute("SELECT job_id, description FROM jobs ORDER BY job_id").fetchall()
+            if not job_rows:
+                return False
+            
+            self._jobs = {
+                job_id: {'id': job_id, 'name': job_id, 'description': description}
+                for job_id, description in job_rows
+            }
+            self._candidates = {job_id: {} for job_id in self._jobs}
+            self._mtimes = {job_id: {} for job_id in self._jobs}
+            for job_id, folder_name, data, mtime_ns in self._db.execute(
+                "SELECT job_id, folder_name, data, mtime_ns FROM candidates ORDER BY job_id, folder_name"
+            ):
+                self._candidates.setdefault(job_id, {})[folder_name] = json.loads(data)
+                self._mtimes.setdefault(job_id, {})[folder_name] = mtime_ns
+            self._order = {job_id: sorted(job_candidates) for job_id, job_candidates in self._candidates.items()}
+            self.version += 1
+            return True
+
+def _mtime_ns(path: str) -> Optional[int]:
+    try:
+        return os.stat(path).st_mtime_ns
+    except OSError:
+        return None
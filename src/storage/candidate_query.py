@@ -0,0 +1,123 @@
+# Candidate Query - Filters, Projection and Cursors for Candidate Listings
+import base64
+import copy
+from typing import Dict, Any, List, Optional, Callable
+from ..utils import extract_candidate_skills
+
+def encode_cursor(folder_name: str) -> str:
+    """Opaque pagination cursor for the candidate after which the next page starts"""
+    return base64.urlsafe_b64encode(folder_name.encode('utf-8')).decode('ascii')
+
+def decode_cursor(cursor: str) -> str:
+    """Inverse of encode_cursor; raises ValueError for malformed cursors"""
+    try:
+        return base64.urlsafe_b64decode(cursor.encode('ascii')).decode('utf-8')
+    except Exception:
+        raise ValueError("Invalid cursor")
+
+def _location_text(candidate: Dict[str, Any]) -> str:
+    """Location as lowercase text, whether stored as an object or a string"""
+    location = candidate.get('personalInfo', {}).get('location', '')
+    if isinstance(location, dict):
+        location = " ".join(str(v) for v in location.values() if v)
+    return str(location).lower()
+
+def build_candidate_filter(
+    status: Optional[str] = None, 
+    min_experience: Optional[float] = None, 
+    skill: Optional[str] = None, 
+    location: Optional[str] = None
+) -> Optional[Callable[[Dict[str, Any]], bool]]:
+    """
+    Build a predicate for CandidateIndex.query_candidates from query parameters
+    
+    Args:
+        status: Exact application status (case-insensitive)
+        min_experience: Minimum yearsOfExperience
+        skill: Substring any listed skill must contain (case-insensitive)
+        location: Substring of city/state/country (case-insensitive)
+    
+    Returns:
+        Predicate function, or None when no filter is set
+    """
+    checks = []
+    
+    if status:
+        wanted_status = status.strip().lower()
+        checks.append(lambda c: str(c.get('status', '')).lower() == wanted_status)
+    
+    if min_experience is not None:
+        def has_experience(c):
+            try:
+                return float(c.get('yearsOfExperience', 0) or 0) >= min_experience
+            except (TypeError, ValueError):
+                return False
+        checks.append(has_experience)
+    
+    if skill:
+        wanted_skill = skill.strip().lower()
+        checks.append(lambda c: any(wanted_skill in s.lower() for s in extract_candidate_skills(c)))
+    
+    if location:
+        wanted_location = location.strip().lower()
+        checks.append(lambda c: wanted_location in _location_text(c))
+    
+    if not checks:
+        return None
+    return lambda candidate: all(check(candidate) for check in checks)
+
+# Marks a dotted path that does not exist in a candidate
+_MISSING = object()
+
+def _project_path(value: Any, path: List[str]) -> Any:
+    """
+    The part of value along a dotted path, keeping its shape
+    
+    Dicts keep only the next key; a list is mapped element by element only
+    when the path continues into its items (e.g. experience.title), and a
+    list reached at the end of the path (e.g. skills.cloud) is kept whole.
+    """
+    if not path:
+        # A copy, so merging later fields never writes into the indexed candidate
+        return copy.deepcopy(value)
+    if isinstance(value, list):
+        projected_items = [_project_path(item, path) for item in value]
+        return [{} if item is _MISSING else item for item in projected_items]
+    if isinstance(value, dict) and path[0] in value:
+        inner = _project_path(value[path[0]], path[1:])
+        return _MISSING if inner is _MISSING else {path[0]: inner}
+    return _MISSING
+
+def _merge_projection(target: Any, value: Any) -> Any:
+    """Merge two projections of the same candidate: dicts by key, equally long lists element by element"""
+    if isinstance(target, dict) and isinstance(value, dict):
+        for key, item in value.items():
+            target[key] = _merge_projection(target[key], item) if key in target else item
+        return target
+    if isinstance(target, list) and isinstance(value, list) and len(target) == len(value):
+        return [_merge_projection(existing, item) for existing, item in zip(target, value)]
+    return value
+
+def project_candidate(candidate: Dict[str, Any], fields: List[str]) -> Dict[str, Any]:
+    """
+    Keep only the requested fields of a candidate (folderName is always kept)
+    
+    Args:
+        candidate: Candidate data from the index
+        fields: Top-level or dotted field names (e.g. personalInfo.email, experience.title)
+    
+    Returns:
+        Projected candidate dictionary
+    """
+    projected = {'folderName': candidate.get('folderName')}
+    
+    for field in fields:
+        path = [part for part in field.strip().split('.') if part]
+        if not path:
+            continue
+        
+        value = _project_path(candidate, path)
+        if value is not _MISSING:
+            projected = _merge_projection(projected, value)
+    
+    return projected
@@ -0,0 +1,295 @@
+# Candidate Snapshot - Columnar, Memory-Mapped Copy of All Candidates for Analytics
+import json
+import os
+import shutil
+import threading
+import time
+import uuid
+from datetime import date
+from typing import Dict, Any, List, Optional, Sequence, Tuple
+import numpy as np
+from ..utils.helpers import extract_candidate_skills
+from ..utils.prefilter import normalize_skill
+
+# Numeric columns of a snapshot build, one .npy file each
+COLUMNS = ('job', 'status', 'target_role', 'years_experience', 'application_day', 'skill_rows', 'skill_ids')
+CURRENT_FILE = "CURRENT"
+# Older builds are removed once unmodified for this long
+STALE_BUILD_SECONDS = 300
+# Histogram bucket edges (years) used when none are given
+DEFAULT_EXPERIENCE_BINS = (0, 1, 2, 3, 5, 8, 10, 15)
+
+class CandidateSnapshot:
+    """One immutable, memory-mapped snapshot of every candidate across all jobs
+    
+    Candidates are rows. String fields (job, lowercased status, target role) are stored
+    as integer codes into small vocabularies, years of experience as
+    float32 and the application date as days since 1970 (-1 if unknown).
+    Normalized skills are kept in coordinate form: skill_rows[i] has skill
+    skill_ids[i], each skill at most once per candidate. Questions such as
+    "how many candidates know Kubernetes" become array scans, without parsing
+    any generalInformation.json.
+    """
+    
+    def __init__(self, path: str):
+        self.path = path
+        with open(os.path.join(path, "meta.json"), 'r', encoding='utf-8') as f:
+            self.meta = json.load(f)
+        self.columns = {name: np.load(os.path.join(path, f"{name}.npy"), mmap_mode='r') for name in COLUMNS}
+        self._codes = {
+            vocabulary: {value: code for code, value in enumerate(self.meta[vocabulary])}
+            for vocabulary in ('jobs', 'statuses', 'target_roles', 'skills')
+        }
+    
+    @property
+    def rows(self) -> int:
+        return self.meta['rows']
+    
+    def select(
+        self,
+        job_id: Optional[str] = None,
+        status: Optional[str] = None,
+        min_years: Optional[float] = None,
+        max_years: Optional[float] = None,
+        skills: Sequence[str] = ()
+    ) -> np.ndarray:
+        """
+        Boolean row mask of the candidates matching every given filter
+        
+        Args:
+            job_id: Only candidates of this job
+            status: Only candidates with this application status (case-insensitive)
+            min_years: Minimum years of experience
+            max_years: Maximum years of experience
+            skills: Skills the candidate must all have (aliases are normalized)
+        
+        Returns:
+            Array of length rows
+        """
+        mask = np.ones(self.rows, dtype=bool)
+        if job_id is not None:
+            mask &= self.columns['job'] == self._code('jobs', job_id)
+        if status is not None:
+            mask &= self.columns['status'] == self._code('statuses', status.strip().lower())
+        if min_years is not None:
+            mask &= self.columns['years_experience'] >= min_years
+        if max_years is not None:
+            mask &= self.columns['years_experience'] <= max_years
+        for skill in skills:
+            mask &= self._has_skill(normalize_skill(skill))
+        return mask
+    
+    def count(self, **filters) -> int:
+        """Number of candidates matching select(**filters)"""
+        return int(self.select(**filters).sum())
+    
+    def skill_counts(self, mask: Optional[np.ndarray] = None, top: Optional[int] = 20) -> List[Tuple[str, int]]:
+        """Most common skills among the selected candidates, as (skill, candidate count)"""
+        skill_ids = self.columns['skill_ids']
+        if mask is not None:
+            skill_ids = skill_ids[mask[self.columns['skill_rows']]]
+        counts = np.bincount(skill_ids, minlength=len(self.meta['skills']))
+        
+        order = np.argsort(-counts, kind='stable')
+        if top:
+            order = order[:top]
+        return [(self.meta['skills'][idx], int(counts[idx])) for idx in order if counts[idx] > 0]
+    
+    def experience_histogram(
+        self,
+        mask: Optional[np.ndarray] = None,
+        bins: Sequence[float] = DEFAULT_EXPERIENCE_BINS
+    ) -> List[Dict[str, Any]]:
+        """Candidates per years-of-experience bucket; the last bucket is open-ended"""
+        years = self.columns['years_experience'] if mask is None else self.columns['years_experience'][mask]
+        edges = np.asarray(list(bins) + [np.inf], dtype=np.float64)
+        counts, _ = np.histogram(years, bins=edges)
+        return [
+            {'min_years': float(low), 'max_years': None if np.isinf(high) else float(high), 'count': int(count)}
+            for low, high, count in zip(edges[:-1], edges[1:], counts)
+        ]
+    
+    def candidate_keys(self, mask: np.ndarray) -> List[Tuple[str, str]]:
+        """(job id, folder name) of the selected candidates"""
+        jobs = self.meta['jobs']
+        job_codes = self.columns['job']
+        return [(jobs[job_codes[row]], self.meta['folder_names'][row]) for row in np.flatnonzero(mask)]
+    
+    def summary(self, **filters) -> Dict[str, Any]:
+        """JSON-ready overview of the selected candidates: count, top skills, experience and status spread"""
+        mask = self.select(**filters)
+        status_counts = np.bincount(self.columns['status'][mask], minlength=len(self.meta['statuses']))
+        selected_years = self.columns['years_experience'][mask]
+        return {
+            'count': int(mask.sum()),
+            'average_years_experience': round(float(selected_years.mean()), 2) if mask.any() else 0.0,
+            'top_skills': [{'skill': skill, 'count': count} for skill, count in self.skill_counts(mask)],
+            'experience_histogram': self.experience_histogram(mask),
+            'by_status': {
+                status: int(count) for status, count in zip(self.meta['statuses'], status_counts) if count
+            }
+        }
+    
+    def _code(self, vocabulary: str, value: str) -> int:
+        """Code of a vocabulary value, or -1 (matches nothing) if it never occurs"""
+        return self._codes[vocabulary].get(value, -1)
+    
+    def _has_skill(self, skill: str) -> np.ndarray:
+        mask = np.zeros(self.rows, dtype=bool)
+        code = self._code('skills', skill)
+        if code >= 0:
+            mask[self.columns['skill_rows'][self.columns['skill_ids'] == code]] = True
+        return mask
+
+def build_snapshot(candidates: List[Tuple[str, Dict[str, Any]]], path: str, source_signature: str = ''):
+    """
+    Write a snapshot build of (job id, candidate) pairs into a new folder
+    
+    Args:
+        candidates: Every candidate with the job it applied to (candidate dicts include folderName)
+        path: Folder to create for this build
+        source_signature: CandidateIndex.content_signature() of the candidates
+    """
+    vocabularies = {'jobs': {}, 'statuses': {}, 'target_roles': {}, 'skills': {}}
+    
+    def code(vocabulary: str, value: str) -> int:
+        return vocabularies[vocabulary].setdefault(value, len(vocabularies[vocabulary]))
+    
+    rows = len(candidates)
+    job = np.empty(rows, dtype=np.int32)
+    status = np.empty(rows, dtype=np.int16)
+    target_role = np.empty(rows, dtype=np.int32)
+    years_experience = np.empty(rows, dtype=np.float32)
+    application_day = np.empty(rows, dtype=np.int32)
+    skill_rows, skill_ids, folder_names = [], [], []
+    
+    for row, (job_id, candidate) in enumerate(candidates):
+        job[row] = code('jobs', job_id)
+        status[row] = code('statuses', str(candidate.get('status') or 'unknown').strip().lower())
+        target_role[row] = code('target_roles', str(candidate.get('targetRole') or 'Not specified'))
+        years_experience[row] = _as_float(candidate.get('yearsOfExperience'))
+        application_day[row] = _as_day(candidate.get('applicationDate'))
+        folder_names.append(candidate.get('folderName', ''))
+        
+        candidate_skills = {normalize_skill(skill) for skill in extract_candidate_skills(candidate) if skill.strip()}
+        for skill in sorted(candidate_skills):
+            skill_rows.append(row)
+            skill_ids.append(code('skills', skill))
+    
+    os.makedirs(path)
+    arrays = {
+        'job': job,
+        'status': status,
+        'target_role': target_role,
+        'years_experience': years_experience,
+        'application_day': application_day,
+        'skill_rows': np.asarray(skill_rows, dtype=np.int32),
+        'skill_ids': np.asarray(skill_ids, dtype=np.int32)
+    }
+    for name in COLUMNS:
+        np.save(os.path.join(path, f"{name}.npy"), arrays[name])
+    
+    with open(os.path.join(path, "meta.json"), 'w', encoding='utf-8') as f:
+        json.dump({
+            'rows': rows,
+            'built_at': time.time(),
+            'source_signature': source_signature,
+            'folder_names': folder_names,
+            **{name: list(values) for name, values in vocabularies.items()}
+        }, f, ensure_ascii=False)
+
+class CandidateSnapshotStore:
+    """Keeps the current snapshot under data/.snapshot and rebuilds it when it goes stale
+    
+    A build is written to its own folder and published by atomically
+    replacing the CURRENT pointer file, so readers always see a complete
+    build. At most once per rebuild_interval_seconds (and on the first call in
+    a process) the candidate files are checked for edits and the index's
+    content signature is compared with the one the build was made from; a
+    new build is made when they differ (or on demand). The signature is
+    derived from candidate file times, so a build left by an earlier process
+    is only reused if it still matches the files on disk.
+    """
+    
+    def __init__(self, snapshot_dir: str, rebuild_interval_seconds: float = 300):
+        self.snapshot_dir = snapshot_dir
+        self.rebuild_interval_seconds = rebuild_interval_seconds
+        self._lock = threading.Lock()
+        self._snapshot = None
+        self._last_check = None
+    
+    def current(self, index, force_rebuild: bool = False) -> CandidateSnapshot:
+        """
+        The current snapshot, rebuilt first if stale
+        
+        Args:
+            index: CandidateIndex the snapshot is built from
+            force_rebuild: Rebuild even if the snapshot is up to date
+        
+        Returns:
+            A loaded snapshot
+        """
+        with self._lock:
+            if self._snapshot is None:
+                self._snapshot = self._load_current()
+            
+            now = time.time()
+            recently_checked = self._last_check is not None and now - self._last_check < self.rebuild_interval_seconds
+            if self._snapshot is not None and not force_rebuild and recently_checked:
+                return self._snapshot
+            self._last_check = now
+            
+            if not force_rebuild and self._snapshot is not None:
+                index.revalidate(force=True)
+                index.refresh_candidates()
+                if index.content_signature() == self._snapshot.meta.get('source_signature'):
+                    return self._snapshot
+            
+            self._snapshot = self._rebuild(index)
+            return self._snapshot
+    
+    def _load_current(self) -> Optional[CandidateSnapshot]:
+        try:
+            with open(os.path.join(self.snapshot_dir, CURRENT_FILE), 'r', encoding='utf-8') as f:
+                return CandidateSnapshot(os.path.join(self.snapshot_dir, f.read().strip()))
+        except (OSError, ValueError, KeyError):
+            return None
+    
+    def _rebuild(self, index) -> CandidateSnapshot:
+        """Write a new build, point CURRENT at it and drop older builds (lock held)"""
+        signature, candidates = index.snapshot_candidates()
+        build_id = f"{int(time.time())}-{uuid.uuid4().hex[:8]}"
+        build_snapshot(candidates, os.path.join(self.snapshot_dir, build_id), source_signature=signature)
+        
+        # Unique per writer: several worker processes may publish a build at once
+        pointer_path = os.path.join(self.snapshot_dir, CURRENT_FILE)
+        tmp_path = f"{pointer_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            f.write(build_id)
+        os.replace(tmp_path, pointer_path)
+        
+        # Open readers keep their memory maps; the files go away once they are released.
+        # Recent folders may be builds another worker process is still writing
+        for name in os.listdir(self.snapshot_dir):
+            path = os.path.join(self.snapshot_dir, name)
+            try:
+                if name != build_id and os.path.isdir(path) and time.time() - os.path.getmtime(path) > STALE_BUILD_SECONDS:
+                    shutil.rmtree(path, ignore_errors=True)
+            except OSError:
+                continue
+        
+        print(f"✅ Candidate snapshot built: {len(candidates)} candidates")
+        return CandidateSnapshot(os.path.join(self.snapshot_dir, build_id))
+
+def _as_float(value: Any) -> float:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return 0.0
+
+def _as_day(value: Any) -> int:
+    """Days since 1970-01-01 of an ISO date (time part ignored), -1 if missing or invalid"""
+    try:
+        return (date.fromisoformat(str(value)[:10]) - date(1970, 1, 1)).days
+    except ValueError:
+        return -1
@@ -2,11 +2,17 @@
 from .helpers import (
     extract_json_from_response,
     format_candidate_info,
+    extract_candidate_skills,
     calculate_overall_score
 )
+from .prefilter import normalize_skill, score_candidate_locally, prefilter_candidates
 
 __all__ = [
     'extract_json_from_response',
     'format_candidate_info',
-    'calculate_overall_score'
+    'extract_candidate_skills',
+    'calculate_overall_score',
+    'normalize_skill',
+    'score_candidate_locally',
+    'prefilter_candidates'
 ]
@@ -2,7 +2,12 @@
 import json
 import re
 from typing import Dict, Any, List
+from ..metrics.tracing import traced
 
+# Longest excerpt of the extracted resume text included in a screening prompt
+RESUME_TEXT_PROMPT_CHARS = 4000
+
+@traced('extract_json_from_response', category='parse')
 def extract_json_from_response(response: str) -> Dict[str, Any]:
     """Extract JSON from LLM response that might have markdown formatting"""
     try:
@@ -21,6 +26,25 @@ def extract_json_from_response(response: str) -> Dict[str, Any]:
         
         raise ValueError("No valid JSON found in response")
 
+def extract_candidate_skills(candidate: Dict[str, Any]) -> List[str]:
+    """Recursively extract all skill arrays from the nested skills structure"""
+    all_skills = []
+    
+    def extract_skills_recursive(obj):
+        """Recursively extract all skills from nested objects"""
+        if isinstance(obj, list):
+            # If it's a list of strings, add them as skills
+            for item in obj:
+                if isinstance(item, str):
+                    all_skills.append(item)
+        elif isinstance(obj, dict):
+            # Recursively process nested dictionaries
+            for value in obj.values():
+                extract_skills_recursive(value)
+    
+    extract_skills_recursive(candidate.get('skills', {}))
+    return all_skills
+
 def format_candidate_info(candidate: Dict[str, Any]) -> str:
     """Format candidate information for prompts"""
     personal_info = candidate.get('personalInfo', {})
@@ -39,29 +63,18 @@ def format_candidate_info(candidate: Dict[str, Any]) -> str:
         experience_list.append(exp_str)
     experience_str = "; ".join(experience_list) if experience_list else "Not specified"
     
-    # Format skills - recursively extract all skill arrays from nested structure
-    skills = candidate.get('skills', {})
-    all_skills = []
-    
-    def extract_skills_recursive(obj):
-        """Recursively extract all skills from nested objects"""
-        if isinstance(obj, list):
-            # If it's a list of strings, add them as skills
-            for item in obj:
-                if isinstance(item, str):
-                    all_skills.append(item)
-        elif isinstance(obj, dict):
-            # Recursively process nested dictionaries
-            for value in obj.values():
-                extract_skills_recursive(value)
-    
-    extract_skills_recursive(skills)
+    # Format skills
+    all_skills = extract_candidate_skills(candidate)
     skills_str = ", ".join(all_skills) if all_skills else "Not specified"
     
     # Format certifications
     certifications = candidate.get('certifications', [])
     cert_str = ", ".join(certifications) if certifications else "None"
     
+    # Resume text extracted from resume.pdf at ingestion, if any
+    resume_text = (candidate.get('resumeText') or '').strip()
+    resume_str = resume_text[:RESUME_TEXT_PROMPT_CHARS] if resume_text else "Not provided"
+    
     return {
         'name': f"{personal_info.get('firstName', '')} {personal_info.get('lastName', '')}",
         'target_role': candidate.get('targetRole', 'Not specified'),
@@ -69,7 +82,8 @@ def format_candidate_info(candidate: Dict[str, Any]) -> str:
         'education': education_str,
         'skills': skills_str,
         'experience': experience_str,
-        'certifications': cert_str
+        'certifications': cert_str,
+        'resume_text': resume_str
     }
 
 def calculate_overall_score(skills_match: Dict, experience_match: Dict, education_match: Dict) -> int:
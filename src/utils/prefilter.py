@@ -0,0 +1,208 @@
+# Local Pre-Filter - Cheap Deterministic Scoring Before LLM Screening
+import re
+from typing import Dict, Any, List, Optional, Tuple
+from .helpers import extract_candidate_skills, calculate_overall_score
+
+# Common aliases mapped to one canonical spelling (all lowercase)
+SKILL_SYNONYMS = {
+    'js': 'javascript',
+    'ecmascript': 'javascript',
+    'ts': 'typescript',
+    'py': 'python',
+    'golang': 'go',
+    'c sharp': 'c#',
+    'csharp': 'c#',
+    'cpp': 'c++',
+    'node': 'node.js',
+    'nodejs': 'node.js',
+    'react.js': 'react',
+    'reactjs': 'react',
+    'vue.js': 'vue',
+    'vuejs': 'vue',
+    'angularjs': 'angular',
+    'postgres': 'postgresql',
+    'mongo': 'mongodb',
+    'k8s': 'kubernetes',
+    'amazon web services': 'aws',
+    'gcp': 'google cloud',
+    'google cloud platform': 'google cloud',
+    'microsoft azure': 'azure',
+    'ci/cd': 'ci cd',
+    'cicd': 'ci cd',
+    'ml': 'machine learning',
+    'ai': 'artificial intelligence',
+    'nlp': 'natural language processing',
+    'sklearn': 'scikit-learn',
+    'rest api': 'rest',
+    'restful': 'rest',
+    'restful api': 'rest',
+    'restful apis': 'rest',
+    'rest apis': 'rest'
+}
+
+# Education levels in increasing order, matched against degree names
+EDUCATION_LEVELS = [
+    (1, ('high school', 'diploma', 'ged')),
+    (2, ('associate',)),
+    (3, ('bachelor', 'b.s', 'b.sc', 'bsc', 'b.e', 'b.tech', 'undergraduate')),
+    (4, ('master', 'm.s', 'm.sc', 'msc', 'mba', 'm.tech')),
+    (5, ('phd', 'ph.d', 'doctor', 'doctorate'))
+]
+
+def normalize_skill(skill: str) -> str:
+    """Lowercase, trim and map a skill to its canonical synonym"""
+    normalized = re.sub(r'\s+', ' ', skill.strip().lower()).strip('.,;:')
+    return SKILL_SYNONYMS.get(normalized, normalized)
+
+# A skill token is never part of a longer word, symbol name or dotted name (react.js, .net);
+# a trailing period followed by a space or the end still closes a token
+_TOKEN_START = r'(?<![\w+#.])'
+_TOKEN_END = r'(?![\w+#]|\.\w)'
+# Every alias at once, longest first, so each token is rewritten at most once
+_ALIAS_PATTERN = re.compile(
+    _TOKEN_START + '(' + '|'.join(re.escape(alias) for alias in sorted(SKILL_SYNONYMS, key=len, reverse=True)) + ')' + _TOKEN_END
+)
+
+def _skill_in_text(skill: str, text: str) -> bool:
+    """Whole-token containment that tolerates symbols such as c++ or node.js"""
+    return re.search(rf'{_TOKEN_START}{re.escape(skill)}{_TOKEN_END}', text) is not None
+
+def _canonical_text(text: str) -> str:
+    """Normalize free text and replace every known alias token with its canonical form in one pass"""
+    text = re.sub(r'\s+', ' ', text.lower())
+    return _ALIAS_PATTERN.sub(lambda match: SKILL_SYNONYMS[match.group(1)], text)
+
+def _education_level(text: str) -> int:
+    """Highest education level mentioned in text (0 when none is recognized)"""
+    text = text.lower()
+    level = 0
+    for rank, keywords in EDUCATION_LEVELS:
+        if any(keyword in text for keyword in keywords):
+            level = rank
+    return level
+
+def _required_education_level(education_required: List[str]) -> int:
+    """Lowest education level that satisfies any listed requirement"""
+    levels = [_education_level(item) for item in education_required if isinstance(item, str)]
+    levels = [level for level in levels if level > 0]
+    return min(levels) if levels else 0
+
+def _required_years(experience_required: Any) -> Optional[float]:
+    """First number in experience_required (e.g. '3+ years' -> 3), or None"""
+    match = re.search(r'\d+(?:\.\d+)?', str(experience_required or ''))
+    return float(match.group(0)) if match else None
+
+def score_candidate_locally(candidate: Dict[str, Any], job_requirements: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Score a candidate from generalInformation.json without calling the LLM
+    
+    Args:
+        candidate: Candidate data from generalInformation.json
+        job_requirements: Extracted job requirements from intake agent
+        
+    Returns:
+        Dictionary with skills/experience/education sub-scores and overall local_score
+    """
+    # Skills: share of required skills covered by any candidate skill
+    candidate_skills = {normalize_skill(skill) for skill in extract_candidate_skills(candidate) if skill.strip()}
+    required_skills = [s for s in job_requirements.get('required_skills', []) if isinstance(s, str) and s.strip()]
+    
+    matched_skills = []
+    for required in required_skills:
+        required_norm = normalize_skill(required)
+        required_text = _canonical_text(required)
+        if required_norm in candidate_skills or any(
+            _skill_in_text(skill, required_text) or _skill_in_text(required_norm, skill)
+            for skill in candidate_skills
+        ):
+            matched_skills.append(required)
+    
+    match_percentage = round(len(matched_skills) / len(required_skills) * 100) if required_skills else 100
+    
+    # Experience: candidate years relative to the stated minimum
+    try:
+        years = float(candidate.get('yearsOfExperience', 0) or 0)
+    except (TypeError, ValueError):
+        years = 0.0
+    required_years = _required_years(job_requirements.get('experience_required'))
+    if not required_years:
+        relevance_score = 100
+    else:
+        relevance_score = round(min(1.0, years / required_years) * 100)
+    years_gap = max(0.0, required_years - years) if required_years else 0.0
+    
+    # Education: highest candidate degree against the lowest accepted level
+    required_level = _required_education_level(job_requirements.get('education_required', []))
+    candidate_level = max(
+        [_education_level(f"{edu.get('degree', '')}") for edu in candidate.get('education', []) if isinstance(edu, dict)],
+        default=0
+    )
+    if not required_level or candidate_level >= required_level:
+        education_score = 100
+    elif candidate_level == required_level - 1:
+        education_score = 50
+    else:
+        education_score = 0
+    
+    skills_match = {'matched_skills': matched_skills, 'match_percentage': match_percentage}
+    experience_match = {'years_gap': years_gap, 'relevance_score': relevance_score}
+    education_match = {'meets_requirements': education_score == 100, 'education_score': education_score}
+    
+    return {
+        'skills_match': skills_match,
+        'experience_match': experience_match,
+        'education_match': education_match,
+        'local_score': calculate_overall_score(skills_match, experience_match, education_match)
+    }
+
+def prefilter_candidates(
+    candidates: List[Dict[str, Any]], 
+    job_requirements: Dict[str, Any],
+    top_k: Optional[int] = None,
+    min_score: Optional[int] = None
+) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+    """
+    Select which candidates are worth an LLM screening
+    
+    Args:
+        candidates: List of candidate data
+        job_requirements: Extracted job requirements from intake agent
+        top_k: Keep at most this many candidates by local score (None/0 = no cap)
+        min_score: Drop candidates whose local score is below this (None/0 = no threshold)
+        
+    Returns:
+        Tuple of (selected candidates in original order, summaries of filtered-out candidates)
+    """
+    scored = []
+    for idx, candidate in enumerate(candidates):
+        try:
+            local_score = score_candidate_locally(candidate, job_requirements)['local_score']
+        except Exception as e:
+            # Let the LLM screener report malformed candidates as usual
+            print(f"⚠️  Local scoring failed for candidate #{idx}: {str(e)}")
+            local_score = None
+        scored.append((idx, local_score))
+    
+    ranked = sorted(
+        (item for item in scored if item[1] is not None),
+        key=lambda item: item[1],
+        reverse=True
+    )
+    if min_score:
+        ranked = [item for item in ranked if item[1] >= min_score]
+    if top_k:
+        ranked = ranked[:top_k]
+    keep = {idx for idx, _ in ranked} | {idx for idx, local_score in scored if local_score is None}
+    
+    selected = [candidate for idx, candidate in enumerate(candidates) if idx in keep]
+    rejected = []
+    for idx, local_score in scored:
+        if idx in keep:
+            continue
+        personal_info = candidates[idx].get('personalInfo', {})
+        rejected.append({
+            'candidate_name': f"{personal_info.get('firstName', '')} {personal_info.get('lastName', '')}".strip(),
+            'local_score': local_score
+        })
+    
+    return selected, rejected
@@ -2,7 +2,13 @@
 let allCandidates = [];
 let allJobs = [];
 let selectedJobId = null;
-let selectedCandidatesForEmail = new Set();
+let selectedCandidatesForEmail = new Map();
+let displayedShortlist = {};
+let nextCandidatesCursor = null;
+
+// Candidates are fetched page by page with only the fields the cards render
+const CANDIDATE_PAGE_SIZE = 60;
+const CANDIDATE_CARD_FIELDS = 'personalInfo,skills,certifications,experience.title,workExperience.jobTitle,workExperience.title';
 
 // Load jobs and setup on page load
 document.addEventListener('DOMContentLoaded', () => {
@@ -92,18 +98,20 @@ async function loadCandidates(jobId) {
     const shortlistBtn = document.getElementById('shortlistBtn');
     
     try {
-        const response = await fetch(`/api/candidates/${jobId}`);
-        const data = await response.json();
+        const data = await fetchCandidatePage(jobId, null);
         
         allCandidates = data.candidates || [];
+        nextCandidatesCursor = data.next_cursor || null;
         
-        countBadge.textContent = `${allCandidates.length} Candidate${allCandidates.length !== 1 ? 's' : ''}`;
+        const total = data.total ?? allCandidates.length;
+        countBadge.textContent = `${total} Candidate${total !== 1 ? 's' : ''}`;
         
         container.innerHTML = '';
         
         if (allCandidates.length === 0) {
             container.innerHTML = '<div class="col-span-full text-center py-8 text-gray-500">No candidates found for this position.</div>';
             shortlistBtn.disabled = true;
+            updateLoadMoreButton(jobId);
             return;
         }
         
@@ -113,12 +121,63 @@ async function loadCandidates(jobId) {
             const card = createCandidateCard(candidate, index);
             container.appendChild(card);
         });
+        updateLoadMoreButton(jobId);
     } catch (error) {
         console.error('Error loading candidates:', error);
         container.innerHTML = '<div class="col-span-full text-center py-8 text-red-500">Error loading candidates.</div>';
     }
 }
 
+async function fetchCandidatePage(jobId, cursor) {
+    const params = new URLSearchParams({ limit: CANDIDATE_PAGE_SIZE, fields: CANDIDATE_CARD_FIELDS });
+    if (cursor) {
+        params.set('cursor', cursor);
+    }
+    
+    const response = await fetch(`/api/candidates/${jobId}?${params.toString()}`);
+    return response.json();
+}
+
+async function loadMoreCandidates(jobId) {
+    const container = document.getElementById('candidatesContainer');
+    
+    try {
+        const data = await fetchCandidatePage(jobId, nextCandidatesCursor);
+        const page = data.candidates || [];
+        
+        page.forEach((candidate, index) => {
+            container.appendChild(createCandidateCard(candidate, index));
+        });
+        allCandidates.push(...page);
+        nextCandidatesCursor = data.next_cursor || null;
+    } catch (error) {
+        console.error('Error loading more candidates:', error);
+    }
+    
+    updateLoadMoreButton(jobId);
+}
+
+function updateLoadMoreButton(jobId) {
+    const container = document.getElementById('candidatesContainer');
+    let loadMoreBtn = document.getElementById('loadMoreCandidatesBtn');
+    
+    if (!nextCandidatesCursor) {
+        if (loadMoreBtn) {
+            loadMoreBtn.remove();
+        }
+        return;
+    }
+    
+    if (!loadMoreBtn) {
+        loadMoreBtn = document.createElement('button');
+        loadMoreBtn.id = 'loadMoreCandidatesBtn';
+        loadMoreBtn.className = 'mt-4 mx-auto block px-6 py-2 text-sm font-medium rounded-lg border-2 border-gray-200 bg-white hover:border-yellow-500';
+        loadMoreBtn.textContent = 'Load more candidates';
+        container.insertAdjacentElement('afterend', loadMoreBtn);
+    }
+    loadMoreBtn.onclick = () => loadMoreCandidates(jobId);
+}
+
 function createCandidateCard(candidate, index) {
     const card = document.createElement('div');
     card.className = 'candidate-card bg-white rounded-xl shadow-sm border-2 border-gray-200 p-5 animate-fade-in';
@@ -253,7 +312,7 @@ async function handleShortlist() {
         console.log('Job ID:', selectedJobId);
         console.log('Job Description length:', jobDescription.length);
         
-        const response = await fetch('/api/shortlist', {
+        const response = await fetch('/api/shortlist/stream', {
             method: 'POST',
             headers: {
                 'Content-Type': 'application/json',
@@ -266,14 +325,16 @@ async function handleShortlist() {
         
         console.log('Response status:', response.status);
         
-        const data = await response.json();
+        const data = await readShortlistStream(response, (event, payload) => {
+            handleShortlistProgress(event, payload, shortlistBtn, resultsSection);
+        });
         console.log('Response data:', data);
         
-        if (response.ok && data.success) {
+        if (data && data.success) {
             displayShortlistedCandidates(data.shortlisted_candidates);
             resultsSection.classList.remove('hidden');
         } else {
-            alert(`Error: ${data.error || 'Unknown error occurred'}`);
+            alert(`Error: ${(data && data.error) || 'Unknown error occurred'}`);
         }
     } catch (error) {
         console.error('Error during shortlisting:', error);
@@ -284,6 +345,75 @@ async function handleShortlist() {
     }
 }
 
+// Read Server-Sent Events from a streaming fetch response; resolves with the final "result" payload
+async function readShortlistStream(response, onEvent) {
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+    let result = null;
+    
+    while (true) {
+        const { value, done } = await reader.read();
+        if (done) break;
+        
+        buffer += decoder.decode(value, { stream: true });
+        const messages = buffer.split('\n\n');
+        buffer = messages.pop();
+        
+        for (const message of messages) {
+            let event = 'message';
+            let data = '';
+            message.split('\n').forEach(line => {
+                if (line.startsWith('event:')) event = line.slice(6).trim();
+                else if (line.startsWith('data:')) data += line.slice(5).trim();
+            });
+            if (!data) continue;
+            
+            const payload = JSON.parse(data);
+            if (event === 'result') {
+                result = payload;
+            } else {
+                onEvent(event, payload);
+            }
+        }
+    }
+    
+    return result;
+}
+
+// Provisional results shown while screening is still running
+let provisionalShortlist = [];
+
+function handleShortlistProgress(event, payload, shortlistBtn, resultsSection) {
+    if (event === 'stage') {
+        if (payload.stage === 'intake' && payload.status === 'started') {
+            provisionalShortlist = [];
+            shortlistBtn.textContent = 'Analyzing job...';
+        } else if (payload.stage === 'screening' && payload.status === 'started') {
+            shortlistBtn.textContent = `Screening 0/${payload.total}...`;
+        } else if (payload.stage === 'evaluation') {
+            shortlistBtn.textContent = 'Ranking...';
+        }
+        return;
+    }
+    
+    if (event === 'candidate') {
+        shortlistBtn.textContent = `Screening ${payload.completed}/${payload.total}...`;
+        
+        if (!payload.error && payload.match_score >= 70) {
+            provisionalShortlist.push({
+                candidate_name: payload.candidate_name,
+                match_score: payload.match_score,
+                email: payload.email,
+                phone: payload.phone
+            });
+            provisionalShortlist.sort((a, b) => b.match_score - a.match_score);
+            displayShortlistedCandidates(provisionalShortlist);
+            resultsSection.classList.remove('hidden');
+        }
+    }
+}
+
 function displayShortlistedCandidates(candidates) {
     const container = document.getElementById('shortlistedCandidates');
     
@@ -297,6 +427,23 @@ function displayShortlistedCandidates(candidates) {
     selectedCandidatesForEmail.clear();
     updateEmailButtonVisibility();
     
+    // Merge fields available to email templates, keyed by candidate id
+    const role = extractJobTitle(document.getElementById('jobDescription').value);
+    displayedShortlist = {};
+    candidates.forEach(candidate => {
+        const fullName = candidate.candidate_name || 'Unknown';
+        const email = candidate.email || 'N/A';
+        displayedShortlist[`${fullName}_${email}`.replace(/\s+/g, '_')] = {
+            name: fullName,
+            email,
+            role,
+            rank: candidate.rank,
+            match_score: candidate.match_score,
+            interview_focus_areas: candidate.interview_focus_areas || [],
+            key_strengths: candidate.key_strengths || []
+        };
+    });
+    
     container.innerHTML = candidates.map((candidate, index) => {
         // Use candidate_name directly from the response
         const fullName = candidate.candidate_name || 'Unknown';
@@ -312,7 +459,7 @@ function displayShortlistedCandidates(candidates) {
                             type="checkbox" 
                             id="candidate_${candidateId}"
                             class="w-5 h-5 text-yellow-600 bg-gray-100 border-gray-300 rounded focus:ring-yellow-500 cursor-pointer"
-                            onchange="toggleCandidateSelection('${candidateId}', '${fullName.replace(/'/g, "\\'").replace(/"/g, '&quot;')}', '${email}')"
+                            onchange="toggleCandidateSelection('${candidateId}')"
                         />
                         <div class="w-10 h-10 rounded-full bg-green-600 flex items-center justify-center text-white font-semibold">
                             ${index + 1}
@@ -358,13 +505,13 @@ function displayShortlistedCandidates(candidates) {
     }).join('');
 }
 
-function toggleCandidateSelection(candidateId, name, email) {
+function toggleCandidateSelection(candidateId) {
     const checkbox = document.getElementById(`candidate_${candidateId}`);
     
     if (checkbox.checked) {
-        selectedCandidatesForEmail.add(JSON.stringify({ id: candidateId, name, email }));
+        selectedCandidatesForEmail.set(candidateId, { id: candidateId, ...displayedShortlist[candidateId] });
     } else {
-        selectedCandidatesForEmail.delete(JSON.stringify({ id: candidateId, name, email }));
+        selectedCandidatesForEmail.delete(candidateId);
     }
     
     updateEmailButtonVisibility();
@@ -385,8 +532,8 @@ function updateEmailButtonVisibility() {
 function goToSendEmail() {
     if (selectedCandidatesForEmail.size === 0) return;
     
-    // Convert Set to Array
-    const candidates = Array.from(selectedCandidatesForEmail).map(c => JSON.parse(c));
+    // Convert Map to Array
+    const candidates = Array.from(selectedCandidatesForEmail.values());
     
     // Store in sessionStorage
     sessionStorage.setItem('selectedCandidates', JSON.stringify(candidates));
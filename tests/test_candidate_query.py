@@ -0,0 +1,33 @@
+from src.storage import project_candidate
+
+CANDIDATE = {
+    'folderName': 'Sarah_Chen',
+    'personalInfo': {'firstName': 'Sarah', 'email': 'sarah@example.com'},
+    'skills': {'cloud': ['AWS', 'GCP'], 'languages': ['English', 'Mandarin', 'French']},
+    'experience': [
+        {'title': 'Engineer', 'company': 'Acme'},
+        {'title': 'Intern'}
+    ]
+}
+
+def test_list_leaf_inside_a_dict_is_kept_whole():
+    projected = project_candidate(CANDIDATE, ['skills.cloud'])
+    
+    assert projected == {'folderName': 'Sarah_Chen', 'skills': {'cloud': ['AWS', 'GCP']}}
+
+def test_sibling_list_leaves_are_not_zipped():
+    projected = project_candidate(CANDIDATE, ['skills.cloud', 'skills.languages'])
+    
+    assert projected['skills'] == {'cloud': ['AWS', 'GCP'], 'languages': ['English', 'Mandarin', 'French']}
+
+def test_list_of_objects_is_projected_element_by_element():
+    projected = project_candidate(CANDIDATE, ['experience.title', 'experience.company', 'personalInfo.email'])
+    
+    assert projected['experience'] == [{'title': 'Engineer', 'company': 'Acme'}, {'title': 'Intern'}]
+    assert projected['personalInfo'] == {'email': 'sarah@example.com'}
+
+def test_projection_does_not_modify_the_candidate():
+    project_candidate(CANDIDATE, ['experience', 'experience.title', 'skills', 'skills.cloud'])
+    
+    assert CANDIDATE['experience'][1] == {'title': 'Intern'}
+    assert CANDIDATE['skills']['cloud'] == ['AWS', 'GCP']
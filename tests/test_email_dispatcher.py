@@ -0,0 +1,76 @@
+import asyncio
+import socketserver
+import threading
+from src.mailer import SMTPConnectionPool, EmailDispatcher, build_message
+
+class _SMTPHandler(socketserver.StreamRequestHandler):
+    """Minimal plain-text SMTP server: accepts every recipient except @rejected.example"""
+    
+    def reply(self, line):
+        self.wfile.write(f"{line}\r\n".encode('ascii'))
+    
+    def handle(self):
+        self.reply("220 localhost test server")
+        for raw in self.rfile:
+            command = raw.decode('ascii').strip()
+            verb = command.split(' ', 1)[0].upper()
+            if verb == 'EHLO':
+                self.reply("250 localhost")
+            elif verb == 'RCPT' and 'rejected.example' in command:
+                self.reply("550 5.1.1 No such user")
+            elif verb == 'DATA':
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+                lines = []
+                for data_line in self.rfile:
+                    if data_line == b".\r\n":
+                        break
+                    lines.append(data_line)
+                self.server.delivered.append(b"".join(lines))
+                self.reply("250 OK")
+            elif verb == 'QUIT':
+                self.reply("221 Bye")
+                return
+            else:
+                self.reply("250 OK")
+
+def test_dispatcher_records_sent_and_permanently_failed_recipients(tmp_path):
+    server = socketserver.ThreadingTCPServer(('127.0.0.1', 0), _SMTPHandler)
+    server.daemon_threads = True
+    server.delivered = []
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    
+    pool = SMTPConnectionPool('127.0.0.1', server.server_address[1], None, None, pool_size=1, timeout=5, use_starttls=False)
+    dispatcher = EmailDispatcher(pool, str(tmp_path), max_attempts=3, backoff_seconds=0)
+    recipients = [
+        {'id': 'a', 'name': 'Ada', 'email': 'ada@example.com'},
+        {'id': 'b', 'name': 'Bob', 'email': 'bob@rejected.example'}
+    ]
+    
+    async def deliver():
+        batch = dispatcher.submit([
+            (recipient, build_message('hr@example.com', recipient['email'], 'Interview', 'Hello'))
+            for recipient in recipients
+        ])
+        for _ in range(500):
+            status = dispatcher.get(batch['batch_id'])
+            if status['status'] == 'completed':
+                return status
+            await asyncio.sleep(0.01)
+        raise AssertionError("batch did not complete")
+    
+    try:
+        status = asyncio.run(deliver())
+    finally:
+        pool.close()
+        server.shutdown()
+        server.server_close()
+    
+    sent, failed = status['recipients']
+    assert status['counts'] == {'pending': 0, 'sent': 1, 'failed': 1}
+    assert sent['status'] == 'sent'
+    assert failed['status'] == 'failed'
+    # A 550 is permanent: no retry
+    assert failed['attempts'] == 1
+    assert '550' in failed['error']
+    assert len(server.delivered) == 1
+    assert (tmp_path / '.email' / 'batches' / f"{status['batch_id']}.json").exists()
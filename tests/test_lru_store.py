@@ -0,0 +1,43 @@
+import os
+import time
+from src.cache import LRUFileStore, PromptCache, ScreeningCache
+
+def test_least_recently_used_entries_are_evicted_first(tmp_path):
+    store = LRUFileStore(str(tmp_path), max_bytes=100)
+    store.put('a', {'value': 'x' * 30})
+    store.put('b', {'value': 'y' * 30})
+    store.get('a')
+    
+    store.put('c', {'value': 'z' * 30})
+    
+    assert store.get('b') is None
+    assert store.get('a') == {'value': 'x' * 30}
+    assert sorted(os.listdir(tmp_path)) == ['a.json', 'c.json']
+
+def test_index_is_rebuilt_from_disk(tmp_path):
+    LRUFileStore(str(tmp_path), max_bytes=1000).put('a', {'value': 1})
+    (tmp_path / 'b.json.123.456.tmp').write_text('partial')
+    
+    store = LRUFileStore(str(tmp_path), max_bytes=1000)
+    
+    assert store.get('a') == {'value': 1}
+    assert store.stats()['entries'] == 1
+    assert not (tmp_path / 'b.json.123.456.tmp').exists()
+
+def test_screening_cache_invalidates_by_requirements(tmp_path):
+    cache = ScreeningCache(str(tmp_path))
+    cache.put({'name': 'Ada'}, 'Python', {'score': 80})
+    cache.put({'name': 'Bob'}, 'Go', {'score': 60})
+    
+    assert cache.get({'name': 'Ada'}, 'Python') == {'score': 80}
+    assert cache.invalidate(requirements_text='Python') == 1
+    assert cache.get({'name': 'Ada'}, 'Python') is None
+    assert cache.get({'name': 'Bob'}, 'Go') == {'score': 60}
+
+def test_expired_prompt_cache_entries_are_misses(tmp_path):
+    cache = PromptCache(str(tmp_path), ttl_seconds=0.01)
+    cache.put('model', 'prompt', 'response')
+    time.sleep(0.05)
+    
+    assert cache.get('model', 'prompt') is None
+    assert cache.stats()['entries'] == 0
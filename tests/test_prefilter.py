@@ -0,0 +1,49 @@
+from src.utils import normalize_skill, score_candidate_locally, prefilter_candidates
+
+def _candidate(*skills):
+    return {
+        'skills': {'programming': list(skills), 'frameworks': [], 'tools': [], 'cloud': [], 'databases': [], 'testing': []},
+        'yearsOfExperience': 5,
+        'education': []
+    }
+
+def _matched(candidate, *required_skills):
+    return score_candidate_locally(candidate, {'required_skills': list(required_skills)})['skills_match']['matched_skills']
+
+def test_skill_aliases_are_normalized():
+    assert normalize_skill(" React.js ") == "react"
+    assert normalize_skill("NodeJS") == "node.js"
+    assert normalize_skill("JS") == "javascript"
+    assert normalize_skill("Next.js") == "next.js"
+    # Ambiguous (TensorFlow or Terraform), so left as written
+    assert normalize_skill("TF") == "tf"
+
+def test_dotted_framework_names_in_requirement_text_are_not_read_as_javascript():
+    assert _matched(_candidate('JavaScript'), "React.js, Node.js and Vue.js") == []
+    assert _matched(_candidate('JavaScript'), "Next.js") == []
+    assert _matched(_candidate('JavaScript'), "JS and Node") == ["JS and Node"]
+    assert _matched(_candidate('Vue'), "React.js, Node.js and Vue.js") == ["React.js, Node.js and Vue.js"]
+
+def test_javascript_alone_does_not_match_js_frameworks():
+    requirements = {'required_skills': ['React.js', 'Node.js', 'Vue.js']}
+    
+    result = score_candidate_locally(_candidate('JavaScript'), requirements)
+    
+    assert result['skills_match']['matched_skills'] == []
+    assert result['skills_match']['match_percentage'] == 0
+
+def test_framework_aliases_still_match():
+    requirements = {'required_skills': ['React.js', 'Node.js', 'Vue.js', 'JS']}
+    
+    result = score_candidate_locally(_candidate('ReactJS', 'NodeJS', 'vue', 'JavaScript'), requirements)
+    
+    assert result['skills_match']['match_percentage'] == 100
+
+def test_prefilter_keeps_the_best_local_matches():
+    requirements = {'required_skills': ['React.js', 'Node.js']}
+    candidates = [_candidate('JavaScript'), _candidate('ReactJS', 'NodeJS')]
+    
+    selected, rejected = prefilter_candidates(candidates, requirements, top_k=1)
+    
+    assert selected == [candidates[1]]
+    assert len(rejected) == 1